@@ -1,19 +1,43 @@
 import streamlit as st
+import streamlit.components.v1 as components
+from streamlit import runtime
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.documents import Document
 from dotenv import load_dotenv
 import os
 import json
-import tempfile
 import random
 import time
-from gtts import gTTS
+from collections import OrderedDict
 import base64
+import hashlib
+import uuid
 from io import BytesIO
+from index_cache import compute_index_key, load_or_build_index
+from embedding_cache import CachedEmbeddings
+from response_cache import ResponseCache
+from llm_pool import LLMClientPool
+from hallucination_filter import HallucinationScanner
+from tutor_prompts import compile_tutor_prompts
+from chat_pipeline import ChatRequest, run_chat_pipeline
+from single_flight import SingleFlight, prompt_key
+from quiz_bank import load_quiz_bank
+from quiz_grading import grade_answer
+from spaced_repetition import QUALITY_SKIPPED, ReviewStore, answer_quality, select_questions
+from stt_engine import (
+    TARGET_SAMPLE_RATE, NoSpeechError, RecognitionServiceError, TranscriptionCache, get_stt_backend, prepare_audio
+)
+from transcript_scorer import TranscriptScorer, lexicon_words
+from lexicon_index import build_lexicon_index
+from vocabulary_categories import CategoryCache, get_categories, get_category_list
+from tts_engine import AudioCache, audio_mime_type, synthesize, synthesize_async
+from language_config import GIKUYU_DICTIONARY, GIKUYU_HALLUCINATION_BLACKLIST, SUPPORTED_LANGUAGES
+from knowledge_base import (
+    EMBEDDING_MODEL, CHUNK_SIZE, CHUNK_OVERLAP,
+    get_language_data_path, load_language_knowledge_from_json, get_fallback_knowledge, knowledge_to_text
+)
 
 # Load environment variables
 load_dotenv(override=True)  # Force reload
@@ -220,101 +244,16 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Gĩkũyũ Dictionary - Verified vocabulary to prevent hallucinations
-GIKUYU_DICTIONARY = {
-    "nouns": {
-        "mũndũ": "person (singular)",
-        "andũ": "people (plural)",
-        "mũtĩ": "tree",
-        "mĩtĩ": "trees",
-        "mwana": "child",
-        "ciana": "children",
-        "njũĩ": "river",
-        "nyũmba": "house",
-        "ng'ombe": "cow",
-        "mbũri": "goat",
-        "ũhoro": "news/information/matter"
-    },
-    "verbs": {
-        "gũthoma": "to read / to study",
-        "kũrĩa": "to eat",
-        "kũnyua": "to drink",
-        "gũthiĩ": "to go",
-        "kwaria": "to speak",
-        "kũina": "to sing / to dance",
-        "kũruga": "to cook",
-        "gũkenera": "to enjoy / be happy"
-    },
-    "greetings_phrases": {
-        "ũhoro waku": "how are you? (singular)",
-        "ũhoro wanyu": "how are you? (plural)",
-        "nĩ wega": "thank you / it is good",
-        "nuu": "who",
-        "kĩĩ": "what",
-        "atĩa": "how"
-    },
-    "numbers": {
-        "ĩmwe": "1",
-        "igĩrĩ": "2",
-        "ithatũ": "3",
-        "inya": "4",
-        "ithano": "5",
-        "mũgwanja": "7",
-        "nyanya": "8",
-        "kenda": "9",
-        "ikũmi": "10"
-    }
-}
-
-# Hallucination Blacklist - Swahili words that GPT-4 incorrectly uses for Gĩkũyũ
-GIKUYU_HALLUCINATION_BLACKLIST = {
-    "habari": {"correct": "ũhoro", "note": "AI often uses Swahili 'habari' instead of Gĩkũyũ 'ũhoro'"},
-    "mti": {"correct": "mũtĩ", "note": "Missing tilde (ũ) - this is Swahili, not Gĩkũyũ"},
-    "kula": {"correct": "kũrĩa", "note": "AI defaults to Swahili 'kula' instead of Gĩkũyũ 'kũrĩa'"},
-    "asante": {"correct": "nĩ wega", "note": "Common greeting hallucination - use Gĩkũyũ 'nĩ wega'"},
-    "watoto": {"correct": "ciana", "note": "Use Gĩkũyũ 'ciana' for plural 'children'"},
-    "nyumba": {"correct": "nyũmba", "note": "Missing tilde - ensure proper Gĩkũyũ spelling"},
-    "chakula": {"correct": "irĩo", "note": "Swahili word - use Gĩkũyũ 'irĩo' for food"},
-    "maji": {"correct": "maaĩ", "note": "Use Gĩkũyũ 'maaĩ' with proper diacritics"},
-    "kwenda": {"correct": "gũthiĩ", "note": "Swahili verb - use Gĩkũyũ 'gũthiĩ'"},
-    "kusoma": {"correct": "gũthoma", "note": "Swahili infinitive - use Gĩkũyũ 'gũthoma'"}
-}
-
-# Supported languages configuration
-SUPPORTED_LANGUAGES = {
-    "Kiswahili": {
-        "code": "sw",
-        "name": "Kiswahili",
-        "greeting": "Hujambo! Karibu kwenye mfumo wa kujifunza Kiswahili.",
-        "description": "Learn Swahili grammar, vocabulary, and sentence construction",
-        "tts_lang": "sw"  # Google TTS language code
-    },
-    "Kikuyu": {
-        "code": "ki",
-        "name": "Kikuyu",
-        "greeting": "Wĩ mwega! Ũkĩrĩte gũkũ kũruta Kikuyu.",
-        "description": "Learn Kikuyu grammar, vocabulary, and sentence construction",
-        "tts_lang": "sw"  # Use Swahili TTS as closest available for Kikuyu
-    },
-    "English": {
-        "code": "en",
-        "name": "English",
-        "greeting": "Welcome! Let's improve your English language skills.",
-        "description": "Master English grammar, vocabulary, and communication skills",
-        "tts_lang": "en"  # Native English TTS
-    }
-}
-
 # Voice/Audio helper functions
-def text_to_speech(text, lang_code="sw"):
-    """Convert text to speech and return audio"""
+@st.cache_resource
+def get_audio_cache():
+    """On-disk audio cache shared by all sessions"""
+    return AudioCache()
+
+def text_to_speech(text, lang_code="sw", backend=None):
+    """Convert text to speech and return audio (repeat playback is read from the audio cache)"""
     try:
-        # Create TTS object
-        tts = gTTS(text=text, lang=lang_code, slow=False)
-        
-        # Save to BytesIO object
-        audio_bytes = BytesIO()
-        tts.write_to_fp(audio_bytes)
+        audio_bytes = BytesIO(synthesize(text, lang_code, slow=False, cache=get_audio_cache(), backend=backend))
         audio_bytes.seek(0)
         
         return audio_bytes
@@ -322,21 +261,250 @@ def text_to_speech(text, lang_code="sw"):
         st.error(f"Error generating speech: {str(e)}")
         return None
 
-def autoplay_audio(audio_bytes):
-    """Auto-play audio in Streamlit"""
-    if audio_bytes:
-        audio_base64 = base64.b64encode(audio_bytes.read()).decode()
-        audio_html = f"""
-        <audio autoplay>
-            <source src="data:audio/mp3;base64,{audio_base64}" type="audio/mp3">
-        </audio>
-        """
-        st.markdown(audio_html, unsafe_allow_html=True)
+# Plays queued clips back to back; the player lives in the parent window so it
+# keeps going when Streamlit reruns and removes the component iframe
+AUDIO_QUEUE_JS = """
+<script>
+(function () {
+    var host = window.parent;
+    var player = host.__tutorAudioPlayer;
+    if (!player) {
+        player = host.__tutorAudioPlayer = {queue: [], current: null};
+        player.next = new host.Function("player",
+            "if (player.current || !player.queue.length) return;" +
+            "var audio = player.queue.shift();" +
+            "player.current = audio;" +
+            "var done = function () { if (player.current === audio) { player.current = null; player.next(player); } };" +
+            "audio.onended = done; audio.onerror = done;" +
+            "audio.play().catch(done);");
+    }
+    if (__RESET__) {
+        player.queue = [];
+        if (player.current) { player.current.pause(); player.current = null; }
+    }
+    // Start downloading now so later clips are ready when their turn comes
+    var clip = new host.Audio(__SRC__);
+    clip.preload = "auto";
+    player.queue.push(clip);
+    player.next(player);
+})();
+</script>
+"""
+
+# How long queued clips stay registered with the media file manager after they were queued
+AUDIO_KEEPALIVE_SECONDS = 300
+
+def media_url(audio_data, keepalive=False):
+    """
+    Serve audio through Streamlit's media file manager and return its URL
+    The browser fetches it once over HTTP instead of receiving base64 over the websocket
+    """
+    mimetype = audio_mime_type(audio_data)
+    if not runtime.exists():
+        return f"data:{mimetype};base64," + base64.b64encode(audio_data).decode()
+
+    coordinates = "tutor_audio." + hashlib.sha1(audio_data).hexdigest()
+    url = runtime.get_instance().media_file_mgr.add(audio_data, mimetype, coordinates)
+    if keepalive:
+        st.session_state.queued_audio[coordinates] = (audio_data, time.time() + AUDIO_KEEPALIVE_SECONDS)
+
+    base_path = st.get_option("server.baseUrlPath").strip("/")
+    return f"/{base_path}{url}" if base_path else url
+
+def refresh_queued_audio():
+    """
+    Re-register recently queued clips for this run
+    Streamlit drops media files a run does not reference, which would break clips still waiting in the browser queue
+    """
+    if not runtime.exists():
+        return
+    now = time.time()
+    media_file_mgr = runtime.get_instance().media_file_mgr
+    for coordinates, (audio_data, expires_at) in list(st.session_state.queued_audio.items()):
+        if expires_at < now:
+            del st.session_state.queued_audio[coordinates]
+        else:
+            media_file_mgr.add(audio_data, audio_mime_type(audio_data), coordinates)
+
+def queue_audio(audio_data, reset=False):
+    """Queue audio for in-order playback in the browser; reset drops anything still queued"""
+    src = media_url(audio_data, keepalive=True)
+    script = AUDIO_QUEUE_JS.replace("__RESET__", "true" if reset else "false").replace("__SRC__", json.dumps(src))
+    components.html(script, height=0)
 
 def create_audio_player(audio_bytes, key=None):
-    """Create an audio player widget"""
+    """Create an audio player widget (st.audio serves the bytes by URL, keyed by their content hash)"""
     if audio_bytes:
-        st.audio(audio_bytes, format='audio/mp3')
+        st.audio(audio_bytes, format=audio_mime_type(audio_bytes.getvalue()))
+
+# Recordings remembered per session (the process-wide memo holds more)
+SESSION_TRANSCRIPTION_MEMO = 8
+
+def correct_transcription(text, lang_info):
+    """Ask the LLM to fix recognition errors; returns (corrected_text, confidence, explanation)"""
+    llm = initialize_llm()
+    correction_prompt = f"""You are a {lang_info['name']} language expert. 
+
+A speech recognition system transcribed this audio, but it may have errors because it's not optimized for {lang_info['name']}.
+
+Raw transcription: "{text}"
+Language: {lang_info['name']}
+
+Your task:
+1. Identify likely transcription errors (wrong words, spelling mistakes)
+2. Correct them based on {lang_info['name']} language patterns
+3. Provide the corrected text
+
+Respond in this format:
+CORRECTED: [The corrected text in {lang_info['name']}]
+CONFIDENCE: [high/medium/low]
+EXPLANATION: [Brief explanation of corrections made, if any]
+
+If the transcription looks correct, just return it as is."""
+
+    response = get_single_flight().do(prompt_key(llm, correction_prompt), lambda: llm.invoke(correction_prompt))
+    correction_result = response.content
+    
+    # Parse AI response
+    corrected_text = text  # Default to original
+    confidence = "medium"
+    explanation = ""
+    
+    if "CORRECTED:" in correction_result:
+        corrected_text = correction_result.split("CORRECTED:")[1].split("CONFIDENCE:")[0].strip()
+    
+    if "CONFIDENCE:" in correction_result:
+        confidence = correction_result.split("CONFIDENCE:")[1].split("EXPLANATION:")[0].strip()
+    
+    if "EXPLANATION:" in correction_result:
+        explanation = correction_result.split("EXPLANATION:")[1].strip()
+    
+    return corrected_text, confidence, explanation
+
+def correct_recognized_text(result, lang_info):
+    """
+    AI-correct a recognized transcript in place; a failure is kept in correction_error
+    Also used to retry only the correction when a remembered recording's correction failed
+    """
+    with st.spinner("🤖 Using AI to improve transcription..."):
+        try:
+            corrected_text, confidence, explanation = correct_transcription(result["text"], lang_info)
+            result.update(corrected_text=corrected_text, confidence=confidence, explanation=explanation,
+                          correction_error=None)
+        except Exception as e:
+            result["correction_error"] = str(e)
+    return result
+
+def transcribe_recording(audio_bytes, backend, recognition_lang, lang_info):
+    """
+    Recognize and AI-correct one recording
+    Returns a result dict (text is None when no speech was recognized); service errors are raised
+    """
+    start_time = time.perf_counter()
+    
+    # Decode in memory, resample to 16 kHz mono and trim leading/trailing silence
+    pcm, stats = prepare_audio(audio_bytes)
+    stats["backend"] = backend.name
+    result = {
+        "text": None,
+        "corrected_text": None,
+        "confidence": None,
+        "explanation": "",
+        "correction_error": None,
+        "fast_path": False,
+        "stats": stats
+    }
+    
+    # Try to recognize speech with language-specific settings
+    if pcm:
+        recognition_start = time.perf_counter()
+        try:
+            with st.spinner("🎧 Transcribing..."):
+                result["text"] = backend.transcribe(pcm, TARGET_SAMPLE_RATE, recognition_lang)
+        except NoSpeechError:
+            pass
+        stats["recognize_ms"] = (time.perf_counter() - recognition_start) * 1000
+    
+    # Every word already in the verified vocabulary: no correction needed
+    if result["text"] and get_transcript_scorer(lang_info['name']).is_confident(result["text"]):
+        result.update(corrected_text=result["text"], confidence="high", fast_path=True)
+    
+    # Second step: Use AI to correct and improve transcription
+    elif result["text"]:
+        correct_recognized_text(result, lang_info)
+    
+    stats["total_ms"] = (time.perf_counter() - start_time) * 1000
+    return result
+
+def show_transcription_result(result):
+    """Display a transcription result and make its text available to the question box"""
+    text = result["text"]
+    if not text:
+        st.error("❌ Could not understand audio. Please try again with:")
+        st.markdown("""
+        - Speak more clearly and slowly
+        - Reduce background noise
+        - Speak closer to the microphone
+        - Try recording in a quieter environment
+        """)
+        return
+    
+    st.info(f"🔊 Raw transcription: **{text}**")
+    
+    if result["correction_error"]:
+        st.warning(f"AI correction failed: {result['correction_error']}")
+        st.info(f"Using raw transcription: **{text}**")
+        st.session_state.transcribed_text = text
+        return
+    
+    corrected_text = result["corrected_text"]
+    confidence = result["confidence"]
+    explanation = result["explanation"]
+    
+    # Display results
+    if result.get("fast_path"):
+        st.success(f"✅ **Verified Text:** {corrected_text}")
+        st.caption("⚡ Every word matched the verified vocabulary - AI correction skipped")
+    else:
+        st.success(f"✅ **AI-Corrected Text:** {corrected_text}")
+    
+    if explanation:
+        st.info(f"💡 **Corrections made:** {explanation}")
+    
+    # Confidence indicator
+    if confidence.lower() == "high":
+        st.success("🎯 High confidence in transcription")
+    elif confidence.lower() == "medium":
+        st.warning("⚠️ Medium confidence - please verify")
+    else:
+        st.error("❌ Low confidence - please check carefully")
+    
+    # Store corrected text in session state
+    st.session_state.transcribed_text = corrected_text
+    
+    # Show copy button
+    st.markdown(f"""
+    <div style='background: #f0f2f6; padding: 1rem; border-radius: 0.5rem; margin: 1rem 0;'>
+        <p><strong>📋 Copy this text:</strong></p>
+        <p style='font-size: 1.2rem; color: #1f1f1f;'>{corrected_text}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.info("💡 Copy the text above and paste it in the question box below!")
+
+def show_transcription_stats(stats, reused=False):
+    """One-line size and latency report for a transcription request"""
+    report = (
+        f"📊 {stats['pcm_bytes'] / 1024:.0f} KB PCM to recognize (recorded {stats['input_bytes'] / 1024:.0f} KB) · "
+        f"{stats['speech_seconds']:.1f}s of speech from {stats['original_seconds']:.1f}s · "
+        f"prepared in {stats['prepare_ms']:.0f} ms"
+    )
+    if "recognize_ms" in stats:
+        report += f" · recognized in {stats['recognize_ms']:.0f} ms ({stats['backend']})"
+    report += f" · total {stats['total_ms'] / 1000:.1f}s"
+    if reused:
+        report = "♻️ Reused earlier result · " + report
+    st.caption(report)
 
 def speech_to_text_interface():
     """
@@ -345,13 +513,15 @@ def speech_to_text_interface():
     # Get current language
     lang_info = SUPPORTED_LANGUAGES.get(st.session_state.selected_language, SUPPORTED_LANGUAGES["Kiswahili"])
     
-    # Disable speech input for Kikuyu (not supported by Google Speech Recognition)
-    if lang_info['name'] == "Kikuyu":
-        st.warning("⚠️ Speech input is not available for Kikuyu")
-        st.info("""
-        **Why?** Google's speech recognition doesn't support Kikuyu language yet. 
+    # Disable speech input when the language's recognizer is not installed
+    backend = get_stt_backend(lang_info.get('stt_backend'))
+    if backend is None:
+        st.warning(f"⚠️ Speech input is not available for {lang_info['name']}")
+        st.info(f"""
+        **Why?** Google's speech recognition doesn't support {lang_info['name']}, and the offline
+        recognizer (`{lang_info.get('stt_backend')}`) is not installed on this server.
         
-        Please type your questions instead. We're working on adding Kikuyu speech support in the future.
+        Please type your questions instead, or install `faster-whisper` to enable offline speech input.
         """)
         return
     
@@ -363,13 +533,8 @@ def speech_to_text_interface():
     </div>
     """, unsafe_allow_html=True)
     
-    # Language code mapping for Google Speech Recognition
-    lang_codes = {
-        "Kiswahili": "sw-KE",  # Swahili (Kenya)
-        "English": "en-US"     # English (US)
-    }
-    
-    recognition_lang = lang_codes.get(lang_info['name'], "sw-KE")
+    # BCP-47 recognition language, e.g. sw-KE for Swahili (Kenya)
+    recognition_lang = lang_info.get('stt_lang', "sw-KE")
     
     # Use Streamlit's audio input
     audio_value = st.audio_input(f"🎙️ Click to record in {lang_info['name']}")
@@ -377,125 +542,50 @@ def speech_to_text_interface():
     if audio_value:
         st.success("✅ Audio recorded! Processing...")
         
-        # Save audio to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
-            tmp_file.write(audio_value.getvalue())
-            audio_path = tmp_file.name
+        audio_bytes = audio_value.getvalue()
+        memo_key = TranscriptionCache.make_key(audio_bytes, f"{lang_info['name']}/{recognition_lang}", backend.name)
         
-        try:
-            # Use speech recognition
-            import speech_recognition as sr
-            recognizer = sr.Recognizer()
-            
-            # Adjust for ambient noise and energy threshold
-            recognizer.energy_threshold = 4000
-            recognizer.dynamic_energy_threshold = True
-            
-            with sr.AudioFile(audio_path) as source:
-                # Adjust for ambient noise
-                recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                audio_data = recognizer.record(source)
-                
-            # Try to recognize speech with language-specific settings
+        # The widget keeps the recording across reruns: reuse the result instead of
+        # recognizing and correcting the same audio again
+        result = st.session_state.transcriptions.get(memo_key) or get_transcription_cache().get(memo_key)
+        reused = result is not None
+        
+        if result is not None and result["correction_error"]:
+            # Recognized before but the correction failed: retry only the correction
+            result = correct_recognized_text(dict(result), lang_info)
+            get_transcription_cache().put(memo_key, result)
+        elif result is None:
             try:
-                # First attempt: Use language-specific recognition
-                text = recognizer.recognize_google(audio_data, language=recognition_lang)
-                
-                st.info(f"🔊 Raw transcription: **{text}**")
-                
-                # Second step: Use AI to correct and improve transcription
-                with st.spinner("🤖 Using AI to improve transcription..."):
-                    llm = initialize_llm()
-                    correction_prompt = f"""You are a {lang_info['name']} language expert. 
-
-A speech recognition system transcribed this audio, but it may have errors because it's not optimized for {lang_info['name']}.
-
-Raw transcription: "{text}"
-Language: {lang_info['name']}
-
-Your task:
-1. Identify likely transcription errors (wrong words, spelling mistakes)
-2. Correct them based on {lang_info['name']} language patterns
-3. Provide the corrected text
-
-Respond in this format:
-CORRECTED: [The corrected text in {lang_info['name']}]
-CONFIDENCE: [high/medium/low]
-EXPLANATION: [Brief explanation of corrections made, if any]
-
-If the transcription looks correct, just return it as is."""
-
-                    try:
-                        response = llm.invoke(correction_prompt)
-                        correction_result = response.content
-                        
-                        # Parse AI response
-                        corrected_text = text  # Default to original
-                        confidence = "medium"
-                        explanation = ""
-                        
-                        if "CORRECTED:" in correction_result:
-                            corrected_text = correction_result.split("CORRECTED:")[1].split("CONFIDENCE:")[0].strip()
-                        
-                        if "CONFIDENCE:" in correction_result:
-                            confidence = correction_result.split("CONFIDENCE:")[1].split("EXPLANATION:")[0].strip()
-                        
-                        if "EXPLANATION:" in correction_result:
-                            explanation = correction_result.split("EXPLANATION:")[1].strip()
-                        
-                        # Display results
-                        st.success(f"✅ **AI-Corrected Text:** {corrected_text}")
-                        
-                        if explanation:
-                            st.info(f"💡 **Corrections made:** {explanation}")
-                        
-                        # Confidence indicator
-                        if confidence.lower() == "high":
-                            st.success("🎯 High confidence in transcription")
-                        elif confidence.lower() == "medium":
-                            st.warning("⚠️ Medium confidence - please verify")
-                        else:
-                            st.error("❌ Low confidence - please check carefully")
-                        
-                        # Store corrected text in session state
-                        st.session_state.transcribed_text = corrected_text
-                        
-                        # Show copy button
-                        st.markdown(f"""
-                        <div style='background: #f0f2f6; padding: 1rem; border-radius: 0.5rem; margin: 1rem 0;'>
-                            <p><strong>📋 Copy this text:</strong></p>
-                            <p style='font-size: 1.2rem; color: #1f1f1f;'>{corrected_text}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        st.info("💡 Copy the text above and paste it in the question box below!")
-                        
-                    except Exception as e:
-                        st.warning(f"AI correction failed: {str(e)}")
-                        st.info(f"Using raw transcription: **{text}**")
-                        st.session_state.transcribed_text = text
-                
-            except sr.UnknownValueError:
-                st.error("❌ Could not understand audio. Please try again with:")
-                st.markdown("""
-                - Speak more clearly and slowly
-                - Reduce background noise
-                - Speak closer to the microphone
-                - Try recording in a quieter environment
-                """)
-            except sr.RequestError as e:
+                result = transcribe_recording(audio_bytes, backend, recognition_lang, lang_info)
+            except RecognitionServiceError as e:
                 st.error(f"❌ Speech recognition service error: {e}")
-                st.info("Please check your internet connection and try again.")
-                
-        except Exception as e:
-            st.error(f"Error processing audio: {str(e)}")
-            st.info("💡 Make sure you have an internet connection for speech recognition.")
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(audio_path)
-            except:
-                pass
+                if not backend.offline:
+                    st.info("Please check your internet connection and try again.")
+            except Exception as e:
+                st.error(f"Error processing audio: {str(e)}")
+                if not backend.offline:
+                    st.info("💡 Make sure you have an internet connection for speech recognition.")
+            
+            # Remembered even if the correction failed: one recording costs one recognition,
+            # and only the correction is retried on the next rerun
+            if result is not None:
+                get_transcription_cache().put(memo_key, result)
+        
+        if result is not None:
+            st.session_state.transcriptions[memo_key] = result
+            st.session_state.transcriptions.move_to_end(memo_key)
+            while len(st.session_state.transcriptions) > SESSION_TRANSCRIPTION_MEMO:
+                st.session_state.transcriptions.popitem(last=False)
+            
+            show_transcription_result(result)
+            st.session_state.last_transcription_stats = result["stats"]
+            show_transcription_stats(result["stats"], reused)
+            
+            scorer_stats = get_transcript_scorer(lang_info['name']).stats()
+            checked = scorer_stats["fast_path"] + scorer_stats["escalated"]
+            if checked:
+                st.caption(f"⚡ AI corrections avoided: {scorer_stats['fast_path']} of {checked} "
+                           f"{lang_info['name']} transcriptions ({scorer_stats['avoided_rate']:.0%})")
     else:
         st.info(f"""
         **How to use Speech Input for {lang_info['name']}:**
@@ -527,6 +617,10 @@ if 'current_mode' not in st.session_state:
     st.session_state.current_mode = "chat"
 if 'quiz_questions' not in st.session_state:
     st.session_state.quiz_questions = []
+if 'quiz_samplers' not in st.session_state:
+    st.session_state.quiz_samplers = {}
+if 'review_schedulers' not in st.session_state:
+    st.session_state.review_schedulers = {}
 if 'current_quiz_index' not in st.session_state:
     st.session_state.current_quiz_index = 0
 if 'quiz_score' not in st.session_state:
@@ -539,48 +633,27 @@ if 'auto_play_responses' not in st.session_state:
     st.session_state.auto_play_responses = False
 if 'speech_input_enabled' not in st.session_state:
     st.session_state.speech_input_enabled = False
+if 'stream_responses' not in st.session_state:
+    st.session_state.stream_responses = True
+if 'queued_audio' not in st.session_state:
+    st.session_state.queued_audio = {}
+if 'transcriptions' not in st.session_state:
+    st.session_state.transcriptions = OrderedDict()
 
-def load_language_knowledge_from_json(language):
-    """Load language knowledge from JSON files"""
+def load_language_knowledge(language):
+    """Load knowledge base for selected language and convert to text"""
     try:
-        filename_map = {
-            "Kiswahili": "kiswahili_knowledge.json",
-            "Kikuyu": "kikuyu_knowledge.json",
-            "English": "english_knowledge.json"
-        }
-        
-        if language not in filename_map:
-            return None
-            
-        filepath = os.path.join("language_data", filename_map[language])
-        
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        else:
-            # Fallback to basic knowledge if file doesn't exist
-            return get_fallback_knowledge(language)
+        knowledge_data = load_language_knowledge_from_json(language)
     except Exception as e:
         st.error(f"Error loading knowledge for {language}: {str(e)}")
-        return get_fallback_knowledge(language)
-
-def get_fallback_knowledge(language):
-    """Fallback knowledge base if JSON files are not available"""
-    return {
-        "language": language,
-        "grammar_rules": [
-            {"rule": "Basic Grammar", "description": f"Learn {language} grammar patterns", "examples": []}
-        ],
-        "vocabulary": {
-            "basic_words": {
-                "hello": {"meaning": "greeting", "pos": "interjection", "examples": ["Hello, how are you?"]}
-            }
-        },
-        "common_errors": [
-            {"error": "Common mistakes", "correct": "Learn proper usage", "example": "Practice makes perfect"}
-        ],
-        "cultural_context": [f"{language} is an important African language with rich cultural heritage"]
-    }
+        knowledge_data = get_fallback_knowledge(language)
+    
+    return knowledge_to_text(language, knowledge_data)
+
+@st.cache_resource
+def get_gikuyu_scanner():
+    """Blacklist compiled once per process into a single-pass matcher"""
+    return HallucinationScanner(GIKUYU_HALLUCINATION_BLACKLIST)
 
 def detect_gikuyu_hallucinations(text):
     """
@@ -590,20 +663,8 @@ def detect_gikuyu_hallucinations(text):
     if not text:
         return False, []
     
-    text_lower = text.lower()
-    corrections = []
-    
-    # Check for blacklisted Swahili words
-    for swahili_word, correction_info in GIKUYU_HALLUCINATION_BLACKLIST.items():
-        # Use word boundaries to avoid partial matches
-        import re
-        pattern = r'\b' + re.escape(swahili_word) + r'\b'
-        if re.search(pattern, text_lower):
-            corrections.append({
-                "error": swahili_word,
-                "correct": correction_info["correct"],
-                "note": correction_info["note"]
-            })
+    # Word-boundary matches against the whole blacklist in one pass
+    corrections = get_gikuyu_scanner().detect(text)
     
     return len(corrections) > 0, corrections
 
@@ -614,381 +675,197 @@ def validate_gikuyu_response(response_text, lang_info):
     if lang_info['name'] != "Kikuyu":
         return response_text, False, []
     
-    has_errors, corrections = detect_gikuyu_hallucinations(response_text)
+    # Detect and replace every blacklisted word in a single pass
+    corrected_text, corrections = get_gikuyu_scanner().correct(response_text)
     
-    if has_errors:
-        # Create correction message
-        corrected_text = response_text
-        for correction in corrections:
-            import re
-            pattern = r'\b' + re.escape(correction["error"]) + r'\b'
-            corrected_text = re.sub(pattern, correction["correct"], corrected_text, flags=re.IGNORECASE)
-        
+    if corrections:
         return corrected_text, True, corrections
     
     return response_text, False, []
 
+@st.cache_resource
+def get_llm_pool():
+    """Process-wide LLM client pool so sessions share warm HTTP connections"""
+    return LLMClientPool(
+        api_key=openai_api_key,  # Explicitly pass API key
+        max_connections=int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "10")),
+        timeout=30  # 30 second timeout for GPT-4
+    )
+
 def initialize_llm():
-    """Initialize GPT-4 with minimal temperature to maximize factual accuracy"""
-    return ChatOpenAI(
+    """Get the shared GPT-4 client with minimal temperature to maximize factual accuracy"""
+    return get_llm_pool().get(
         model="gpt-4",  # GPT-4 has much better knowledge of African languages
         temperature=0.0,  # Zero temperature for maximum factual accuracy and minimal hallucination
-        max_tokens=500,  # Limit tokens for faster generation
-        timeout=30,  # 30 second timeout for GPT-4
-        openai_api_key=openai_api_key  # Explicitly pass API key
+        max_tokens=500  # Limit tokens for faster generation
+    )
+
+@st.cache_resource
+def get_quiz_bank():
+    """Curated quiz questions for every language, loaded and indexed once per process"""
+    return load_quiz_bank()
+
+@st.cache_resource
+def get_review_store():
+    """Persistent spaced-repetition state of every learner"""
+    return ReviewStore()
+
+@st.cache_resource
+def get_single_flight():
+    """Process-wide registry that lets identical in-flight LLM requests share one call"""
+    return SingleFlight()
+
+@st.cache_resource
+def get_transcription_cache():
+    """Process-wide transcription memo keyed by audio fingerprint and language"""
+    return TranscriptionCache(max_entries=int(os.getenv("TRANSCRIPTION_CACHE_MAX_ENTRIES", "256")))
+
+@st.cache_resource
+def get_transcript_scorer(language):
+    """Per-language lexicon used to skip AI correction of clean transcripts"""
+    return TranscriptScorer(
+        lexicon_words(language, GIKUYU_DICTIONARY),
+        min_coverage=float(os.getenv("TRANSCRIPT_FAST_PATH_COVERAGE", "1.0"))
     )
 
-def create_language_tutor_prompt():
-    """Create specialized prompt leveraging GPT-4's strong multilingual capabilities"""
-    system_prompt = """You are an expert AI tutor for African languages, specializing in {language}. 
-    You are powered by GPT-4 and have strong knowledge of African languages.
-
-    Your role is to help learners master {language} through clear, accurate instruction.
-
-    CRITICAL - LANGUAGE RESPONSE RULES:
-    - If teaching ENGLISH: Respond ENTIRELY in English. Do NOT translate to other languages unless explicitly asked.
-    - If teaching KISWAHILI: Respond ENTIRELY in Kiswahili. Use Swahili for explanations and examples.
-    - If teaching KIKUYU: Respond ENTIRELY in Kikuyu when possible, with English explanations when needed.
-    
-    STAY IN THE SELECTED LANGUAGE MODE. Do not mix languages or auto-translate unless the user specifically requests translation.
-
-    CRITICAL - ANTI-HALLUCINATION RULES FOR GĨKŨYŨ:
-    If teaching Gĩkũyũ (Kikuyu), you MUST follow these STRICT rules:
-    
-    1. NEVER EVER use Swahili words when teaching Gĩkũyũ - this is the #1 error to avoid:
-       - BANNED: "habari" → ONLY USE: "ũhoro" (news/how are you)
-       - BANNED: "mti" → ONLY USE: "mũtĩ" (tree - note the tilde ũ)
-       - BANNED: "kula" → ONLY USE: "kũrĩa" (to eat)
-       - BANNED: "asante" → ONLY USE: "nĩ wega" (thank you)
-       - BANNED: "watoto" → ONLY USE: "ciana" (children)
-       - BANNED: "chakula" → ONLY USE: "irĩo" (food)
-       - BANNED: "maji" → ONLY USE: "maaĩ" (water)
-       - BANNED: "kwenda" → ONLY USE: "gũthiĩ" (to go)
-       - BANNED: "kusoma" → ONLY USE: "gũthoma" (to read)
-       - BANNED: "nyumba" → ONLY USE: "nyũmba" (house - with tilde)
-    
-    2. ALWAYS use proper Gĩkũyũ diacritics - they are NOT optional:
-       - ũ, ĩ, ĩ are REQUIRED - never omit them
-       - Example: "mũndũ" NOT "mundu"
-       - Example: "mũtĩ" NOT "mti"
-    
-    3. ONLY use vocabulary from the verified knowledge base provided
-    
-    4. If you don't know a Gĩkũyũ word, say "I'm not certain of the exact Gĩkũyũ word" - DO NOT guess or use Swahili
-    
-    5. Before responding, ask yourself: "Does this word sound like Swahili?" If YES, find the Gĩkũyũ equivalent
-    
-    6. DOUBLE-CHECK every word - Swahili contamination is the most common error
-
-    TEACHING APPROACH:
-    1. Provide accurate, helpful answers to all language questions
-    2. Give clear explanations with practical examples
-    3. Teach proper vocabulary, grammar, and pronunciation
-    4. Encourage pure language usage without code-switching
-    5. Correct mistakes gently with clear explanations
-    6. Provide cultural context and usage notes
-    7. Be encouraging and supportive
-
-    When responding:
-    - For vocabulary: provide meaning, part of speech, pronunciation, and usage examples
-    - For grammar: explain structure, rules, and patterns with clear examples
-    - For sentences: analyze grammar and suggest improvements
-    - For translations: provide accurate translations with context
-    - Be conversational, educational, and accurate
-    - RESPOND IN THE LANGUAGE YOU ARE TEACHING unless translation is specifically requested
-
-    Knowledge base context: {context}
+@st.cache_resource
+def get_lexicon_index(language):
+    """Per-language index of the verified vocabulary, searched before asking the LLM"""
+    return build_lexicon_index(language, GIKUYU_DICTIONARY)
+
+@st.cache_resource
+def get_category_cache():
+    """Persistent store of generated vocabulary category lists"""
+    return CategoryCache()
+
+@st.cache_resource
+def get_response_cache():
+    """Process-wide answer cache shared by all learners"""
+    similarity = os.getenv("RESPONSE_CACHE_SIMILARITY", "").strip()
+    return ResponseCache(
+        max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512")),
+        ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", str(24 * 3600))),
+        similarity_threshold=float(similarity) if similarity else None
+    )
+
+@st.cache_resource
+def get_tutor_prompts():
+    """Per-language system prompts, compiled once per process with their token counts"""
+    return compile_tutor_prompts(SUPPORTED_LANGUAGES, GIKUYU_DICTIONARY)
+
+def create_language_tutor_prompt(language):
     """
-    
-    return ChatPromptTemplate.from_messages([
-        ("system", system_prompt),
-        ("human", "{input}")
-    ])
+    Get the compiled prompt for a language
+    Returns a dict with the ChatPromptTemplate ("template") and its "version"
+    """
+    prompts = get_tutor_prompts()
+    return prompts.get(language, prompts["English"])
 
-def load_language_knowledge(language):
-    """Load knowledge base for selected language and convert to text"""
-    knowledge_data = load_language_knowledge_from_json(language)
-    
-    if not knowledge_data:
-        return ""
-    
-    # Convert JSON data to text format for embedding
-    text_content = f"Language: {language}\n\n"
-    
-    # Grammar rules
-    text_content += "Grammar Rules:\n"
-    for rule in knowledge_data.get('grammar_rules', []):
-        text_content += f"- {rule.get('rule', '')}: {rule.get('description', '')}\n"
-        for example in rule.get('examples', []):
-            text_content += f"  Example: {example}\n"
-    
-    # Vocabulary
-    text_content += "\nVocabulary:\n"
-    vocab = knowledge_data.get('vocabulary', {})
-    
-    # Basic words
-    for word, info in vocab.get('basic_words', {}).items():
-        text_content += f"- {word}: {info.get('meaning', '')} ({info.get('pos', '')})\n"
-        for example in info.get('examples', []):
-            text_content += f"  Example: {example}\n"
-    
-    # Greetings
-    for greeting, info in vocab.get('greetings', {}).items():
-        text_content += f"- {greeting}: {info.get('meaning', '')} (Response: {info.get('response', '')})\n"
-        text_content += f"  Usage: {info.get('usage', '')}\n"
-    
-    # Common errors
-    text_content += "\nCommon Errors:\n"
-    for error in knowledge_data.get('common_errors', []):
-        text_content += f"- Error: {error.get('error', '')}\n"
-        text_content += f"  Correct: {error.get('correct', '')}\n"
-        text_content += f"  Example: {error.get('example', '')}\n"
-    
-    # Cultural context
-    text_content += "\nCultural Context:\n"
-    for context in knowledge_data.get('cultural_context', []):
-        text_content += f"- {context}\n"
-    
-    return text_content
+# Retrieval and context assembly settings
+RETRIEVAL_K = int(os.getenv("RETRIEVAL_K", "5"))
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "600"))
+CONTEXT_USE_MMR = os.getenv("CONTEXT_USE_MMR", "false").lower() in ("1", "true", "yes")
+CONTEXT_MMR_LAMBDA = float(os.getenv("CONTEXT_MMR_LAMBDA", "0.7"))
+
+@st.cache_resource
+def get_embeddings():
+    """Process-wide embeddings model; repeated chunks and queries are served from the embedding cache"""
+    return CachedEmbeddings(
+        OpenAIEmbeddings(model=EMBEDDING_MODEL, openai_api_key=openai_api_key),
+        model_name=EMBEDDING_MODEL
+    )
 
 @st.cache_resource
 def setup_knowledge_base(language):
-    """Setup vector store with language knowledge"""
+    """Setup vector store with language knowledge, reusing the on-disk index when unchanged"""
     knowledge_text = load_language_knowledge(language)
     
     if not knowledge_text:
         return None
     
     try:
-        # Create document directly from text instead of using file loader
-        doc = Document(page_content=knowledge_text, metadata={"language": language})
+        embeddings = get_embeddings()
         
-        # Split the document into chunks
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=500,
-            chunk_overlap=50
-        )
-        splits = text_splitter.split_documents([doc])
+        def build_index():
+            # Create document directly from text instead of using file loader
+            doc = Document(page_content=knowledge_text, metadata={"language": language})
+            
+            # Split the document into chunks
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=CHUNK_SIZE,
+                chunk_overlap=CHUNK_OVERLAP
+            )
+            splits = text_splitter.split_documents([doc])
+            
+            # Create vector store with OpenAI embedding model
+            return FAISS.from_documents(splits, embeddings)
         
-        # Create embeddings and vector store with OpenAI embedding model
-        embeddings = OpenAIEmbeddings(openai_api_key=openai_api_key)
-        vectorstore = FAISS.from_documents(splits, embeddings)
+        # Only re-embed when the language data, splitter settings or model changed
+        index_key = compute_index_key(
+            get_language_data_path(language), knowledge_text,
+            CHUNK_SIZE, CHUNK_OVERLAP, EMBEDDING_MODEL
+        )
+        vectorstore = load_or_build_index(
+            language, index_key, embeddings, build_index,
+            metadata={"chunk_size": CHUNK_SIZE, "chunk_overlap": CHUNK_OVERLAP, "embedding_model": EMBEDDING_MODEL}
+        )
         
         return vectorstore
     except Exception as e:
         st.warning(f"Knowledge base setup issue: {str(e)}. Using direct LLM mode.")
         return None
 
+def get_learner_id():
+    """Stable learner id for review history, kept in the URL (?learner=...) so it survives restarts"""
+    if 'learner_id' not in st.session_state:
+        learner = st.query_params.get("learner")
+        if not learner:
+            learner = uuid.uuid4().hex[:12]
+            st.query_params["learner"] = learner
+        st.session_state.learner_id = learner
+    return st.session_state.learner_id
+
+def get_review_scheduler(language):
+    """This learner's spaced-repetition queue for the language, loaded once per session"""
+    language = get_quiz_bank().resolve_language(language)
+    schedulers = st.session_state.review_schedulers
+    if language not in schedulers:
+        schedulers[language] = get_review_store().load(get_learner_id(), language)
+    return schedulers[language]
+
+def record_quiz_review(language, question, quality):
+    """Schedule the question's next review from how it was answered"""
+    bank = get_quiz_bank()
+    if bank.get(language, question.get('id')) is None:
+        return
+    state = get_review_scheduler(language).review(question['id'], quality)
+    get_review_store().save(get_learner_id(), bank.resolve_language(language), state)
+
 def generate_quiz_questions(language, num_questions=5):
     """Generate reliable quiz questions from predefined set to prevent hallucinations"""
     # Use predefined questions instead of AI generation to prevent hallucinations
-    # Start with 5 questions, then generate 5 more after completion
-    return generate_fallback_questions(language)[:num_questions]
-
-def generate_fallback_questions(language):
-    """Curated, verified questions for each language"""
-    fallback = {
-        "Kiswahili": [
-            {
-                "id": 1,
-                "question": "-----amelia sana (Mtoto/Kitoto)",
-                "category": "Grammar",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "mtoto",
-                "acceptable_answers": ["mtoto"]
-            },
-            {
-                "id": 2,
-                "question": "Kamilisha sentensi: 'Mimi ____ kitabu' (soma)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "nasoma",
-                "acceptable_answers": ["nasoma", "ninasoma"]
-            },
-            {
-                "id": 3,
-                "question": "Tafsiri 'nyumba' kwa Kiingereza",
-                "category": "Translation",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "house",
-                "acceptable_answers": ["house", "home"]
-            },
-            {
-                "id": 4,
-                "question": "Wingi wa kitabu ni",
-                "category": "Grammar",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "vitabu",
-                "acceptable_answers": ["vitabu"]
-            },
-            {
-                "id": 5,
-                "question": "Tafsiri 'I am eating' kwa Kiswahili",
-                "category": "Translation",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "ninakula",
-                "acceptable_answers": ["ninakula", "nakula"]
-            },
-            {
-                "id": 6,
-                "question": "Kamilisha: 'Wewe ____ wapi?' (enda)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "unaenda",
-                "acceptable_answers": ["unaenda", "unakwenda"]
-            },
-            {
-                "id": 7,
-                "question": "mzee ---- mkoba (amebeba/amebebwa)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "amebeba",
-                "acceptable_answers": ["amebeba"]
-            },
-            {
-                "id": 8,
-                "question": "'Ninasoma kitabu' kwa Kiingereza",
-                "category": "Translation",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "i am reading a book",
-                "acceptable_answers": ["i am reading a book", "i'm reading a book", "am reading a book"]
-            },
-            {
-                "id": 9,
-                "question": "-----wa watu (umati/kamati)",
-                "category": "Vocabulary",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "umati",
-                "acceptable_answers": ["umati"]
-            },
-            {
-                "id": 10,
-                "question": "kanusha 'keti'",
-                "category": "Vocabulary",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "simama",
-                "acceptable_answers": ["simama", "stand"]
-            },
-        ],
-        "Kikuyu": [
-            {
-                "id": 1,
-                "question": "Nĩngwendete nĩ kuaga atĩa na gĩthũngũ?",
-                "category": "Translation",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "i love you",
-                "acceptable_answers": ["i love you", "love you", "i love u"]
-            },
-            {
-                "id": 2,
-                "question": "Maitu ---- thoko ũmũthĩ (niarathire/niathire)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "niathire",
-                "acceptable_answers": ["niathire"]
-            },
-            {
-                "id": 3,
-                "question": "Kũina nĩ kuga atĩa na gĩthweri",
-                "category": "Translation",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "singing",
-                "acceptable_answers": ["singing", "to sing", "sing"]
-            },
-            {
-                "id": 4,
-                "question": "Ciana irathomothio nĩ ----- (mwarimũ/mũrũtwo)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "mwarimũ",
-                "acceptable_answers": ["mwarimũ", "mwarimu"]
-            },
-            {
-                "id": 5,
-                "question": "Mwaki nĩ ------- thaa ici (wakanire/wakana)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "wakana",
-                "acceptable_answers": ["wakana"]
-            },
-            {
-                "id": 6,
-                "question": "Andika namba kenda",
-                "category": "Numbers",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "9",
-                "acceptable_answers": ["9", "nine", "kenda"]
-            },
-            {
-                "id": 7,
-                "question": "Gikombe gĩkĩ ------ (nĩgĩatũka/nakaunĩka)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "nĩgĩatũka",
-                "acceptable_answers": ["nĩgĩatũka", "nigiathuka"]
-            },
-            {
-                "id": 8,
-                "question": "Rangi mũtune ũhana kĩ--- (thakame/iria)",
-                "category": "Vocabulary",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "thakame",
-                "acceptable_answers": ["thakame"]
-            },
-            {
-                "id": 9,
-                "question": "Ritwa rĩngĩ rĩa mwarimũ nĩ ------ (ndagĩtarĩ/mũrutani)",
-                "category": "Vocabulary",
-                "difficulty": "easy",
-                "language": language,
-                "correct_answer": "mũrutani",
-                "acceptable_answers": ["mũrutani", "murutani"]
-            },
-            {
-                "id": 10,
-                "question": "kiondo ---- nĩ kĩrataruka (icio/gĩkĩ)",
-                "category": "Grammar",
-                "difficulty": "medium",
-                "language": language,
-                "correct_answer": "gĩkĩ",
-                "acceptable_answers": ["gĩkĩ", "giki"]
-            },
-        ],
-        "English": [
-            {"question": "What is the past tense of 'go'?", "category": "grammar", "difficulty": "easy", "language": language, "correct_answer": "went", "acceptable_answers": ["went"]},
-            {"question": "Complete: 'She ___ to school every day' (goes/go)", "category": "grammar", "difficulty": "easy", "language": language, "correct_answer": "goes", "acceptable_answers": ["goes"]},
-            {"question": "What is the plural of 'child'?", "category": "vocabulary", "difficulty": "easy", "language": language, "correct_answer": "children", "acceptable_answers": ["children"]},
-            {"question": "Choose the correct article: '___ apple' (a/an)", "category": "grammar", "difficulty": "easy", "language": language, "correct_answer": "an", "acceptable_answers": ["an"]},
-            {"question": "What does 'beautiful' mean?", "category": "vocabulary", "difficulty": "easy", "language": language, "correct_answer": "attractive", "acceptable_answers": ["attractive", "pretty", "good-looking", "lovely"]},
-            {"question": "Complete: 'I ___ a student' (am/is/are)", "category": "grammar", "difficulty": "easy", "language": language, "correct_answer": "am", "acceptable_answers": ["am"]},
-            {"question": "What is the past tense of 'eat'?", "category": "grammar", "difficulty": "easy", "language": language, "correct_answer": "ate", "acceptable_answers": ["ate"]},
-            {"question": "Choose: 'He ___ playing' (is/are)", "category": "grammar", "difficulty": "easy", "language": language, "correct_answer": "is", "acceptable_answers": ["is"]},
-            {"question": "What is the plural of 'mouse'?", "category": "vocabulary", "difficulty": "medium", "language": language, "correct_answer": "mice", "acceptable_answers": ["mice"]},
-            {"question": "Complete: 'They ___ happy' (is/are)", "category": "grammar", "difficulty": "easy", "language": language, "correct_answer": "are", "acceptable_answers": ["are"]},
-        ]
-    }
-    
-    return fallback.get(language, fallback["English"])
+    # Questions due for review come first, then unseen ones drawn at random without repeats
+    bank = get_quiz_bank()
+    samplers = st.session_state.quiz_samplers
+    if language not in samplers:
+        samplers[language] = bank.sampler(language)
+    sampler = samplers[language]
+
+    # Questions this learner has not seen: the rest of the sampler's current round, then at
+    # most one new round for questions drawn earlier but never answered (select_questions
+    # drops the repeats a new round brings)
+    unseen = (sampler.draw_one() for _ in range(sampler.remaining + len(bank.pool(language))))
+    # Never repeat the quiz just finished ("Continue with 5 More Questions")
+    just_asked = [question.get('id') for question in st.session_state.quiz_questions]
+    review_ids, fresh = select_questions(get_review_scheduler(language), unseen, num_questions, exclude=just_asked)
+
+    items = [bank.get(language, item_id) for item_id in review_ids] + fresh
+    return [item.to_dict() for item in items if item is not None]
 
 def main():
+    refresh_queued_audio()
+
     # Header
     st.markdown("<h1 class='main-header'>🌍 African Language AI Tutor</h1>", unsafe_allow_html=True)
     st.markdown("<p class='sub-header'>Master African languages with AI-powered personalized tutoring</p>", unsafe_allow_html=True)
@@ -1150,6 +1027,17 @@ def main():
         else:
             st.session_state.current_mode = "vocabulary"
         
+        if st.session_state.current_mode == "chat":
+            st.session_state.stream_responses = st.checkbox(
+                "Stream Responses",
+                value=st.session_state.stream_responses,
+                help="Show the tutor's answer word by word as it is generated"
+            )
+            
+            if st.session_state.get("last_pipeline_timings"):
+                with st.expander("⏱️ Last Response Timing"):
+                    show_pipeline_timings(st.session_state.last_pipeline_timings)
+        
         st.markdown("---")
         
         # Quick help
@@ -1195,7 +1083,7 @@ def show_chat_interface(lang_info):
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.button("🔊 Play Greeting", use_container_width=True):
-                audio = text_to_speech(lang_info['greeting'], lang_info['tts_lang'])
+                audio = text_to_speech(lang_info['greeting'], lang_info['tts_lang'], lang_info.get('tts_backend'))
                 if audio:
                     create_audio_player(audio, key="greeting_audio")
     
@@ -1208,29 +1096,19 @@ def show_chat_interface(lang_info):
         st.markdown("### 💭 Conversation")
     
     for i, message in enumerate(st.session_state.chat_history):
-        if message["role"] == "user":
-            st.markdown(f"""
-            <div class="chat-message user">
-                <strong>👤 You:</strong><br>
-                <span style='font-size: 1.1rem; margin-top: 0.5rem; display: block;'>{message["content"]}</span>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="chat-message assistant">
-                <strong>🤖 Tutor:</strong><br>
-                <span style='font-size: 1.1rem; margin-top: 0.5rem; display: block;'>{message["content"]}</span>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Add audio player for each response if voice is enabled
-            if st.session_state.voice_enabled:
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 3])
-                with col2:
-                    if st.button(f"🔊 Play", key=f"play_response_{i}"):
-                        audio = text_to_speech(message["content"], lang_info['tts_lang'])
-                        if audio:
-                            create_audio_player(audio, key=f"response_audio_{i}")
+        render_chat_message(message["role"], message["content"])
+        
+        # Add audio player for each response if voice is enabled
+        if message["role"] != "user" and st.session_state.voice_enabled:
+            col1, col2, col3, col4 = st.columns([3, 1, 1, 3])
+            with col2:
+                if st.button(f"🔊 Play", key=f"play_response_{i}"):
+                    audio = text_to_speech(message["content"], lang_info['tts_lang'], lang_info.get('tts_backend'))
+                    if audio:
+                        create_audio_player(audio, key=f"response_audio_{i}")
+    
+    # New messages are streamed here, below the existing conversation
+    live_container = st.container()
     
     # Chat input with enhanced styling
     st.markdown("<br>", unsafe_allow_html=True)
@@ -1255,99 +1133,149 @@ def show_chat_interface(lang_info):
         col1, col2, col3 = st.columns([2, 1, 2])
         with col2:
             submit = st.form_submit_button("Send 📤", use_container_width=True)
-        
-        if submit and user_input:
-            # Clear transcribed text after using it
-            if 'transcribed_text' in st.session_state:
-                del st.session_state.transcribed_text
-            handle_chat_query(user_input, vectorstore, llm, lang_info)
+    
+    if submit and user_input:
+        # Clear transcribed text after using it
+        if 'transcribed_text' in st.session_state:
+            del st.session_state.transcribed_text
+        handle_chat_query(user_input, vectorstore, llm, lang_info, container=live_container)
+
+def chat_message_html(role, content):
+    """HTML for a single chat bubble"""
+    if role == "user":
+        css_class, label = "user", "👤 You:"
+    else:
+        css_class, label = "assistant", "🤖 Tutor:"
+    return f"""
+    <div class="chat-message {css_class}">
+        <strong>{label}</strong><br>
+        <span style='font-size: 1.1rem; margin-top: 0.5rem; display: block;'>{content}</span>
+    </div>
+    """
+
+def render_chat_message(role, content):
+    """Display a single chat bubble"""
+    st.markdown(chat_message_html(role, content), unsafe_allow_html=True)
+
+def show_hallucination_corrections(corrections):
+    """Warn about corrected Gĩkũyũ hallucinations and list what was changed"""
+    st.warning("⚠️ Hallucination detected and corrected!")
+    
+    # Show what was corrected
+    with st.expander("🔍 See what was corrected"):
+        st.markdown("**Swahili/Sheng words incorrectly used:**")
+        for correction in corrections:
+            st.markdown(f"""
+            <div class='correction-box'>
+                <p>❌ <strong>Error:</strong> {correction['error']}</p>
+                <p>✅ <strong>Correct Gĩkũyũ:</strong> {correction['correct']}</p>
+                <p>💡 <strong>Note:</strong> {correction['note']}</p>
+            </div>
+            """, unsafe_allow_html=True)
 
-def handle_chat_query(query, vectorstore, llm, lang_info):
-    """Process chat query leveraging GPT-4's strong language capabilities"""
+def handle_chat_query(query, vectorstore, llm, lang_info, container=None):
+    """
+    Process chat query leveraging GPT-4's strong language capabilities
+    Retrieval, generation, Gĩkũyũ correction and speech synthesis run as overlapping
+    async stages (see chat_pipeline.py). With streaming enabled and a container given,
+    the answer is rendered token by token and added to the history without a full-page rerun
+    """
     st.session_state.chat_history.append({"role": "user", "content": query})
     
-    with st.spinner("🤔 Thinking..."):
-        try:
-            # Create prompt template
-            prompt_template = create_language_tutor_prompt()
-            
-            # Retrieve relevant context if vectorstore available
-            context = ""
-            if vectorstore:
-                retriever = vectorstore.as_retriever(search_kwargs={"k": 5})
-                docs = retriever.get_relevant_documents(query)
-                if docs:
-                    context = "\n\n".join([doc.page_content for doc in docs])
-            
-            # Add Gĩkũyũ dictionary to context if teaching Kikuyu
-            if lang_info['name'] == "Kikuyu":
-                dictionary_context = "\n\nVERIFIED GĨKŨYŨ VOCABULARY (use ONLY these):\n"
-                dictionary_context += "\nNouns:\n"
-                for word, meaning in GIKUYU_DICTIONARY["nouns"].items():
-                    dictionary_context += f"- {word}: {meaning}\n"
-                dictionary_context += "\nVerbs:\n"
-                for word, meaning in GIKUYU_DICTIONARY["verbs"].items():
-                    dictionary_context += f"- {word}: {meaning}\n"
-                dictionary_context += "\nGreetings/Phrases:\n"
-                for word, meaning in GIKUYU_DICTIONARY["greetings_phrases"].items():
-                    dictionary_context += f"- {word}: {meaning}\n"
-                dictionary_context += "\nNumbers:\n"
-                for word, meaning in GIKUYU_DICTIONARY["numbers"].items():
-                    dictionary_context += f"- {word}: {meaning}\n"
-                
-                context = dictionary_context + "\n\n" + context
-            
-            # Provide context
-            if context:
-                context_instruction = f"Relevant knowledge base information:\n\n{context}\n\nUse this as reference along with your GPT-4 knowledge to provide accurate, helpful answers."
+    streaming = st.session_state.stream_responses and container is not None
+    if streaming:
+        with container:
+            render_chat_message("user", query)
+            placeholder = st.empty()
+            placeholder.markdown(chat_message_html("assistant", "🤔 Thinking..."), unsafe_allow_html=True)
+    
+    speak = None
+    if st.session_state.voice_enabled and st.session_state.auto_play_responses:
+        # Each sentence is synthesized as soon as it is final, while the rest is still being generated
+        audio_cache = get_audio_cache()
+        speak = lambda text: synthesize_async(
+            text, lang_info['tts_lang'], cache=audio_cache, backend=lang_info.get('tts_backend')
+        )
+    
+    request = ChatRequest(
+        query=query,
+        language=lang_info['name'],
+        # Compiled prompt for this language (Kikuyu's includes the verified dictionary)
+        tutor_prompt=create_language_tutor_prompt(lang_info['name']),
+        llm=llm,
+        vectorstore=vectorstore,
+        embeddings=get_embeddings() if vectorstore else None,
+        response_cache=get_response_cache(),
+        retrieval_k=RETRIEVAL_K,
+        token_budget=CONTEXT_TOKEN_BUDGET,
+        use_mmr=CONTEXT_USE_MMR,
+        mmr_lambda=CONTEXT_MMR_LAMBDA,
+        # Kikuyu text is corrected chunk by chunk, before learners see or hear it
+        scanner=get_gikuyu_scanner() if lang_info['name'] == "Kikuyu" else None,
+        stream=streaming,
+        speak=speak,
+        fallback_instruction=f"Use your GPT-4 knowledge of {lang_info['name']} to provide accurate, helpful guidance.",
+        single_flight=get_single_flight()
+    )
+    
+    try:
+        result = None
+        audio_clips = 0
+        with st.spinner("🤔 Thinking...") if not streaming else container:
+            for event, payload in run_chat_pipeline(request):
+                if event == "text":
+                    placeholder.markdown(chat_message_html("assistant", payload + "▌"), unsafe_allow_html=True)
+                elif event == "audio":
+                    queue_audio(payload, reset=audio_clips == 0)
+                    audio_clips += 1
+                elif event == "audio_error":
+                    st.error(f"Error generating speech: {str(payload)}")
+                elif event == "context_stats":
+                    st.session_state.last_context_stats = payload
+                elif event == "done":
+                    result = payload
+        
+        answer = result["answer"]
+        st.session_state.last_pipeline_timings = result["timings"]
+        
+        # If hallucinations were detected, show warning
+        if result["corrections"]:
+            if streaming:
+                with container:
+                    show_hallucination_corrections(result["corrections"])
             else:
-                context_instruction = f"Use your GPT-4 knowledge of {lang_info['name']} to provide accurate, helpful guidance."
-            
-            # Format prompt with context
-            formatted_prompt = prompt_template.format_messages(
-                language=lang_info['name'],
-                context=context_instruction,
-                input=query
-            )
-            
-            # Generate response
-            response = llm.invoke(formatted_prompt)
-            answer = response.content
-            
-            # Validate and correct Gĩkũyũ responses for hallucinations
-            corrected_answer, had_errors, corrections = validate_gikuyu_response(answer, lang_info)
-            
-            # If hallucinations were detected, show warning
-            if had_errors:
-                st.warning("⚠️ Hallucination detected and corrected!")
-                
-                # Show what was corrected
-                with st.expander("🔍 See what was corrected"):
-                    st.markdown("**Swahili/Sheng words incorrectly used:**")
-                    for correction in corrections:
-                        st.markdown(f"""
-                        <div class='correction-box'>
-                            <p>❌ <strong>Error:</strong> {correction['error']}</p>
-                            <p>✅ <strong>Correct Gĩkũyũ:</strong> {correction['correct']}</p>
-                            <p>💡 <strong>Note:</strong> {correction['note']}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                # Use corrected answer
-                answer = corrected_answer
-            
-            st.session_state.chat_history.append({"role": "assistant", "content": answer})
-            
-            # Auto-play response if enabled
-            if st.session_state.voice_enabled and st.session_state.auto_play_responses:
-                audio = text_to_speech(answer, lang_info['tts_lang'])
-                if audio:
-                    autoplay_audio(audio)
-            
+                show_hallucination_corrections(result["corrections"])
+        
+        if streaming:
+            # Replace the streamed draft with the final (validated) text
+            placeholder.markdown(chat_message_html("assistant", answer), unsafe_allow_html=True)
+        
+        st.session_state.chat_history.append({"role": "assistant", "content": answer})
+        
+        if not streaming:
             st.rerun()
-            
-        except Exception as e:
-            st.error(f"Sorry, I encountered an error: {str(e)}")
+        
+    except Exception as e:
+        st.error(f"Sorry, I encountered an error: {str(e)}")
+
+def show_pipeline_timings(timings):
+    """Per-stage timing of the last answer; overlapping stages show up as time saved"""
+    stages = timings["stages"]
+    marks = timings["marks"]
+    lines = [f"- **{name}**: {stage['start_ms']:.0f} → {stage['end_ms']:.0f} ms ({stage['ms']:.0f} ms)"
+             for name, stage in stages.items()]
+    if "first_token" in marks:
+        lines.append(f"- first token at {marks['first_token']:.0f} ms")
+    if "first_audio" in marks:
+        lines.append(f"- first audio at {marks['first_audio']:.0f} ms")
+    lines.append(f"- total {timings['total_ms']:.0f} ms vs {timings['stages_sum_ms']:.0f} ms run one after "
+                 f"another (saved {timings['overlap_ms']:.0f} ms)")
+    st.markdown("\n".join(lines))
+
+    flight_stats = get_single_flight().stats()
+    if flight_stats["coalesced"]:
+        st.caption(f"🔗 {flight_stats['coalesced']} of {flight_stats['requests']} AI requests shared an "
+                   f"identical in-flight call ({flight_stats['coalesced_rate']:.0%})")
 
 def show_quiz_interface(lang_info):
     """Display quiz practice interface with scoring"""
@@ -1367,6 +1295,13 @@ def show_quiz_interface(lang_info):
         </div>
         """, unsafe_allow_html=True)
         
+        review_stats = get_review_scheduler(lang_info['name']).stats()
+        if review_stats['due']:
+            st.caption(f"🔁 {review_stats['due']} of the {review_stats['items']} questions you have practised "
+                       "are due for review - they come first")
+        elif review_stats['items']:
+            st.caption(f"🔁 {review_stats['items']} questions practised - none due for review yet")
+        
         if st.button("🎲 Start Quiz (5 Questions)", use_container_width=True):
             with st.spinner(f"🤖 Generating {lang_info['name']} quiz questions..."):
                 st.session_state.quiz_questions = generate_quiz_questions(lang_info['name'], num_questions=5)
@@ -1411,13 +1346,9 @@ def show_quiz_interface(lang_info):
                 if st.button("✅ Submit Answer", use_container_width=True):
                     if user_answer:
                         # Simple string matching - NO AI evaluation
-                        user_lower = user_answer.lower().strip()
-                        
-                        # Get acceptable answers
-                        acceptable_answers = current_q.get('acceptable_answers', [current_q.get('correct_answer', '')])
-                        
-                        # Check if answer matches any acceptable answer
-                        is_correct = any(user_lower == ans.lower().strip() for ans in acceptable_answers)
+                        # Missing diacritics (mwarimu for mwarimũ) are accepted, and small typos where the question allows them
+                        match = grade_answer(get_quiz_bank(), lang_info['name'], current_q, user_answer)
+                        is_correct = match.correct
                         
                         # Language-specific feedback
                         if lang_info['name'] == "Kiswahili":
@@ -1437,11 +1368,14 @@ def show_quiz_interface(lang_info):
                             "correct": is_correct,
                             "explanation": current_q.get('explanation', ''),
                             "correct_answer": current_q.get('correct_answer', ''),
-                            "teaching_point": ""
+                            "teaching_point": "",
+                            # Accepted, but not spelled exactly as expected
+                            "spelling_note": match.matched if match.kind in ("diacritics", "typo") else ""
                         })
                         
                         if is_correct:
                             st.session_state.quiz_score += 1
+                        record_quiz_review(lang_info['name'], current_q, answer_quality(is_correct, match.kind))
                         
                         st.rerun()
                     else:
@@ -1457,6 +1391,7 @@ def show_quiz_interface(lang_info):
                         "correct_answer": current_q.get('correct_answer', ''),
                         "teaching_point": ""
                     })
+                    record_quiz_review(lang_info['name'], current_q, QUALITY_SKIPPED)
                     st.session_state.current_quiz_index += 1
                     st.rerun()
             
@@ -1475,6 +1410,8 @@ def show_quiz_interface(lang_info):
             if answer_data['correct']:
                 # Show success message
                 st.success("✅ Well done!")
+                if answer_data.get('spelling_note'):
+                    st.info(f"✏️ Watch the spelling: **{answer_data['spelling_note']}**")
             else:
                 # Show error with correct answer
                 st.error("❌ Not correct.")
@@ -1554,9 +1491,8 @@ def show_quiz_interface(lang_info):
         if total_questions == 5 and lang_info['name'] in ["Kikuyu", "Kiswahili"]:
             with col1:
                 if st.button("➕ Continue with 5 More Questions", use_container_width=True):
-                    # Load questions 6-10
-                    all_questions = generate_fallback_questions(lang_info['name'])
-                    st.session_state.quiz_questions = all_questions[5:10]
+                    # Next questions from this session's sampler (no repeats)
+                    st.session_state.quiz_questions = generate_quiz_questions(lang_info['name'], num_questions=5)
                     st.session_state.current_quiz_index = 0
                     # Keep the score from first 5
                     st.session_state.quiz_answers = []
@@ -1588,28 +1524,54 @@ def show_quiz_interface(lang_info):
                     st.session_state.current_mode = "chat"
                     st.rerun()
 
-def show_vocabulary_interface(lang_info):
-    """Display vocabulary building interface with AI-powered search"""
-    st.markdown(f"### 📖 {lang_info['name']} Vocabulary Builder")
-    
-    # Search vocabulary - AI-powered for ANY word
-    search_term = st.text_area(
-        "🔍 Search for ANY word or sentence:", 
-        placeholder=f"Enter any word, phrase, or sentence in English or {lang_info['name']}\nExample: 'What does beautiful mean?' or 'How do I say computer?'",
-        height=100
-    )
+def show_lexicon_result(lookup, lang_info):
+    """Display vocabulary entries found in the verified vocabulary"""
+    term = lookup['term']
+    if lookup['match'] == 'near':
+        st.success(f"⚡ Closest verified match for '{term}'")
+    else:
+        st.success(f"⚡ Answered from the verified vocabulary: '{term}'")
+
+    for i, entry in enumerate(lookup['entries']):
+        if lookup['match'] != 'exact' and lookup['direction'] == 'to_english':
+            st.caption(f"✏️ Correct spelling: **{entry['word']}**")
+
+        heading = f"<h4>{entry['word']}</h4>"
+        meaning = f"<p><strong>Meaning:</strong> {entry['meaning']}"
+        if entry['pos']:
+            meaning += f" <em>({entry['pos']})</em>"
+        meaning += "</p>"
+        details = "".join(f"<p><strong>{label}:</strong> {value}</p>" for label, value in entry['details'].items())
+        examples = ""
+        if entry['examples']:
+            examples = "<p><strong>Examples:</strong></p><ul>" + "".join(
+                f"<li>{example}</li>" for example in entry['examples']
+            ) + "</ul>"
+        st.markdown(f"""
+        <div class='feature-box'>
+            {heading}{meaning}{details}{examples}
+            <p><small>Source: {entry['source']}</small></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        if st.session_state.voice_enabled:
+            if st.button(f"🔊 Hear {entry['word']}", key=f"lexicon_audio_btn_{i}"):
+                audio = text_to_speech(entry['word'], lang_info['tts_lang'], lang_info.get('tts_backend'))
+                if audio:
+                    create_audio_player(audio, key=f"lexicon_audio_player_{i}")
+
+def ai_vocabulary_search(search_term, lang_info):
+    """Answer a vocabulary question the verified vocabulary does not cover"""
+    st.info("🤖 Using AI to search for your query...")
     
-    if search_term:
-        st.info("🤖 Using AI to search for your query...")
-        
-        # Use AI to answer ANY vocabulary question
-        with st.spinner("🔍 Searching..."):
-            try:
-                # Initialize LLM
-                llm = initialize_llm()
-                
-                # Create AI prompt for vocabulary search with anti-hallucination instructions
-                vocab_prompt = f"""You are a {lang_info['name']} language expert. Answer this vocabulary question:
+    # Use AI to answer ANY vocabulary question
+    with st.spinner("🔍 Searching..."):
+        try:
+            # Initialize LLM
+            llm = initialize_llm()
+            
+            # Create AI prompt for vocabulary search with anti-hallucination instructions
+            vocab_prompt = f"""You are a {lang_info['name']} language expert. Answer this vocabulary question:
 
 Question: {search_term}
 
@@ -1627,49 +1589,76 @@ If asking about multiple words, provide information for each.
 
 Format your response clearly with sections."""
 
-                response = llm.invoke(vocab_prompt)
-                answer = response.content
-                
-                # Validate for hallucinations if Gĩkũyũ
-                corrected_answer, had_errors, corrections = validate_gikuyu_response(answer, lang_info)
-                
-                # Display AI response
-                st.success(f"✅ Found information for: '{search_term}'")
-                
-                # Show hallucination warning if detected
-                if had_errors:
-                    st.warning("⚠️ Hallucination detected and corrected!")
-                    with st.expander("🔍 See what was corrected"):
-                        for correction in corrections:
-                            st.markdown(f"""
-                            <div class='correction-box'>
-                                <p>❌ <strong>Error:</strong> {correction['error']}</p>
-                                <p>✅ <strong>Correct:</strong> {correction['correct']}</p>
-                                <p>💡 {correction['note']}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    answer = corrected_answer
-                
-                st.markdown(f"""
-                <div class='feature-box'>
-                    {answer.replace(chr(10), '<br>')}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Add audio button if voice enabled
-                if st.session_state.voice_enabled:
-                    st.markdown("---")
-                    col1, col2, col3 = st.columns([1, 2, 1])
-                    with col2:
-                        if st.button(f"🔊 Hear pronunciation", key=f"vocab_audio_btn", use_container_width=True):
-                            # Extract the main word from the response for pronunciation
-                            audio = text_to_speech(search_term, lang_info['tts_lang'])
-                            if audio:
-                                create_audio_player(audio, key=f"vocab_audio_player")
-                
-            except Exception as e:
-                st.error(f"Error searching: {str(e)}")
-                st.info("Try rephrasing your question or check your internet connection.")
+            # Learners asking the same question at the same moment share one call
+            response = get_single_flight().do(prompt_key(llm, vocab_prompt), lambda: llm.invoke(vocab_prompt))
+            answer = response.content
+            
+            # Validate for hallucinations if Gĩkũyũ
+            corrected_answer, had_errors, corrections = validate_gikuyu_response(answer, lang_info)
+            
+            # Display AI response
+            st.success(f"✅ Found information for: '{search_term}'")
+            
+            # Show hallucination warning if detected
+            if had_errors:
+                st.warning("⚠️ Hallucination detected and corrected!")
+                with st.expander("🔍 See what was corrected"):
+                    for correction in corrections:
+                        st.markdown(f"""
+                        <div class='correction-box'>
+                            <p>❌ <strong>Error:</strong> {correction['error']}</p>
+                            <p>✅ <strong>Correct:</strong> {correction['correct']}</p>
+                            <p>💡 {correction['note']}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                answer = corrected_answer
+            
+            st.markdown(f"""
+            <div class='feature-box'>
+                {answer.replace(chr(10), '<br>')}
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Add audio button if voice enabled
+            if st.session_state.voice_enabled:
+                st.markdown("---")
+                col1, col2, col3 = st.columns([1, 2, 1])
+                with col2:
+                    if st.button(f"🔊 Hear pronunciation", key=f"vocab_audio_btn", use_container_width=True):
+                        # Extract the main word from the response for pronunciation
+                        audio = text_to_speech(search_term, lang_info['tts_lang'], lang_info.get('tts_backend'))
+                        if audio:
+                            create_audio_player(audio, key=f"vocab_audio_player")
+            
+        except Exception as e:
+            st.error(f"Error searching: {str(e)}")
+            st.info("Try rephrasing your question or check your internet connection.")
+
+def show_vocabulary_interface(lang_info):
+    """Display vocabulary building interface: verified vocabulary first, AI search for the rest"""
+    st.markdown(f"### 📖 {lang_info['name']} Vocabulary Builder")
+    
+    # Search vocabulary - AI-powered for ANY word
+    search_term = st.text_area(
+        "🔍 Search for ANY word or sentence:", 
+        placeholder=f"Enter any word, phrase, or sentence in English or {lang_info['name']}\nExample: 'What does beautiful mean?' or 'How do I say computer?'",
+        height=100
+    )
+    
+    if search_term:
+        lookup = get_lexicon_index(lang_info['name']).lookup(search_term)
+        if lookup:
+            # Words in the verified vocabulary are answered locally, with no LLM call
+            show_lexicon_result(lookup, lang_info)
+            if st.button("🤖 Ask the AI tutor instead", key="vocab_ask_ai"):
+                st.session_state.vocab_ai_term = search_term
+            # Stay on the AI answer across reruns (e.g. the pronunciation button)
+            ask_ai = st.session_state.get('vocab_ai_term') == search_term
+        else:
+            ask_ai = True
+
+        if ask_ai:
+            ai_vocabulary_search(search_term, lang_info)
     else:
         # Show helpful examples when no search
         st.info(f"""Try asking:
@@ -1687,25 +1676,7 @@ Format your response clearly with sections."""
     st.caption("Click a category to get common words in that area")
     
     # Different categories based on language with native names
-    if lang_info['name'] == "Kikuyu":
-        categories = {
-            "Bamirii": "family members like mother, father, sister, brother",
-            "Irio": "common foods and meals",
-            "Nyamu": "common animals"
-        }
-    elif lang_info['name'] == "Kiswahili":
-        categories = {
-            "Familia": "family members like mother, father, sister, brother",
-            "Vyakula": "common foods and meals",
-            "Wanyama": "common animals"
-        }
-    else:
-        # English
-        categories = {
-            "Family": "family members like mother, father, sister, brother",
-            "Food": "common foods and meals",
-            "Animals": "common animals"
-        }
+    categories = get_categories(lang_info['name'])
     
     cols = st.columns(3)
     
@@ -1729,23 +1700,13 @@ Format your response clearly with sections."""
             st.session_state.selected_vocab_category = None
             st.rerun()
         
-        # Use AI to generate vocabulary for this category
+        # Use AI to generate vocabulary for this category (once; later views read the category cache)
         with st.spinner(f"Loading {category} vocabulary..."):
             try:
-                llm = initialize_llm()
-                category_prompt = f"""List 10-15 common {description} in {lang_info['name']} with English translations.
-
-Format each entry as:
-- {lang_info['name']} word (English meaning)
-
-Example:
-- mtu (person)
-- nyumba (house)
-
-Provide clear, accurate translations."""
-
-                response = llm.invoke(category_prompt)
-                category_answer = response.content
+                category_answer = get_category_list(
+                    get_category_cache(), initialize_llm, lang_info['name'], category, description,
+                    single_flight=get_single_flight()
+                )
                 
                 # Validate for hallucinations if Gĩkũyũ
                 corrected_answer, had_errors, corrections = validate_gikuyu_response(category_answer, lang_info)
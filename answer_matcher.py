@@ -0,0 +1,209 @@
+"""
+Diacritic- and typo-tolerant quiz answer matching
+Acceptable answers are compiled once into normalized and diacritic-folded forms plus
+the bit masks for Myers' bit-parallel edit distance, so grading an answer is a couple
+of set lookups and, at worst, one O(n) bit-vector pass per candidate answer
+"""
+
+import re
+import unicodedata
+from typing import AbstractSet, Dict, Iterable, List, Optional, Tuple
+
+# Punctuation other than in-word apostrophes and hyphens is ignored
+_KEEP_PUNCTUATION = {"'", "-"}
+_OPTIONS = re.compile(r"\(([^()]*/[^()]*)\)\s*$")
+
+
+def normalize_answer(answer: str) -> str:
+    """Comparison form of an answer: NFC, case-folded, punctuation and extra spacing removed"""
+    text = unicodedata.normalize("NFC", answer).casefold().replace("’", "'").replace("‘", "'")
+    text = "".join(" " if unicodedata.category(char).startswith("P") and char not in _KEEP_PUNCTUATION else char
+                   for char in text)
+    return " ".join(text.split())
+
+
+def fold_diacritics(text: str) -> str:
+    """Drop combining marks: "mwarimũ" -> "mwarimu" """
+    decomposed = unicodedata.normalize("NFD", text)
+    return unicodedata.normalize("NFC", "".join(char for char in decomposed if unicodedata.category(char) != "Mn"))
+
+
+def fold_answer(answer: str) -> str:
+    return fold_diacritics(normalize_answer(answer))
+
+
+def default_max_edits(answer: str) -> int:
+    """Typos tolerated for an answer of this length; short words and numbers must be exact"""
+    if answer.isdigit() or len(answer) <= 3:
+        return 0
+    if len(answer) <= 6:
+        return 1
+    return 2
+
+
+def question_words(question: str) -> List[str]:
+    """The words of the question text: "Wingi wa kitabu ni" -> wingi, wa, kitabu, ni"""
+    return normalize_answer(question).split()
+
+
+def question_options(question: str) -> List[str]:
+    """The choices offered in a trailing "(a/b)" of the question text, e.g. "(niarathire/niathire)" """
+    match = _OPTIONS.search(question)
+    if not match:
+        return []
+    return [option.strip() for option in match.group(1).split("/") if option.strip()]
+
+
+# ============================================
+# Myers bit-parallel edit distance
+# ============================================
+
+def pattern_masks(pattern: str) -> Dict[str, int]:
+    """Peq table: for each character, the bit set of its positions in the pattern"""
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def bounded_edit_distance(masks: Dict[str, int], length: int, text: str, max_distance: int) -> int:
+    """
+    Levenshtein distance between the pattern behind masks and text (Myers 1999, in
+    Hyyrö's formulation), or max_distance + 1 as soon as it must exceed max_distance
+    The whole pattern column is one Python int, so this is O(len(text)) big-int steps
+    """
+    if length == 0:
+        return min(len(text), max_distance + 1)
+    if abs(length - len(text)) > max_distance:
+        return max_distance + 1
+
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    positive, negative = full, 0
+    score = length
+    remaining = len(text)
+    for char in text:
+        remaining -= 1
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | (~(horizontal | positive) & full)
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last:
+            score += 1
+        elif horizontal_negative & last:
+            score -= 1
+        # Global alignment: the top row counts up, so a 1 is carried into each column
+        horizontal_positive = (horizontal_positive << 1) | 1
+        horizontal_negative <<= 1
+        positive = (horizontal_negative | ~(vertical | horizontal_positive)) & full
+        negative = horizontal_positive & vertical & full
+        # Each remaining character can lower the score by at most one
+        if score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+# ============================================
+# Matcher
+# ============================================
+
+class MatchResult:
+    """How an answer was graded: kind is "exact", "diacritics" or "typo" when correct, "" otherwise"""
+
+    __slots__ = ("correct", "kind", "matched", "distance")
+
+    def __init__(self, correct: bool, kind: str = "", matched: Optional[str] = None, distance: int = 0):
+        self.correct = correct
+        self.kind = kind
+        self.matched = matched
+        self.distance = distance
+
+    def __bool__(self) -> bool:
+        return self.correct
+
+    def __repr__(self) -> str:
+        return f"MatchResult(correct={self.correct}, kind={self.kind!r}, matched={self.matched!r}, distance={self.distance})"
+
+
+NO_MATCH = MatchResult(False)
+
+
+class AnswerMatcher:
+    """
+    Precompiled grader for one question
+    Typos are only tolerated when the question opts in: max_edits caps them (0: exact
+    spelling, None: by answer length). A typo is not accepted when it is at least as
+    close to a distractor (a wrong option or a word of the question) as to an answer,
+    or when it is itself a real word (known_words, in fold_answer form)
+    """
+
+    __slots__ = ("_exact", "_folded", "_candidates", "_distractors", "_known_words", "max_edits")
+
+    def __init__(self, answers: Iterable[str], distractors: Iterable[str] = (), max_edits: Optional[int] = 0,
+                 known_words: AbstractSet[str] = frozenset()):
+        self.max_edits = max_edits
+        self._exact: Dict[str, str] = {}
+        self._folded: Dict[str, str] = {}
+        # (folded answer, Myers masks, typo budget, original answer)
+        self._candidates: List[Tuple[str, Dict[str, int], int, str]] = []
+        for answer in answers:
+            normalized = normalize_answer(answer)
+            if not normalized or normalized in self._exact:
+                continue
+            folded = fold_diacritics(normalized)
+            self._exact[normalized] = answer
+            self._folded.setdefault(folded, answer)
+            budget = default_max_edits(folded)
+            if max_edits is not None:
+                budget = min(budget, max_edits)
+            if budget > 0 and all(candidate[0] != folded for candidate in self._candidates):
+                self._candidates.append((folded, pattern_masks(folded), budget, answer))
+
+        self._distractors = [(folded, pattern_masks(folded)) for folded in
+                             dict.fromkeys(fold_answer(option) for option in distractors)
+                             if folded and folded not in self._folded]
+        self._known_words = known_words
+
+    @classmethod
+    def for_question(cls, question: str, answers: Iterable[str], max_edits: Optional[int] = 0,
+                     known_words: AbstractSet[str] = frozenset()) -> "AnswerMatcher":
+        """
+        Matcher whose distractors are the question's "(a/b)" options and words that are not answers
+        ("kitabu" is not a typo of "vitabu" when the question asks for the plural of kitabu)
+        """
+        distractors = question_options(question) + question_words(question)
+        return cls(answers, distractors=distractors, max_edits=max_edits, known_words=known_words)
+
+    def _closer_distractor(self, folded: str, distance: int) -> bool:
+        return any(bounded_edit_distance(masks, len(option), folded, distance) <= distance
+                   for option, masks in self._distractors)
+
+    def _real_word(self, folded: str, candidate: str) -> bool:
+        """A misspelt word that is a word of its own ("horse" for "house") is a different answer"""
+        candidate_words = set(candidate.split())
+        return any(word in self._known_words for word in folded.split() if word not in candidate_words)
+
+    def match(self, answer: str) -> MatchResult:
+        normalized = normalize_answer(answer)
+        if not normalized:
+            return NO_MATCH
+        if normalized in self._exact:
+            return MatchResult(True, "exact", self._exact[normalized])
+
+        folded = fold_diacritics(normalized)
+        if folded in self._folded:
+            return MatchResult(True, "diacritics", self._folded[folded])
+
+        best: Optional[Tuple[int, str, str]] = None
+        for candidate, masks, budget, original in self._candidates:
+            if best is not None:
+                budget = min(budget, best[0] - 1)
+            distance = bounded_edit_distance(masks, len(candidate), folded, budget)
+            if distance <= budget:
+                best = (distance, original, candidate)
+                if distance == 1:
+                    break
+        if best is None or self._closer_distractor(folded, best[0]) or self._real_word(folded, best[2]):
+            return NO_MATCH
+        return MatchResult(True, "typo", best[1], best[0])
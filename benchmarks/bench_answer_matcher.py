@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: quiz answer grading with the precompiled, typo-tolerant matcher
+Grades exact, diacritic-less and misspelt answers against growing acceptable-answer
+lists and compares the bit-parallel edit distance with a plain dynamic-programming one
+
+Usage: python benchmarks/bench_answer_matcher.py --answers 1 10 100 --trials 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from answer_matcher import AnswerMatcher, bounded_edit_distance, fold_answer, pattern_masks
+
+LETTERS = "abcdefghijkmnortuwyĩũ"
+
+
+def dp_edit_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def misspell(word, rng):
+    position = rng.randrange(len(word))
+    edit = rng.choice(("replace", "delete", "insert"))
+    if edit == "replace":
+        return word[:position] + rng.choice(LETTERS) + word[position + 1:]
+    if edit == "delete":
+        return word[:position] + word[position + 1:]
+    return word[:position] + rng.choice(LETTERS) + word[position:]
+
+
+def random_word(rng):
+    return "".join(rng.choice(LETTERS) for _ in range(rng.randrange(5, 14)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark typo-tolerant quiz answer matching")
+    parser.add_argument("--answers", type=int, nargs="*", default=[1, 10, 100])
+    parser.add_argument("--trials", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print("=" * 60)
+    print("✏️  Answer Matcher Benchmark")
+    print("=" * 60)
+    print(f"{'Answers':>8}{'Compile µs':>12}{'Exact µs':>10}{'Folded µs':>11}{'Typo µs':>10}{'Wrong µs':>10}")
+    print("-" * 61)
+    for count in args.answers:
+        answers = [random_word(rng) for _ in range(count)]
+        start = time.perf_counter()
+        matcher = AnswerMatcher(answers, max_edits=None)
+        compile_us = (time.perf_counter() - start) * 1e6
+
+        samples = {
+            "exact": [rng.choice(answers) for _ in range(args.trials)],
+            "folded": [fold_answer(rng.choice(answers)) for _ in range(args.trials)],
+            "typo": [misspell(rng.choice(answers), rng) for _ in range(args.trials)],
+            "wrong": [random_word(rng) for _ in range(args.trials)],
+        }
+        timings = {}
+        for kind, inputs in samples.items():
+            start = time.perf_counter()
+            for answer in inputs:
+                matcher.match(answer)
+            timings[kind] = (time.perf_counter() - start) / len(inputs) * 1e6
+        print(f"{count:>8}{compile_us:>12.0f}{timings['exact']:>10.2f}{timings['folded']:>11.2f}"
+              f"{timings['typo']:>10.2f}{timings['wrong']:>10.2f}")
+
+    # Edit distance kernels on the same word pairs
+    pairs = [(random_word(rng), random_word(rng)) for _ in range(args.trials)]
+    masks = [(pattern_masks(a), len(a), b) for a, b in pairs]
+    start = time.perf_counter()
+    myers = [bounded_edit_distance(m, length, b, 20) for m, length, b in masks]
+    myers_us = (time.perf_counter() - start) / len(pairs) * 1e6
+    start = time.perf_counter()
+    dp = [dp_edit_distance(a, b) for a, b in pairs]
+    dp_us = (time.perf_counter() - start) / len(pairs) * 1e6
+    start = time.perf_counter()
+    for m, length, b in masks:
+        bounded_edit_distance(m, length, b, 2)
+    bounded_us = (time.perf_counter() - start) / len(pairs) * 1e6
+
+    print(f"\n📏 Edit distance: Myers {myers_us:.2f} µs, Myers bounded to 2 {bounded_us:.2f} µs, "
+          f"dynamic programming {dp_us:.2f} µs (agree: {myers == dp})")
+
+
+if __name__ == "__main__":
+    main()
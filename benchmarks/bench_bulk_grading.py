@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bulk grading throughput for classroom submission files
+Generates a JSONL file of submissions against the curated quiz bank (correct,
+diacritic-less, misspelt and wrong answers from many students) and grades it with
+one process and with a process pool
+
+Usage: python benchmarks/bench_bulk_grading.py --submissions 500000 --workers 1 4
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from answer_matcher import fold_answer
+from quiz_bank import load_quiz_bank
+from quiz_grading import grade_file
+
+
+def write_submissions(path, count, students, rng):
+    bank = load_quiz_bank()
+    items = [item for language in bank.languages() for item in bank.questions(language)]
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            item = rng.choice(items)
+            answer = rng.choice(item.acceptable_answers)
+            roll = rng.random()
+            if roll < 0.2:
+                answer = fold_answer(answer).upper()
+            elif roll < 0.3 and len(answer) > 4:
+                position = rng.randrange(len(answer))
+                answer = answer[:position] + answer[position + 1:]
+            elif roll < 0.5:
+                answer = rng.choice(("sijui", "i don't know", "ndiĩũĩ", answer[::-1]))
+            f.write(json.dumps({"student_id": f"s{i % students}", "language": item.language,
+                                "question_id": item.id, "user_answer": answer}, ensure_ascii=False) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk quiz grading")
+    parser.add_argument("--submissions", type=int, default=500000)
+    parser.add_argument("--students", type=int, default=3000)
+    parser.add_argument("--workers", type=int, nargs="*", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📝 Bulk Grading Benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "submissions.jsonl")
+        write_submissions(path, args.submissions, args.students, random.Random(args.seed))
+        print(f"📦 {args.submissions:,} submissions from {args.students:,} students "
+              f"({os.path.getsize(path) / 1024 / 1024:.1f} MB)\n")
+
+        print(f"{'Workers':>8}{'Seconds':>10}{'Per minute':>14}{'Accuracy':>10}")
+        print("-" * 42)
+        for workers in args.workers:
+            start = time.perf_counter()
+            report = grade_file(path, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>8}{elapsed:>10.2f}{report['submissions'] / elapsed * 60:>14,.0f}"
+                  f"{report['accuracy']:>10.1%}")
+
+    hardest = min(report["questions"], key=lambda question: question["accuracy"])
+    print(f"\n📉 Hardest question: {hardest['language']} #{hardest['question_id']} "
+          f"({hardest['accuracy']:.0%}, accepted by {hardest['accepted_by']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: prompt context tokens with and without overlap removal and a token budget
+Splits each language's knowledge base with the app's splitter settings and simulates
+top-k retrieval results (runs of neighbouring chunks and random chunk sets)
+
+Usage: python benchmarks/bench_context_assembly.py --k 5 --budget 600
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from context_assembly import SEPARATOR, assemble_context
+from knowledge_base import CHUNK_OVERLAP, CHUNK_SIZE, knowledge_to_text, load_language_knowledge_from_json
+from language_config import SUPPORTED_LANGUAGES
+from token_counter import count_tokens, is_exact
+
+
+def simulated_retrievals(chunks, k, samples, rng):
+    """Neighbouring runs (typical for a focused question) plus random sets"""
+    retrievals = []
+    for _ in range(samples):
+        if len(chunks) <= k:
+            retrievals.append(list(chunks))
+        elif rng.random() < 0.5:
+            start = rng.randrange(len(chunks) - k + 1)
+            run = chunks[start:start + k]
+            rng.shuffle(run)
+            retrievals.append(run)
+        else:
+            retrievals.append(rng.sample(chunks, k))
+    return retrievals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark token-budgeted context assembly")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--budget", type=int, default=600)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+
+    print("=" * 60)
+    print("📦 Context Assembly Benchmark")
+    print("=" * 60)
+    if not is_exact():
+        print("⚠️  tiktoken encoding unavailable - counts are ~4 chars/token estimates")
+    print(f"k={args.k}, budget={args.budget} tokens, {args.samples} simulated retrievals per language\n")
+    print(f"{'Language':<12}{'Chunks':>8}{'Before':>10}{'After':>10}{'Saved':>9}{'ms/call':>10}")
+
+    for language in SUPPORTED_LANGUAGES:
+        text = knowledge_to_text(language, load_language_knowledge_from_json(language))
+        chunks = splitter.split_text(text)
+        retrievals = simulated_retrievals(chunks, args.k, args.samples, rng)
+
+        before = after = 0
+        start = time.perf_counter()
+        for retrieved in retrievals:
+            _, stats = assemble_context(retrieved, token_budget=args.budget)
+            after += stats["tokens_after"]
+        elapsed = time.perf_counter() - start
+        before = sum(count_tokens(SEPARATOR.join(retrieved)) for retrieved in retrievals)
+
+        saved = 1 - after / before if before else 0.0
+        print(f"{language:<12}{len(chunks):>8}{before / len(retrievals):>10.0f}{after / len(retrievals):>10.0f}"
+              f"{saved:>8.0%}{elapsed / len(retrievals) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
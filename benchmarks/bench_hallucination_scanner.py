@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled hallucination scanner vs the per-word regex loop
+Uses a large synthetic blacklist and long synthetic responses
+
+Usage: python benchmarks/bench_hallucination_scanner.py --blacklist-size 5000 --response-words 3000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hallucination_filter import HallucinationScanner
+
+SYLLABLES = ["ka", "ki", "ku", "ma", "mi", "mu", "nya", "ngo", "tha", "wa", "ri", "ci", "ũ", "ĩ", "ha", "ba", "re"]
+
+
+def synthetic_word(rng, min_syllables=2, max_syllables=4):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(min_syllables, max_syllables)))
+
+
+def build_blacklist(rng, size):
+    blacklist = {}
+    while len(blacklist) < size:
+        word = synthetic_word(rng, 2, 5)
+        # The "gũ" prefix cannot be built from SYLLABLES, so corrections are never blacklisted
+        blacklist[word] = {"correct": "gũ" + synthetic_word(rng), "note": "synthetic entry"}
+    return blacklist
+
+
+def build_response(rng, blacklist_words, num_words, hit_rate):
+    words = []
+    for _ in range(num_words):
+        if rng.random() < hit_rate:
+            word = rng.choice(blacklist_words)
+            words.append(word.capitalize() if rng.random() < 0.2 else word)
+        else:
+            words.append(synthetic_word(rng, 1, 3))
+    return " ".join(words)
+
+
+def legacy_validate(text, blacklist):
+    """The original detect + per-correction re.sub loop"""
+    text_lower = text.lower()
+    corrections = []
+    for word, info in blacklist.items():
+        pattern = r'\b' + re.escape(word) + r'\b'
+        if re.search(pattern, text_lower):
+            corrections.append({"error": word, "correct": info["correct"], "note": info["note"]})
+
+    corrected_text = text
+    for correction in corrections:
+        pattern = r'\b' + re.escape(correction["error"]) + r'\b'
+        corrected_text = re.sub(pattern, correction["correct"], corrected_text, flags=re.IGNORECASE)
+    return corrected_text, corrections
+
+
+def time_it(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Gĩkũyũ hallucination scanner")
+    parser.add_argument("--blacklist-size", type=int, default=5000)
+    parser.add_argument("--response-words", type=int, default=3000)
+    parser.add_argument("--responses", type=int, default=20)
+    parser.add_argument("--hit-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    blacklist = build_blacklist(rng, args.blacklist_size)
+    words = list(blacklist)
+    responses = [build_response(rng, words, args.response_words, args.hit_rate) for _ in range(args.responses)]
+
+    print("=" * 60)
+    print("🔍 Hallucination Scanner Benchmark")
+    print("=" * 60)
+    print(f"Blacklist entries: {len(blacklist)}")
+    print(f"Responses: {len(responses)} x {args.response_words} words")
+
+    build_time, scanner = time_it(lambda: HallucinationScanner(blacklist), 1)
+    print(f"\nCompile time (once per process): {build_time * 1000:.1f} ms")
+
+    legacy_time, legacy_results = time_it(lambda: [legacy_validate(r, blacklist) for r in responses], 1)
+    compiled_time, compiled_results = time_it(lambda: [scanner.correct(r) for r in responses], 5)
+
+    mismatches = sum(
+        1 for legacy, compiled in zip(legacy_results, compiled_results)
+        if legacy[0] != compiled[0] or [c["error"] for c in legacy[1]] != [c["error"] for c in compiled[1]]
+    )
+
+    per_legacy = legacy_time / len(responses) * 1000
+    per_compiled = compiled_time / len(responses) * 1000
+    print(f"\nLegacy per-word loop:  {per_legacy:.2f} ms/response")
+    print(f"Compiled scanner:      {per_compiled:.3f} ms/response")
+    print(f"Speedup:               {per_legacy / per_compiled:.0f}x")
+    print(f"Output mismatches:     {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: quiz bank loading, indexed sampling and grading at large bank sizes
+Generates a synthetic bank (spread over languages, categories and difficulties),
+writes it as JSONL, loads it into the indexed store and compares session sampling
+with the old approach of rebuilding and filtering the full question list per quiz
+
+Usage: python benchmarks/bench_quiz_bank.py --items 100000 --sessions 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from quiz_bank import load_quiz_bank
+
+LANGUAGES = ["Kiswahili", "Kikuyu", "English"]
+CATEGORIES = ["Grammar", "Translation", "Vocabulary", "Numbers"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+
+def synthetic_records(language, count, rng):
+    for question_id in range(1, count + 1):
+        answer = f"answer{rng.randrange(count)}"
+        yield {
+            "id": question_id,
+            "question": f"{language} question {question_id}",
+            "category": rng.choice(CATEGORIES),
+            "difficulty": rng.choice(DIFFICULTIES),
+            "correct_answer": answer,
+            "acceptable_answers": [answer, answer.upper(), f"{answer} alt"]
+        }
+
+
+def write_bank(directory, items, rng):
+    per_language = items // len(LANGUAGES)
+    records = {}
+    for language in LANGUAGES:
+        records[language] = list(synthetic_records(language, per_language, rng))
+        with open(os.path.join(directory, f"{language.lower()}.jsonl"), 'w', encoding='utf-8') as f:
+            for record in records[language]:
+                f.write(json.dumps(record) + "\n")
+    return records
+
+
+def naive_quiz(records, language, category, count, rng):
+    """The old shape: a fresh list of dicts per call, filtered, then sampled"""
+    questions = [dict(record, language=language) for record in records[language]]
+    if category:
+        questions = [q for q in questions if q["category"] == category]
+    return rng.sample(questions, count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the indexed quiz bank")
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--quiz-size", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print("=" * 60)
+    print("🎯 Quiz Bank Benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        records = write_bank(directory, args.items, rng)
+        tracemalloc.start()
+        start = time.perf_counter()
+        bank = load_quiz_bank(directory)
+        load_s = time.perf_counter() - start
+        memory_mb = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+    print(f"📦 Loaded {len(bank):,} questions in {load_s:.2f}s ({memory_mb:.1f} MB)\n")
+
+    print(f"{'Pool':<28}{'Indexed µs/quiz':>16}{'Naive µs/quiz':>16}{'Speedup':>10}")
+    print("-" * 70)
+    naive_sessions = max(1, args.sessions // 100)
+    for language, category in [("Kiswahili", None), ("Kikuyu", "Grammar"), ("English", "Numbers")]:
+        start = time.perf_counter()
+        for session in range(args.sessions):
+            sampler = bank.sampler(language, category, seed=session)
+            # Two quizzes per session, as with "Continue with 5 More Questions"
+            first, second = sampler.draw(args.quiz_size), sampler.draw(args.quiz_size)
+            assert not {id(q) for q in first} & {id(q) for q in second}
+        indexed_us = (time.perf_counter() - start) / (args.sessions * 2) * 1e6
+
+        start = time.perf_counter()
+        for _ in range(naive_sessions * 2):
+            naive_quiz(records, language, category, args.quiz_size, rng)
+        naive_us = (time.perf_counter() - start) / (naive_sessions * 2) * 1e6
+
+        label = f"{language}/{category or 'all'}"
+        print(f"{label:<28}{indexed_us:>16.1f}{naive_us:>16.0f}{naive_us / indexed_us:>9.0f}x")
+
+    # Full pass: every question once before any repeat
+    sampler = bank.sampler("Kikuyu", seed=args.seed)
+    pool_size = sampler.remaining
+    start = time.perf_counter()
+    seen = {item.id for item in sampler.draw(pool_size)}
+    full_s = time.perf_counter() - start
+    print(f"\n🔁 Drew all {pool_size:,} Kikuyu questions without repeats: {len(seen) == pool_size} "
+          f"({full_s * 1e6 / pool_size:.2f} µs/question)")
+
+    items = bank.questions("English")
+    answers = [(item, rng.choice(item.acceptable_answers)) for item in rng.sample(items, min(len(items), 20000))]
+    start = time.perf_counter()
+    correct = sum(item.is_correct(answer) for item, answer in answers)
+    grade_us = (time.perf_counter() - start) / len(answers) * 1e6
+    print(f"✅ Graded {len(answers):,} answers ({correct:,} correct): {grade_us:.2f} µs/answer")
+
+
+if __name__ == "__main__":
+    main()
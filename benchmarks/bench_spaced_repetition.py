@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: spaced-repetition selection as a learner's review history grows
+Compares the heap-backed scheduler with sorting every item state by due time
+on each quiz, for learners with thousands of reviewed questions
+
+Usage: python benchmarks/bench_spaced_repetition.py --items 1000 10000 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from spaced_repetition import DAY_SECONDS, ReviewScheduler, ReviewStore
+
+
+def build_history(count, now, rng):
+    scheduler = ReviewScheduler()
+    for item_id in range(count):
+        # Spread earlier reviews over the last two months
+        reviewed_at = now - rng.random() * 60 * DAY_SECONDS
+        for _ in range(rng.randrange(1, 4)):
+            scheduler.review(item_id, rng.choice((1, 4, 5, 5)), reviewed_at)
+    return scheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the spaced-repetition scheduler")
+    parser.add_argument("--items", type=int, nargs="*", default=[1000, 10000, 100000])
+    parser.add_argument("--quizzes", type=int, default=200)
+    parser.add_argument("--quiz-size", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    now = time.time()
+
+    print("=" * 60)
+    print("🔁 Spaced Repetition Benchmark")
+    print("=" * 60)
+    print(f"{'Items':>8}{'Due':>8}{'Heap µs/quiz':>14}{'Sort µs/quiz':>14}{'Review µs':>11}")
+    print("-" * 55)
+    for count in args.items:
+        scheduler = build_history(count, now, rng)
+        due = scheduler.due_count(now)
+
+        # Each quiz picks the due items, then answers them (one review each)
+        start = time.perf_counter()
+        for _ in range(args.quizzes):
+            scheduler.next_items(args.quiz_size, now)
+        heap_us = (time.perf_counter() - start) / args.quizzes * 1e6
+
+        start = time.perf_counter()
+        for _ in range(args.quizzes):
+            ordered = sorted(scheduler.states.values(), key=lambda state: state.due)
+            [state.item_id for state in ordered[:args.quiz_size] if state.due <= now]
+        sort_us = (time.perf_counter() - start) / args.quizzes * 1e6
+
+        start = time.perf_counter()
+        for _ in range(args.quizzes):
+            for item_id in scheduler.next_items(args.quiz_size, now, due_only=False):
+                scheduler.review(item_id, rng.choice((1, 4, 5)), now)
+        review_us = (time.perf_counter() - start) / (args.quizzes * args.quiz_size) * 1e6
+
+        print(f"{count:>8,}{due:>8,}{heap_us:>14.1f}{sort_us:>14.0f}{review_us:>11.1f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ReviewStore(os.path.join(directory, "reviews.sqlite3"))
+        for state in scheduler.states.values():
+            store.save("bench", "Kikuyu", state)
+        start = time.perf_counter()
+        loaded = store.load("bench", "Kikuyu")
+        load_ms = (time.perf_counter() - start) * 1000
+    print(f"\n💾 Reloaded {len(loaded):,} item states from SQLite in {load_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: real-time factor (processing time / audio duration) of each speech recognizer
+Clips go through the same in-memory preparation as the app (16 kHz mono, silence trimmed).
+Without clip arguments, sample clips are synthesized with the local espeak-ng TTS backend
+
+Usage: python benchmarks/bench_stt_backends.py [clip.wav ...] --backends google whisper --lang sw-KE
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from stt_engine import STT_BACKENDS, TARGET_SAMPLE_RATE, NoSpeechError, prepare_audio
+from tts_engine import TTS_BACKENDS
+
+SAMPLE_TEXTS = [
+    "Habari za asubuhi? Mimi ni mwanafunzi wa Kiswahili.",
+    "Ninapenda kusoma vitabu na kunywa chai.",
+    "Good morning! Today we will practise greetings and numbers.",
+]
+
+
+def load_clips(paths):
+    if paths:
+        clips = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                clips.append((os.path.basename(path), f.read()))
+        return clips
+
+    espeak = TTS_BACKENDS["espeak"]
+    if not espeak.available():
+        return []
+    return [(f"espeak-{i}", espeak.synthesize(text, "sw")) for i, text in enumerate(SAMPLE_TEXTS, 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark speech recognizer real-time factor")
+    parser.add_argument("clips", nargs="*", help="WAV files (default: synthesized with espeak-ng)")
+    parser.add_argument("--backends", nargs="*", default=list(STT_BACKENDS))
+    parser.add_argument("--lang", default="sw-KE", help="BCP-47 recognition language")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    clips = load_clips(args.clips)
+    if not clips:
+        print("❌ No clips: pass WAV files or install espeak-ng to synthesize samples")
+        return
+
+    prepared = [(name, *prepare_audio(data)) for name, data in clips]
+    speech_seconds = sum(stats["speech_seconds"] for _, _, stats in prepared)
+
+    print("=" * 60)
+    print("🎧 STT Backend Benchmark")
+    print("=" * 60)
+    print(f"{len(prepared)} clips, {speech_seconds:.1f}s of speech after trimming, lang={args.lang}\n")
+    print(f"{'Backend':<10}{'Load s':>9}{'RTF mean':>10}{'RTF p95':>10}{'ms/clip':>10}")
+
+    for name in args.backends:
+        backend = STT_BACKENDS.get(name)
+        if backend is None:
+            print(f"{name:<10}  ❌ unknown backend")
+            continue
+        if not backend.available():
+            print(f"{name:<10}  ⚠️  not installed, skipped")
+            continue
+
+        load_seconds = 0.0
+        if hasattr(backend, "load"):
+            start = time.perf_counter()
+            try:
+                backend.load()
+            except Exception as e:
+                print(f"{name:<10}  ❌ {e}")
+                continue
+            load_seconds = time.perf_counter() - start
+
+        factors, timings = [], []
+        try:
+            for _ in range(args.repeat):
+                for clip_name, pcm, stats in prepared:
+                    if not pcm:
+                        continue
+                    start = time.perf_counter()
+                    try:
+                        backend.transcribe(pcm, TARGET_SAMPLE_RATE, args.lang)
+                    except NoSpeechError:
+                        # Unintelligible clips still cost a full recognition
+                        pass
+                    elapsed = time.perf_counter() - start
+                    timings.append(elapsed)
+                    factors.append(elapsed / stats["speech_seconds"])
+        except Exception as e:
+            print(f"{name:<10}  ❌ {e}")
+            continue
+
+        factors.sort()
+        p95 = factors[min(len(factors) - 1, int(0.95 * len(factors)))]
+        print(f"{name:<10}{load_seconds:>9.1f}{statistics.mean(factors):>10.2f}{p95:>10.2f}"
+              f"{statistics.mean(timings) * 1000:>10.0f}")
+
+    print("\nRTF < 1 means faster than real time; load time is paid once per process")
+
+
+if __name__ == "__main__":
+    main()
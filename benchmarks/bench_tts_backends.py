@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: synthesis latency and throughput for each TTS backend
+Latency is measured one utterance at a time; throughput with a pool of concurrent workers.
+The audio cache is bypassed so every call is a real synthesis
+
+Usage: python benchmarks/bench_tts_backends.py --backends gtts espeak --repeat 3 --workers 4
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from language_config import SUPPORTED_LANGUAGES
+from tts_engine import TTS_BACKENDS
+
+SAMPLE_TEXTS = [
+    SUPPORTED_LANGUAGES["Kiswahili"]["greeting"],
+    "Habari za asubuhi? Mimi ni mwanafunzi wa Kiswahili.",
+    SUPPORTED_LANGUAGES["Kikuyu"]["greeting"],
+    "Nĩ wega mũno. Mũndũ ũcio nĩ mũrutani mwega.",
+    "Good morning! Today we will practise greetings and numbers.",
+]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_sequential(backend, texts, tts_lang):
+    latencies, total_bytes = [], 0
+    for text in texts:
+        start = time.perf_counter()
+        total_bytes += len(backend.synthesize(text, tts_lang))
+        latencies.append(time.perf_counter() - start)
+    return latencies, total_bytes
+
+
+def run_concurrent(backend, texts, tts_lang, workers):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda text: backend.synthesize(text, tts_lang), texts))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TTS backends")
+    parser.add_argument("--backends", nargs="*", default=list(TTS_BACKENDS))
+    parser.add_argument("--lang", default="sw", help="tts_lang code passed to each backend")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the sample texts")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    texts = SAMPLE_TEXTS * args.repeat
+
+    print("=" * 60)
+    print("🔊 TTS Backend Benchmark")
+    print("=" * 60)
+    print(f"{len(texts)} utterances, lang={args.lang}, {args.workers} concurrent workers\n")
+    print(f"{'Backend':<10}{'p50 ms':>10}{'p95 ms':>10}{'KB/utt':>10}{'utt/s seq':>12}{'utt/s par':>12}")
+
+    for name in args.backends:
+        backend = TTS_BACKENDS.get(name)
+        if backend is None:
+            print(f"{name:<10}  ❌ unknown backend")
+            continue
+        if not backend.available():
+            print(f"{name:<10}  ⚠️  not installed, skipped")
+            continue
+
+        try:
+            # Warm-up call so one-off setup cost is not counted
+            backend.synthesize(texts[0], args.lang)
+            latencies, total_bytes = run_sequential(backend, texts, args.lang)
+            elapsed = run_concurrent(backend, texts, args.lang, args.workers)
+        except Exception as e:
+            print(f"{name:<10}  ❌ {e}")
+            continue
+
+        print(f"{name:<10}{statistics.median(latencies) * 1000:>10.0f}{percentile(latencies, 0.95) * 1000:>10.0f}"
+              f"{total_bytes / len(texts) / 1024:>10.1f}{len(texts) / sum(latencies):>12.1f}"
+              f"{len(texts) / elapsed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
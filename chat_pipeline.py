@@ -0,0 +1,341 @@
+"""
+Asynchronous chat pipeline
+Runs retrieval, the LLM call, hallucination correction and speech synthesis as
+overlapping asyncio stages on one long-lived event loop: the query is embedded and
+searched while the request is prepared, corrected text is released as it streams,
+and each sentence is sent to TTS as soon as it is final. The calling thread receives
+ordered events (text, audio, done) and does all rendering itself
+"""
+
+import asyncio
+import queue
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from context_assembly import assemble_context
+from hallucination_filter import HallucinationScanner, StreamingHallucinationFilter
+from single_flight import SingleFlight, prompt_key
+from tts_engine import MAX_CHUNK_CHARS, split_sentences
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# Speech can start once a sentence has ended in the released text
+_SENTENCE_BOUNDARY = re.compile(r"[.!?…](?=\s)|\n")
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Process-wide event loop on a daemon thread
+    Async HTTP clients are bound to the loop that first used them, so every
+    pipeline run shares this one instead of creating a loop per request
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="chat-pipeline", daemon=True).start()
+        return _loop
+
+
+class StageTimer:
+    """Start/end offsets of each pipeline stage, to show how much the stages overlap"""
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._stages: Dict[str, List[float]] = {}
+        self._marks: Dict[str, float] = {}
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000
+
+    def start(self, stage: str) -> None:
+        self._stages.setdefault(stage, [self._now(), self._now()])
+
+    def end(self, stage: str) -> None:
+        if stage in self._stages:
+            self._stages[stage][1] = self._now()
+
+    def mark(self, event: str) -> None:
+        self._marks.setdefault(event, self._now())
+
+    def report(self) -> Dict[str, Any]:
+        total = self._now()
+        stages = {name: {"start_ms": start, "end_ms": end, "ms": end - start}
+                  for name, (start, end) in self._stages.items()}
+        stages_sum = sum(stage["ms"] for stage in stages.values())
+        return {
+            "stages": stages,
+            "marks": dict(self._marks),
+            "total_ms": total,
+            "stages_sum_ms": stages_sum,
+            # Time saved versus running the same stages one after another
+            "overlap_ms": max(0.0, stages_sum - total)
+        }
+
+
+class ChatRequest:
+    """Everything one pipeline run needs"""
+
+    __slots__ = ("query", "language", "tutor_prompt", "llm", "vectorstore", "embeddings", "response_cache",
+                 "retrieval_k", "token_budget", "use_mmr", "mmr_lambda", "scanner", "stream", "speak",
+                 "fallback_instruction", "single_flight")
+
+    def __init__(self, query: str, language: str, tutor_prompt: Dict[str, Any], llm, vectorstore=None,
+                 embeddings=None, response_cache=None, retrieval_k: int = 3, token_budget: int = 600,
+                 use_mmr: bool = False, mmr_lambda: float = 0.5, scanner: Optional[HallucinationScanner] = None,
+                 stream: bool = True, speak: Optional[Callable[[str], Any]] = None,
+                 fallback_instruction: str = "", single_flight: Optional[SingleFlight] = None):
+        self.query = query
+        self.language = language
+        self.tutor_prompt = tutor_prompt
+        self.llm = llm
+        self.vectorstore = vectorstore
+        self.embeddings = embeddings
+        self.response_cache = response_cache
+        self.retrieval_k = retrieval_k
+        self.token_budget = token_budget
+        self.use_mmr = use_mmr
+        self.mmr_lambda = mmr_lambda
+        # Set for Kikuyu: answers are corrected before they are shown or spoken
+        self.scanner = scanner
+        self.stream = stream
+        # Coroutine function text -> audio bytes; None disables speech
+        self.speak = speak
+        self.fallback_instruction = fallback_instruction
+        # Identical prompts already in flight (from other learners) are shared, not re-sent
+        self.single_flight = single_flight
+
+
+async def _retrieve(request: ChatRequest, timer: StageTimer) -> Tuple[List[str], Optional[List[float]]]:
+    """Embed the query once and search by vector; the embedding is reused by the response cache"""
+    if not request.vectorstore or request.embeddings is None:
+        return [], None
+
+    timer.start("embed")
+    query_embedding = await request.embeddings.aembed_query(request.query)
+    timer.end("embed")
+
+    timer.start("retrieve")
+    if request.use_mmr:
+        # Trade a little relevance for diversity among the chunks
+        docs = await request.vectorstore.amax_marginal_relevance_search_by_vector(
+            query_embedding, k=request.retrieval_k, fetch_k=request.retrieval_k * 4, lambda_mult=request.mmr_lambda
+        )
+    else:
+        docs = await request.vectorstore.asimilarity_search_by_vector(query_embedding, k=request.retrieval_k)
+    timer.end("retrieve")
+    return [doc.page_content for doc in docs], query_embedding
+
+
+async def _prepare(request: ChatRequest, timer: StageTimer) -> Optional[StreamingHallucinationFilter]:
+    """Cheap per-request setup, run while retrieval is in flight"""
+    timer.start("prepare")
+    text_filter = StreamingHallucinationFilter(request.scanner) if request.scanner else None
+    timer.end("prepare")
+    return text_filter
+
+
+class _Speaker:
+    """Sends final sentences to TTS as they appear and emits the audio in order"""
+
+    def __init__(self, request: ChatRequest, emit: Callable[[Tuple[str, Any]], None], timer: StageTimer):
+        self.request = request
+        self.emit = emit
+        self.timer = timer
+        self._spoken = 0
+        self._submitted = False
+        self._pending: "asyncio.Queue[Optional[asyncio.Task]]" = asyncio.Queue()
+        self._player = asyncio.ensure_future(self._play()) if request.speak else None
+
+    async def _play(self) -> None:
+        while True:
+            task = await self._pending.get()
+            if task is None:
+                return
+            try:
+                audio = await task
+            except Exception as e:
+                self.emit(("audio_error", e))
+                continue
+            self.timer.mark("first_audio")
+            self.emit(("audio", audio))
+
+    def _submit(self, text: str) -> None:
+        # Same chunking as any other synthesis: a short first chunk, later sentences merged
+        # up to the size cap, so one release of a whole answer is not one long TTS request
+        if self._submitted:
+            chunks = split_sentences(text, first_max_chars=MAX_CHUNK_CHARS)
+        else:
+            chunks = split_sentences(text)
+        for chunk in chunks:
+            self._submitted = True
+            self.timer.start("tts")
+            self._pending.put_nowait(asyncio.ensure_future(self.request.speak(chunk)))
+
+    def update(self, released_text: str) -> None:
+        """Speak every sentence of the released text that has now ended"""
+        if self._player is None:
+            return
+        boundary = None
+        for boundary in _SENTENCE_BOUNDARY.finditer(released_text, self._spoken):
+            pass
+        if boundary is not None:
+            self._submit(released_text[self._spoken:boundary.end()])
+            self._spoken = boundary.end()
+
+    async def finish(self, final_text: str) -> None:
+        if self._player is None:
+            return
+        self._submit(final_text[self._spoken:])
+        self._spoken = len(final_text)
+        await self._pending.put(None)
+        await self._player
+        self.timer.end("tts")
+
+    def cancel(self) -> None:
+        """Stop the player and any queued synthesis (the run ended before finish)"""
+        if self._player is None:
+            return
+        # Cancelling the player also cancels the TTS task it is awaiting
+        self._player.cancel()
+        while not self._pending.empty():
+            task = self._pending.get_nowait()
+            if task is not None:
+                task.cancel()
+
+
+async def _run(request: ChatRequest, emit: Callable[[Tuple[str, Any]], None]) -> None:
+    timer = StageTimer()
+
+    # Retrieval (embedding + vector search) overlaps the request setup
+    (chunks, query_embedding), text_filter = await asyncio.gather(
+        _retrieve(request, timer), _prepare(request, timer)
+    )
+
+    timer.start("assemble")
+    context = ""
+    if chunks:
+        # Drop text repeated by overlapping chunks and stay within the token budget
+        context, context_stats = assemble_context(chunks, token_budget=request.token_budget)
+        emit(("context_stats", context_stats))
+    if context:
+        context_instruction = (
+            f"Relevant knowledge base information:\n\n{context}\n\n"
+            "Use this as reference along with your GPT-4 knowledge to provide accurate, helpful answers."
+        )
+    else:
+        context_instruction = request.fallback_instruction
+    formatted_prompt = request.tutor_prompt["template"].format_messages(context=context_instruction, input=request.query)
+    timer.end("assemble")
+
+    # Reuse an earlier answer to the same (or a near-identical) question
+    prompt_version = request.tutor_prompt["version"]
+    answer = None
+    if request.response_cache is not None:
+        timer.start("cache_lookup")
+        answer = request.response_cache.get(
+            request.language, request.query, context_instruction, prompt_version, query_embedding=query_embedding
+        )
+        timer.end("cache_lookup")
+    cached = answer is not None
+
+    speaker = _Speaker(request, emit, timer)
+    released = ""
+    validate_ms = 0.0
+
+    def release(text: str) -> None:
+        nonlocal released, validate_ms
+        start = time.perf_counter()
+        released += text_filter.feed(text) if text_filter else text
+        validate_ms += (time.perf_counter() - start) * 1000
+        speaker.update(released)
+
+    finished = False
+    try:
+        if cached:
+            release(answer)
+        else:
+            timer.start("llm")
+            flight = request.single_flight
+            key = prompt_key(request.llm, formatted_prompt) if flight else None
+            if request.stream:
+                parts = []
+                if flight:
+                    chunks = flight.stream(key, lambda: request.llm.astream(formatted_prompt))
+                else:
+                    chunks = request.llm.astream(formatted_prompt)
+                async for chunk in chunks:
+                    timer.mark("first_token")
+                    parts.append(chunk.content)
+                    release(chunk.content)
+                    emit(("text", released))
+                answer = "".join(parts)
+            else:
+                if flight:
+                    response = await flight.do_async(key, lambda: request.llm.ainvoke(formatted_prompt))
+                else:
+                    response = await request.llm.ainvoke(formatted_prompt)
+                answer = response.content
+                release(answer)
+            timer.end("llm")
+
+            if request.response_cache is not None:
+                request.response_cache.put(
+                    request.language, request.query, context_instruction, prompt_version, answer,
+                    query_embedding=query_embedding
+                )
+
+        corrections = []
+        if text_filter:
+            start = time.perf_counter()
+            released += text_filter.finish()
+            corrections = text_filter.corrections
+            validate_ms += (time.perf_counter() - start) * 1000
+
+        await speaker.finish(released)
+        finished = True
+    finally:
+        # An error or cancellation must not leave the player and TTS tasks running
+        if not finished:
+            speaker.cancel()
+
+    timings = timer.report()
+    timings["validate_ms"] = validate_ms
+    emit(("done", {"answer": released, "raw_answer": answer, "corrections": corrections,
+                   "cached": cached, "timings": timings}))
+
+
+def run_chat_pipeline(request: ChatRequest) -> Iterator[Tuple[str, Any]]:
+    """
+    Run the pipeline on the shared event loop, yielding its events on the calling thread:
+    ("context_stats", stats), ("text", corrected_text_so_far), ("audio", bytes),
+    ("audio_error", exception) and finally ("done", result)
+    Pipeline errors are re-raised here
+    """
+    events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
+    async def run():
+        try:
+            await _run(request, events.put)
+        except BaseException as e:
+            # Cancellation too: the consumer waits on events.get() until an error or "done"
+            events.put(("error", e))
+            if not isinstance(e, Exception):
+                raise
+
+    future = asyncio.run_coroutine_threadsafe(run(), get_event_loop())
+    try:
+        while True:
+            event = events.get()
+            if event[0] == "error":
+                raise event[1]
+            yield event
+            if event[0] == "done":
+                return
+    finally:
+        # The caller stopped early (e.g. Streamlit interrupted the script run)
+        if not future.done():
+            future.cancel()
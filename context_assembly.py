@@ -0,0 +1,87 @@
+"""
+Token-budgeted context assembly for retrieved knowledge base chunks
+Trims text repeated between overlapping chunks, then fills a token budget in relevance order
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from token_counter import count_tokens
+
+SEPARATOR = "\n\n"
+
+
+def overlap_length(left: str, right: str, min_overlap: int = 20) -> int:
+    """Length of the longest suffix of `left` that is also a prefix of `right`"""
+    longest = min(len(left), len(right))
+    for size in range(longest, min_overlap - 1, -1):
+        if left.endswith(right[:size]):
+            return size
+    return 0
+
+
+def remove_overlaps(chunks: Sequence[str], min_overlap: int = 20) -> Tuple[List[str], int]:
+    """
+    Drop text already present in a higher-ranked chunk
+    Chunks fully contained in an earlier one are removed; a shared prefix or suffix
+    (as left by the splitter's chunk_overlap) is trimmed from the later chunk
+    Returns (trimmed chunks in the same order, characters removed)
+    """
+    kept: List[str] = []
+    removed = 0
+    for chunk in chunks:
+        text = chunk.strip()
+        if not text:
+            continue
+        if any(text in earlier for earlier in kept):
+            removed += len(text)
+            continue
+
+        for earlier in kept:
+            # Earlier chunk's tail repeated at the start of this one
+            head = overlap_length(earlier, text, min_overlap)
+            if head:
+                text = text[head:].lstrip()
+                removed += head
+            # This chunk's tail repeated at the start of the earlier one
+            tail = overlap_length(text, earlier, min_overlap)
+            if tail:
+                text = text[:-tail].rstrip()
+                removed += tail
+            if not text:
+                break
+
+        if text:
+            kept.append(text)
+    return kept, removed
+
+
+def assemble_context(chunks: Sequence[str], token_budget: int = 600, model: str = "gpt-4",
+                     min_overlap: int = 20) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build the context string from chunks given best-first
+    Chunks that would overflow the budget are skipped so smaller, lower-ranked ones can still fit
+    Returns (context, stats)
+    """
+    raw_tokens = count_tokens(SEPARATOR.join(chunks), model)
+    deduplicated, removed_chars = remove_overlaps(chunks, min_overlap)
+
+    selected: List[str] = []
+    used_tokens = 0
+    separator_tokens = count_tokens(SEPARATOR, model)
+    for text in deduplicated:
+        cost = count_tokens(text, model) + (separator_tokens if selected else 0)
+        if used_tokens + cost > token_budget:
+            continue
+        selected.append(text)
+        used_tokens += cost
+
+    context = SEPARATOR.join(selected)
+    stats = {
+        "chunks_retrieved": len(chunks),
+        "chunks_used": len(selected),
+        "overlap_chars_removed": removed_chars,
+        "tokens_before": raw_tokens,
+        "tokens_after": count_tokens(context, model),
+        "token_budget": token_budget,
+    }
+    return context, stats
@@ -0,0 +1,192 @@
+"""
+Content-addressed embedding cache
+Wraps any LangChain embeddings model so the same text is only embedded once,
+with an in-memory LRU tier in front of a persistent SQLite tier
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+DEFAULT_CACHE_DIR = os.getenv("TUTOR_CACHE_DIR", ".tutor_cache")
+
+
+def text_hash(text: str) -> str:
+    """sha256 of the UTF-8 text, used as the content address"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def cache_key(text: str, kind: str = "document") -> str:
+    """
+    Documents are keyed by the bare text hash; queries get their own keys, since some
+    models embed them differently (e.g. Gemini's RETRIEVAL_QUERY vs RETRIEVAL_DOCUMENT)
+    """
+    return text_hash(text) if kind == "document" else text_hash(f"{kind}\x1f{text}")
+
+
+class CachedEmbeddings(Embeddings):
+    """Drop-in embeddings wrapper keyed by (model, sha256 of the text and, for queries, the kind)"""
+
+    def __init__(self, underlying: Embeddings, model_name: Optional[str] = None,
+                 db_path: Optional[str] = None, memory_size: int = 4096):
+        self.underlying = underlying
+        self.model_name = model_name or getattr(underlying, "model", None) or type(underlying).__name__
+        self.memory_size = memory_size
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        if db_path is None:
+            db_path = os.path.join(DEFAULT_CACHE_DIR, "embeddings.sqlite3")
+        self._db = None
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    " model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL,"
+                    " PRIMARY KEY (model, text_hash))"
+                )
+                self._db.commit()
+            except sqlite3.Error:
+                # Fall back to memory-only caching if the store cannot be opened
+                self._db = None
+
+    # ============================================
+    # Cache tiers
+    # ============================================
+
+    def _memory_get(self, key: str) -> Optional[List[float]]:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+        return vector
+
+    def _memory_put(self, key: str, vector: List[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _disk_get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not self._db or not keys:
+            return {}
+        found = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._db.execute(
+                f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                [self.model_name, *batch]
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = array('d', blob).tolist()
+        return found
+
+    def _disk_put_many(self, items: Dict[str, List[float]]) -> None:
+        if not self._db or not items:
+            return
+        try:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                [(self.model_name, key, array('d', vector).tobytes()) for key, vector in items.items()]
+            )
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def _lookup(self, texts: List[str], kind: str = "document"):
+        """Resolve cached vectors; return (vectors by key, missing texts by key)"""
+        keys = [cache_key(text, kind) for text in texts]
+        resolved: Dict[str, List[float]] = {}
+        missing: Dict[str, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in resolved or key in missing:
+                    continue
+                vector = self._memory_get(key)
+                if vector is not None:
+                    resolved[key] = vector
+                    self._stats["memory_hits"] += 1
+                else:
+                    missing[key] = text
+
+            from_disk = self._disk_get_many(list(missing))
+            for key, vector in from_disk.items():
+                resolved[key] = vector
+                self._memory_put(key, vector)
+                del missing[key]
+            self._stats["disk_hits"] += len(from_disk)
+            self._stats["misses"] += len(missing)
+
+        return keys, resolved, missing
+
+    def _store(self, resolved: Dict[str, List[float]], missing_keys: List[str],
+               new_vectors: List[List[float]]) -> None:
+        fresh = dict(zip(missing_keys, new_vectors))
+        resolved.update(fresh)
+        with self._lock:
+            for key, vector in fresh.items():
+                self._memory_put(key, vector)
+            self._disk_put_many(fresh)
+
+    # ============================================
+    # Embeddings interface
+    # ============================================
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, resolved, missing = self._lookup(texts)
+        if missing:
+            new_vectors = self.underlying.embed_documents(list(missing.values()))
+            self._store(resolved, list(missing), new_vectors)
+        return [resolved[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        keys, resolved, missing = self._lookup([text], "query")
+        if missing:
+            self._store(resolved, list(missing), [self.underlying.embed_query(text)])
+        return resolved[keys[0]]
+
+    # The SQLite tier is blocking I/O, so the async methods run it off the event loop
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        loop = asyncio.get_running_loop()
+        keys, resolved, missing = await loop.run_in_executor(None, self._lookup, texts)
+        if missing:
+            new_vectors = await self.underlying.aembed_documents(list(missing.values()))
+            await loop.run_in_executor(None, self._store, resolved, list(missing), new_vectors)
+        return [resolved[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        keys, resolved, missing = await loop.run_in_executor(None, self._lookup, [text], "query")
+        if missing:
+            new_vectors = [await self.underlying.aembed_query(text)]
+            await loop.run_in_executor(None, self._store, resolved, list(missing), new_vectors)
+        return resolved[keys[0]]
+
+    # ============================================
+    # Metrics
+    # ============================================
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counts since this wrapper was created"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        stats["hits"] = stats["memory_hits"] + stats["disk_hits"]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
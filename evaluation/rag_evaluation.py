@@ -15,6 +15,11 @@ from langchain_core.documents import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from dotenv import load_dotenv
 import os
+import sys
+
+# Allow importing shared modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from embedding_cache import CachedEmbeddings
 
 # Load environment
 load_dotenv()
@@ -24,7 +29,11 @@ class RAGEvaluator:
     
     def __init__(self, language="Kiswahili"):
         self.language = language
-        self.embeddings = GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
+        # Cached so repeated queries, answers and contexts are only embedded once
+        self.embeddings = CachedEmbeddings(
+            GoogleGenerativeAIEmbeddings(model="models/text-embedding-004"),
+            model_name="models/text-embedding-004"
+        )
         self.llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.3)
         
     # ============================================
@@ -0,0 +1,157 @@
+"""
+Compiled Gĩkũyũ hallucination scanner
+Detects and replaces blacklisted Swahili/Sheng words in a single regex pass,
+so the cost stays flat as the blacklist grows to thousands of entries
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+def build_trie_pattern(words: List[str]) -> str:
+    """
+    Build one regex alternation from a character trie of the words
+    Shared prefixes are matched once instead of once per word
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def to_pattern(node: Dict[str, dict]) -> str:
+        branches = sorted(char for char in node if char)
+        if not branches:
+            return ""
+
+        alternatives = [re.escape(char) + to_pattern(node[char]) for char in branches]
+        if len(alternatives) == 1 and "" not in node:
+            return alternatives[0]
+
+        pattern = "(?:" + "|".join(alternatives) + ")"
+        # A word ends here but longer words continue: make the tail optional
+        return pattern + "?" if "" in node else pattern
+
+    return to_pattern(trie)
+
+
+class HallucinationScanner:
+    """Precompiled word-boundary matcher over a hallucination blacklist"""
+
+    def __init__(self, blacklist: Dict[str, Dict[str, str]]):
+        # Case-folded form -> (blacklist position, original key, correction info)
+        self._entries = {}
+        for position, (word, info) in enumerate(blacklist.items()):
+            self._entries.setdefault(word.casefold(), (position, word, info))
+
+        if self._entries:
+            self.pattern = re.compile(r"\b" + build_trie_pattern(list(self._entries)) + r"\b", re.IGNORECASE)
+        else:
+            self.pattern = None
+
+        # Longest blacklist entry in words, e.g. 2 for "asante sana"
+        self.max_words = max((len(re.findall(r"\w+", word)) for word in self._entries), default=1) or 1
+
+    def key(self, match: "re.Match") -> Optional[str]:
+        """
+        Blacklist key of a match, or None
+        re.IGNORECASE matches more case variants than case folding maps back ("aſante"),
+        so a match is only a blacklisted word if its folded form is an entry
+        """
+        key = match.group(0).casefold()
+        return key if key in self._entries else None
+
+    def replacement(self, match: "re.Match") -> str:
+        key = self.key(match)
+        return self._entries[key][2]["correct"] if key is not None else match.group(0)
+
+    def corrections_for(self, found: Dict[str, None]) -> List[Dict[str, str]]:
+        # Report in blacklist order, one entry per blacklisted word
+        ordered = sorted((self._entries[word] for word in found if word in self._entries), key=lambda entry: entry[0])
+        return [{"error": word, "correct": info["correct"], "note": info["note"]}
+                for _, word, info in ordered]
+
+    def detect(self, text: str) -> List[Dict[str, str]]:
+        """Return one correction per blacklisted word found in the text"""
+        if not text or self.pattern is None:
+            return []
+        found = dict.fromkeys(self.key(match) for match in self.pattern.finditer(text))
+        return self.corrections_for(found)
+
+    def correct(self, text: str) -> Tuple[str, List[Dict[str, str]]]:
+        """Replace every blacklisted word in one pass; return (corrected_text, corrections)"""
+        if not text or self.pattern is None:
+            return text, []
+
+        found: Dict[str, None] = {}
+
+        def replace(match):
+            found[self.key(match)] = None
+            return self.replacement(match)
+
+        corrected_text = self.pattern.sub(replace, text)
+        return corrected_text, self.corrections_for(found)
+
+
+_TRAILING_PARTIAL_WORD = re.compile(r"\w*\Z")
+_LAST_WORD = re.compile(r"\w+\W*\Z")
+
+
+class StreamingHallucinationFilter:
+    """
+    Incremental scanner for streamed LLM output
+    Each chunk is corrected before it is shown; only the trailing partial word
+    (plus enough whole words to finish a multi-word entry) is held back
+    """
+
+    def __init__(self, scanner: HallucinationScanner):
+        self.scanner = scanner
+        self._buffer = ""
+        self._found: Dict[str, None] = {}
+
+    def _release(self, final: bool) -> str:
+        buffer = self._buffer
+        if final:
+            complete_end = hold_from = len(buffer)
+        else:
+            # Text after complete_end may still grow into a longer word
+            complete_end = _TRAILING_PARTIAL_WORD.search(buffer).start()
+            # Matches starting at or after hold_from could still extend into a longer phrase
+            hold_from = complete_end
+            for _ in range(self.scanner.max_words - 1):
+                last_word = _LAST_WORD.search(buffer, 0, hold_from)
+                if last_word is None:
+                    hold_from = 0
+                    break
+                hold_from = last_word.start()
+
+        parts = []
+        position = 0
+        if self.scanner.pattern is not None:
+            for match in self.scanner.pattern.finditer(buffer, 0, complete_end):
+                if match.start() >= hold_from:
+                    break
+                parts.append(buffer[position:match.start()])
+                parts.append(self.scanner.replacement(match))
+                self._found[self.scanner.key(match)] = None
+                position = match.end()
+
+        cut = max(hold_from, position)
+        parts.append(buffer[position:cut])
+        self._buffer = buffer[cut:]
+        return "".join(parts)
+
+    def feed(self, chunk: str) -> str:
+        """Add a streamed chunk; return the corrected text that is now safe to show"""
+        self._buffer += chunk
+        return self._release(final=False)
+
+    def finish(self) -> str:
+        """Flush and correct whatever is still held back at the end of the stream"""
+        return self._release(final=True)
+
+    @property
+    def corrections(self) -> List[Dict[str, str]]:
+        """Corrections made so far, in blacklist order"""
+        return self.scanner.corrections_for(self._found)
@@ -0,0 +1,121 @@
+"""
+Persistent on-disk cache for the FAISS knowledge base indexes
+Lets a fresh server process load a saved index instead of re-embedding the corpus
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+from langchain_community.vectorstores import FAISS
+
+# Bump when the on-disk layout or the knowledge-to-text conversion changes
+INDEX_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.getenv("TUTOR_CACHE_DIR", ".tutor_cache")
+
+
+def _index_root(cache_dir: Optional[str] = None) -> str:
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, "faiss", f"v{INDEX_CACHE_VERSION}")
+
+
+def compute_index_key(source_path: Optional[str], knowledge_text: str, chunk_size: int,
+                      chunk_overlap: int, embedding_model: str) -> str:
+    """
+    Build the cache key for a knowledge base index
+    Hashes the language JSON file (or the generated text when there is no file),
+    the splitter settings and the embedding model name
+    """
+    if source_path and os.path.exists(source_path):
+        with open(source_path, 'rb') as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+    else:
+        content_hash = hashlib.sha256(knowledge_text.encode('utf-8')).hexdigest()
+
+    key_material = json.dumps({
+        "version": INDEX_CACHE_VERSION,
+        "content": content_hash,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "embedding_model": embedding_model,
+    }, sort_keys=True)
+    return hashlib.sha256(key_material.encode('utf-8')).hexdigest()
+
+
+def _index_dir(language: str, key: str, cache_dir: Optional[str] = None) -> str:
+    return os.path.join(_index_root(cache_dir), f"{language.lower()}-{key[:16]}")
+
+
+def load_cached_index(language: str, key: str, embeddings: Any,
+                      cache_dir: Optional[str] = None) -> Optional[FAISS]:
+    """Load a saved index if one exists for this key, otherwise return None"""
+    index_dir = _index_dir(language, key, cache_dir)
+    manifest_path = os.path.join(index_dir, "manifest.json")
+
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("key") != key:
+            return None
+        # The pickle side-file was written by save_index, so it is trusted
+        return FAISS.load_local(index_dir, embeddings, allow_dangerous_deserialization=True)
+    except Exception:
+        # A corrupt or half-written entry is treated as a miss and rebuilt
+        return None
+
+
+def save_index(vectorstore: FAISS, language: str, key: str,
+               metadata: Optional[Dict[str, Any]] = None, cache_dir: Optional[str] = None) -> str:
+    """
+    Save an index under its key and drop older entries for the same language
+    Writes to a temporary directory first so readers never see a partial index
+    """
+    root = _index_root(cache_dir)
+    os.makedirs(root, exist_ok=True)
+    index_dir = _index_dir(language, key, cache_dir)
+
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=root)
+    try:
+        vectorstore.save_local(tmp_dir)
+        manifest = {"key": key, "language": language, **(metadata or {})}
+        with open(os.path.join(tmp_dir, "manifest.json"), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+        if os.path.exists(index_dir):
+            shutil.rmtree(index_dir, ignore_errors=True)
+        os.replace(tmp_dir, index_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    # Remove stale indexes built from older data or settings
+    prefix = f"{language.lower()}-"
+    for entry in os.listdir(root):
+        entry_path = os.path.join(root, entry)
+        if entry.startswith(prefix) and entry_path != index_dir:
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+    return index_dir
+
+
+def load_or_build_index(language: str, key: str, embeddings: Any, build_fn: Callable[[], FAISS],
+                        metadata: Optional[Dict[str, Any]] = None,
+                        cache_dir: Optional[str] = None) -> FAISS:
+    """Return the cached index for this key, building and saving it on a miss"""
+    vectorstore = load_cached_index(language, key, embeddings, cache_dir)
+    if vectorstore is not None:
+        return vectorstore
+
+    vectorstore = build_fn()
+    try:
+        save_index(vectorstore, language, key, metadata, cache_dir)
+    except OSError:
+        # A read-only filesystem should not stop the app from serving
+        pass
+    return vectorstore
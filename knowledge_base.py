@@ -0,0 +1,102 @@
+"""
+Language knowledge base loading
+Reads language_data/*.json and renders it as text for the vector store
+"""
+
+import json
+import os
+
+from language_config import LANGUAGE_DATA_FILES
+
+LANGUAGE_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "language_data")
+
+# Knowledge base indexing settings (part of the on-disk index cache key)
+EMBEDDING_MODEL = "text-embedding-ada-002"
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 50
+
+
+def get_language_data_path(language):
+    """Return the path of the JSON knowledge file for a language, or None if unsupported"""
+    if language not in LANGUAGE_DATA_FILES:
+        return None
+    return os.path.join(LANGUAGE_DATA_DIR, LANGUAGE_DATA_FILES[language])
+
+
+def load_language_knowledge_from_json(language):
+    """Load language knowledge from JSON files (raises if the file cannot be parsed)"""
+    filepath = get_language_data_path(language)
+
+    if not filepath:
+        return None
+
+    if os.path.exists(filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    else:
+        # Fallback to basic knowledge if file doesn't exist
+        return get_fallback_knowledge(language)
+
+
+def get_fallback_knowledge(language):
+    """Fallback knowledge base if JSON files are not available"""
+    return {
+        "language": language,
+        "grammar_rules": [
+            {"rule": "Basic Grammar", "description": f"Learn {language} grammar patterns", "examples": []}
+        ],
+        "vocabulary": {
+            "basic_words": {
+                "hello": {"meaning": "greeting", "pos": "interjection", "examples": ["Hello, how are you?"]}
+            }
+        },
+        "common_errors": [
+            {"error": "Common mistakes", "correct": "Learn proper usage", "example": "Practice makes perfect"}
+        ],
+        "cultural_context": [f"{language} is an important African language with rich cultural heritage"]
+    }
+
+
+def knowledge_to_text(language, knowledge_data):
+    """Convert a language's knowledge data to text for embedding"""
+    if not knowledge_data:
+        return ""
+
+    # Convert JSON data to text format for embedding
+    text_content = f"Language: {language}\n\n"
+
+    # Grammar rules
+    text_content += "Grammar Rules:\n"
+    for rule in knowledge_data.get('grammar_rules', []):
+        text_content += f"- {rule.get('rule', '')}: {rule.get('description', '')}\n"
+        for example in rule.get('examples', []):
+            text_content += f"  Example: {example}\n"
+
+    # Vocabulary
+    text_content += "\nVocabulary:\n"
+    vocab = knowledge_data.get('vocabulary', {})
+
+    # Basic words
+    for word, info in vocab.get('basic_words', {}).items():
+        text_content += f"- {word}: {info.get('meaning', '')} ({info.get('pos', '')})\n"
+        for example in info.get('examples', []):
+            text_content += f"  Example: {example}\n"
+
+    # Greetings
+    for greeting, info in vocab.get('greetings', {}).items():
+        text_content += f"- {greeting}: {info.get('meaning', '')} (Response: {info.get('response', '')})\n"
+        text_content += f"  Usage: {info.get('usage', '')}\n"
+
+    # Common errors
+    text_content += "\nCommon Errors:\n"
+    for error in knowledge_data.get('common_errors', []):
+        text_content += f"- Error: {error.get('error', '')}\n"
+        text_content += f"  Correct: {error.get('correct', '')}\n"
+        text_content += f"  Example: {error.get('example', '')}\n"
+
+    # Cultural context
+    text_content += "\nCultural Context:\n"
+    for context in knowledge_data.get('cultural_context', []):
+        text_content += f"- {context}\n"
+
+    return text_content
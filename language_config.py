@@ -0,0 +1,107 @@
+"""
+Language configuration shared by the tutor app and its command-line tools
+Verified Gĩkũyũ vocabulary, the hallucination blacklist and supported languages
+"""
+
+# Gĩkũyũ Dictionary - Verified vocabulary to prevent hallucinations
+GIKUYU_DICTIONARY = {
+    "nouns": {
+        "mũndũ": "person (singular)",
+        "andũ": "people (plural)",
+        "mũtĩ": "tree",
+        "mĩtĩ": "trees",
+        "mwana": "child",
+        "ciana": "children",
+        "njũĩ": "river",
+        "nyũmba": "house",
+        "ng'ombe": "cow",
+        "mbũri": "goat",
+        "ũhoro": "news/information/matter"
+    },
+    "verbs": {
+        "gũthoma": "to read / to study",
+        "kũrĩa": "to eat",
+        "kũnyua": "to drink",
+        "gũthiĩ": "to go",
+        "kwaria": "to speak",
+        "kũina": "to sing / to dance",
+        "kũruga": "to cook",
+        "gũkenera": "to enjoy / be happy"
+    },
+    "greetings_phrases": {
+        "ũhoro waku": "how are you? (singular)",
+        "ũhoro wanyu": "how are you? (plural)",
+        "nĩ wega": "thank you / it is good",
+        "nuu": "who",
+        "kĩĩ": "what",
+        "atĩa": "how"
+    },
+    "numbers": {
+        "ĩmwe": "1",
+        "igĩrĩ": "2",
+        "ithatũ": "3",
+        "inya": "4",
+        "ithano": "5",
+        "mũgwanja": "7",
+        "nyanya": "8",
+        "kenda": "9",
+        "ikũmi": "10"
+    }
+}
+
+# Hallucination Blacklist - Swahili words that GPT-4 incorrectly uses for Gĩkũyũ
+GIKUYU_HALLUCINATION_BLACKLIST = {
+    "habari": {"correct": "ũhoro", "note": "AI often uses Swahili 'habari' instead of Gĩkũyũ 'ũhoro'"},
+    "mti": {"correct": "mũtĩ", "note": "Missing tilde (ũ) - this is Swahili, not Gĩkũyũ"},
+    "kula": {"correct": "kũrĩa", "note": "AI defaults to Swahili 'kula' instead of Gĩkũyũ 'kũrĩa'"},
+    "asante": {"correct": "nĩ wega", "note": "Common greeting hallucination - use Gĩkũyũ 'nĩ wega'"},
+    "watoto": {"correct": "ciana", "note": "Use Gĩkũyũ 'ciana' for plural 'children'"},
+    "nyumba": {"correct": "nyũmba", "note": "Missing tilde - ensure proper Gĩkũyũ spelling"},
+    "chakula": {"correct": "irĩo", "note": "Swahili word - use Gĩkũyũ 'irĩo' for food"},
+    "maji": {"correct": "maaĩ", "note": "Use Gĩkũyũ 'maaĩ' with proper diacritics"},
+    "kwenda": {"correct": "gũthiĩ", "note": "Swahili verb - use Gĩkũyũ 'gũthiĩ'"},
+    "kusoma": {"correct": "gũthoma", "note": "Swahili infinitive - use Gĩkũyũ 'gũthoma'"}
+}
+
+# Supported languages configuration
+SUPPORTED_LANGUAGES = {
+    "Kiswahili": {
+        "code": "sw",
+        "name": "Kiswahili",
+        "greeting": "Hujambo! Karibu kwenye mfumo wa kujifunza Kiswahili.",
+        "description": "Learn Swahili grammar, vocabulary, and sentence construction",
+        "tts_lang": "sw",  # Google TTS language code
+        "tts_backend": "gtts",  # See TTS_BACKENDS in tts_engine.py
+        "stt_lang": "sw-KE",  # Swahili (Kenya)
+        "stt_backend": "google"  # See STT_BACKENDS in stt_engine.py
+    },
+    "Kikuyu": {
+        "code": "ki",
+        "name": "Kikuyu",
+        "greeting": "Wĩ mwega! Ũkĩrĩte gũkũ kũruta Kikuyu.",
+        "description": "Learn Kikuyu grammar, vocabulary, and sentence construction",
+        "tts_lang": "sw",  # Use Swahili TTS as closest available for Kikuyu
+        "tts_backend": "gtts",
+        # Google has no Kikuyu recognizer; a local model with the closest supported language
+        # (Swahili) plus the AI correction step gives a usable transcription
+        "stt_lang": "sw",
+        "stt_backend": "whisper"
+    },
+    "English": {
+        "code": "en",
+        "name": "English",
+        "greeting": "Welcome! Let's improve your English language skills.",
+        "description": "Master English grammar, vocabulary, and communication skills",
+        "tts_lang": "en",  # Native English TTS
+        "tts_backend": "gtts",
+        "stt_lang": "en-US",
+        "stt_backend": "google"
+    }
+}
+
+# Knowledge files in language_data/
+LANGUAGE_DATA_FILES = {
+    "Kiswahili": "kiswahili_knowledge.json",
+    "Kikuyu": "kikuyu_knowledge.json",
+    "English": "english_knowledge.json"
+}
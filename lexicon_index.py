@@ -0,0 +1,192 @@
+"""
+Local vocabulary lookup over the verified language data
+Indexes every vocabulary and greeting entry in language_data/*.json (plus the Gĩkũyũ
+dictionary) by diacritic-folded keys in both directions, so "mũtĩ", "muti" and "tree"
+all resolve to the same entry without an LLM call
+"""
+
+import difflib
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from knowledge_base import load_language_knowledge_from_json
+from transcript_scorer import load_frequency_words
+
+# Entry fields shown as details; meaning/pos/examples are rendered separately
+DETAIL_FIELDS = {
+    "plural": "Plural",
+    "response": "Response",
+    "usage": "Usage",
+    "formality": "Formality",
+    "conjugations": "Conjugations",
+    "forms": "Forms",
+    "agreement": "Agreement",
+    "class": "Noun class"
+}
+
+_QUOTED = re.compile(r"[\"'‘“]([^\"'’”]+)[\"'’”]")
+_QUESTION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"^what (?:does|do|is) (.+?) mean\b",
+    r"^(?:what is |what's )?the meaning of (.+?)(?: in [\w ]+)?$",
+    r"^how (?:do|would|can) (?:i|you|we) say (.+?)(?: in [\w ]+)?$",
+    r"^what(?: is|'s) (?:the word|the \w+ word) for (.+?)(?: in [\w ]+)?$",
+    r"^(?:what is |what's )(.+?) in [\w ]+$",
+    r"^translate (.+?)(?: (?:to|into) [\w ]+)?$",
+)]
+
+
+def fold(text: str) -> str:
+    """Lookup key: case, diacritics, apostrophe style and spacing folded away"""
+    decomposed = unicodedata.normalize("NFD", text.replace("’", "'"))
+    stripped = "".join(char for char in decomposed if unicodedata.category(char) != "Mn")
+    return " ".join(stripped.casefold().split()).strip(" ?!.,;:")
+
+
+def _exact_key(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split()).strip(" ?!.,;:")
+
+
+def meaning_terms(meaning: str) -> List[str]:
+    """English lookup terms in a gloss: "to read / to study" -> to read, read, to study, study"""
+    terms = []
+    for part in re.split(r"[/,;]", re.sub(r"\([^)]*\)", " ", meaning)):
+        term = fold(part)
+        if not term:
+            continue
+        terms.append(term)
+        for prefix in ("to ", "a ", "an ", "the "):
+            if term.startswith(prefix) and len(term) > len(prefix):
+                terms.append(term[len(prefix):])
+    return terms
+
+
+def extract_term(query: str) -> str:
+    """The word or phrase a vocabulary question is about"""
+    query = " ".join(query.split())
+    quoted = _QUOTED.search(query)
+    if quoted:
+        return quoted.group(1).strip()
+    question = query.rstrip(" ?!.")
+    for pattern in _QUESTION_PATTERNS:
+        match = pattern.match(question)
+        if match:
+            return match.group(1).strip()
+    return question
+
+
+class LexiconIndex:
+    """Two-way lookup (target word <-> English gloss) over verified entries"""
+
+    def __init__(self, entries: List[Dict[str, Any]], reverse: bool = True, near_cutoff: float = 0.8,
+                 max_words: int = 4, english_words: Iterable[str] = ()):
+        self.entries = entries
+        self.near_cutoff = near_cutoff
+        # Common English words are never near-matched to a target word ("and" is not "andũ")
+        self.english_words: Set[str] = {fold(word) for word in english_words}
+        # Longer queries are sentences or questions for the tutor, not lookups
+        self.max_words = max_words
+
+        self._by_word: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_meaning: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            self._by_word.setdefault(fold(entry["word"]), []).append(entry)
+            # English glosses are only an index for the other languages
+            if reverse:
+                for term in meaning_terms(entry["meaning"]):
+                    bucket = self._by_meaning.setdefault(term, [])
+                    if entry not in bucket:
+                        bucket.append(entry)
+
+        self._lock = threading.Lock()
+        self._stats = {"exact": 0, "folded": 0, "near": 0, "misses": 0}
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def _near(self, key: str, index: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        matches = []
+        for candidate in difflib.get_close_matches(key, index.keys(), n=3, cutoff=self.near_cutoff):
+            matches.extend(entry for entry in index[candidate] if entry not in matches)
+        return matches
+
+    def lookup(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Answer a vocabulary query from the index, or None if it cannot
+        Returns {"term", "match" (exact/folded/near), "direction" (to_english/from_english), "entries"}
+        """
+        term = extract_term(query)
+        key = fold(term)
+        if not key or len(key.split()) > self.max_words:
+            self._count("misses")
+            return None
+
+        entries, direction, match = self._by_word.get(key), "to_english", None
+        if entries:
+            exact = any(_exact_key(entry["word"]) == _exact_key(term) for entry in entries)
+            match = "exact" if exact else "folded"
+        elif key in self._by_meaning:
+            entries, direction, match = self._by_meaning[key], "from_english", "exact"
+        else:
+            # Near matches are only tried on target-language spellings: a gloss that merely
+            # looks like the query ("horse" / "house") would be the wrong translation
+            entries = self._near(key, self._by_word) if key not in self.english_words else []
+            match = "near" if entries else None
+
+        if not entries:
+            self._count("misses")
+            return None
+        self._count(match)
+        return {"term": term, "match": match, "direction": direction, "entries": entries}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        answered = stats["exact"] + stats["folded"] + stats["near"]
+        total = answered + stats["misses"]
+        stats["entries"] = len(self.entries)
+        stats["local_rate"] = answered / total if total else 0.0
+        return stats
+
+
+def _knowledge_entries(language: str) -> List[Dict[str, Any]]:
+    knowledge = load_language_knowledge_from_json(language) or {}
+    entries = []
+    for section in knowledge.get('vocabulary', {}).values():
+        for word, info in section.items():
+            if not isinstance(info, dict):
+                continue
+            entries.append({
+                "word": word,
+                "meaning": info.get("meaning", ""),
+                "pos": info.get("pos", ""),
+                "examples": list(info.get("examples", [])),
+                "details": {label: info[field] for field, label in DETAIL_FIELDS.items() if info.get(field)},
+                "source": "knowledge base"
+            })
+    return entries
+
+
+def build_lexicon_index(language: str,
+                        gikuyu_dictionary: Optional[Dict[str, Dict[str, str]]] = None) -> LexiconIndex:
+    """Index the language's knowledge base vocabulary (and the Gĩkũyũ dictionary for Kikuyu)"""
+    entries = _knowledge_entries(language)
+    if language == "Kikuyu" and gikuyu_dictionary:
+        known: Dict[Tuple[str, str], bool] = {(fold(entry["word"]), fold(entry["meaning"])): True for entry in entries}
+        for section, words in gikuyu_dictionary.items():
+            for word, meaning in words.items():
+                if (fold(word), fold(meaning)) in known:
+                    continue
+                entries.append({
+                    "word": word,
+                    "meaning": meaning,
+                    "pos": section.rstrip("s").replace("_", " ") if section != "greetings_phrases" else "phrase",
+                    "examples": [],
+                    "details": {},
+                    "source": "verified dictionary"
+                })
+    if language == "English":
+        return LexiconIndex(entries, reverse=False)
+    return LexiconIndex(entries, english_words=load_frequency_words("English"))
@@ -0,0 +1,81 @@
+"""
+Process-wide pool of chat model clients
+Clients are shared across Streamlit reruns and sessions, keyed by
+(model, temperature, max_tokens), and all reuse one set of keep-alive HTTP connections
+"""
+
+import asyncio
+import threading
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+
+class LLMClientPool:
+    """Thread-safe registry of ChatOpenAI clients sharing pooled HTTP connections"""
+
+    def __init__(self, api_key: Optional[str] = None, max_connections: int = 20,
+                 max_keepalive_connections: int = 10, keepalive_expiry: float = 60.0,
+                 timeout: float = 30.0):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http_client = httpx.Client(limits=self.limits, timeout=timeout)
+        self.http_async_client = httpx.AsyncClient(limits=self.limits, timeout=timeout)
+
+        self._clients: Dict[Tuple[str, float, int], ChatOpenAI] = {}
+        self._lock = threading.Lock()
+        self._requests = Counter()
+
+    def get(self, model: str = "gpt-4", temperature: float = 0.0, max_tokens: int = 500) -> ChatOpenAI:
+        """Return the shared client for these settings, creating it on first use"""
+        key = (model, float(temperature), int(max_tokens))
+        with self._lock:
+            self._requests[key] += 1
+            client = self._clients.get(key)
+            if client is None:
+                client = ChatOpenAI(
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                    openai_api_key=self.api_key,
+                    http_client=self.http_client,
+                    http_async_client=self.http_async_client
+                )
+                self._clients[key] = client
+            return client
+
+    def stats(self) -> Dict[str, Any]:
+        """Client reuse counts and connection pool settings"""
+        with self._lock:
+            requests = sum(self._requests.values())
+            clients = len(self._clients)
+            per_client = {f"{model}|t={temp}|max={max_tokens}": count
+                          for (model, temp, max_tokens), count in self._requests.items()}
+        return {
+            "clients": clients,
+            "requests": requests,
+            "reused": requests - clients,
+            "per_client": per_client,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+        }
+
+    def close(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Close both HTTP clients
+        The async client's connections belong to the loop that used it (e.g. the chat
+        pipeline's), so pass that loop if it is still running; otherwise it is closed here
+        """
+        self.http_client.close()
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.http_async_client.aclose(), loop).result(timeout=self.timeout)
+        else:
+            asyncio.run(self.http_async_client.aclose())
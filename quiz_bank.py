@@ -0,0 +1,248 @@
+"""
+Indexed quiz bank
+Curated, verified questions are loaded once from language_data/quiz/<language>.jsonl
+into compact records indexed by language, category and difficulty. Sessions draw
+questions at random without repeats in O(1) per question, however large the bank
+"""
+
+import json
+import os
+import random
+import sys
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from answer_matcher import AnswerMatcher, MatchResult, fold_answer, normalize_answer
+from knowledge_base import LANGUAGE_DATA_DIR
+from language_config import GIKUYU_DICTIONARY
+from transcript_scorer import lexicon_words, load_frequency_words
+
+QUIZ_DIR = os.path.join(LANGUAGE_DATA_DIR, "quiz")
+DEFAULT_LANGUAGE = "English"
+
+
+@lru_cache(maxsize=None)
+def known_words(language: str) -> FrozenSet[str]:
+    """
+    Real words a misspelt answer must not be (folded): the language's verified
+    vocabulary plus common English, since translation answers are often English
+    """
+    words = lexicon_words(language, GIKUYU_DICTIONARY) | load_frequency_words("English")
+    return frozenset(fold_answer(word) for word in words)
+
+
+class QuizItem:
+    """
+    One question; answers are stored once in their normalized form for grading
+    The typo-tolerant matcher is compiled on first use, so loading a large bank stays cheap
+    """
+
+    __slots__ = ("id", "language", "question", "category", "difficulty", "correct_answer",
+                 "acceptable_answers", "normalized_answers", "max_edits", "extra", "_matcher")
+
+    def __init__(self, id: int, language: str, question: str, category: str, difficulty: str,
+                 correct_answer: str, acceptable_answers: Iterable[str], max_edits: Optional[int] = 0,
+                 extra: Optional[Dict[str, Any]] = None):
+        self.id = id
+        # Interned: a large bank repeats a handful of these values
+        self.language = sys.intern(language)
+        self.question = question
+        self.category = sys.intern(category)
+        self.difficulty = sys.intern(difficulty)
+        self.correct_answer = correct_answer
+        self.acceptable_answers: Tuple[str, ...] = tuple(acceptable_answers) or (correct_answer,)
+        self.normalized_answers: FrozenSet[str] = frozenset(normalize_answer(a) for a in self.acceptable_answers)
+        # Per-question typo budget, opt-in: grammar contrasts are often one letter apart
+        # (kitabu/vitabu, anaenda/unaenda), so 0 (exact spelling) unless the record sets one
+        self.max_edits = max_edits
+        self._matcher: Optional[AnswerMatcher] = None
+        # Optional fields such as explanation or english_reference
+        self.extra = extra or None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], language: str) -> "QuizItem":
+        record = dict(record)
+        return cls(
+            id=record.pop("id"),
+            language=record.pop("language", language),
+            question=record.pop("question"),
+            category=record.pop("category", "Vocabulary"),
+            difficulty=record.pop("difficulty", "medium"),
+            correct_answer=record.pop("correct_answer"),
+            acceptable_answers=record.pop("acceptable_answers", ()),
+            max_edits=record.pop("max_edits", 0),
+            extra=record
+        )
+
+    def match(self, answer: str) -> MatchResult:
+        """Grade an answer, tolerating missing diacritics (and small typos if the question allows them)"""
+        if self._matcher is None:
+            self._matcher = AnswerMatcher.for_question(self.question, self.acceptable_answers, self.max_edits,
+                                                       known_words(self.language))
+        return self._matcher.match(answer)
+
+    def is_correct(self, answer: str) -> bool:
+        return normalize_answer(answer) in self.normalized_answers or self.match(answer).correct
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The question dict shape the quiz interface keeps in session state"""
+        question = {
+            "id": self.id,
+            "question": self.question,
+            "category": self.category,
+            "difficulty": self.difficulty,
+            "language": self.language,
+            "correct_answer": self.correct_answer,
+            "acceptable_answers": list(self.acceptable_answers)
+        }
+        if self.extra:
+            question.update(self.extra)
+        return question
+
+
+PoolKey = Tuple[str, Optional[str], Optional[str]]
+
+
+class QuizBank:
+    """
+    All questions in one list, with array-backed position indexes for
+    language, (language, category), (language, difficulty) and their combination
+    """
+
+    def __init__(self, items: Iterable[QuizItem] = ()):
+        self.items: List[QuizItem] = []
+        self._pools: Dict[PoolKey, array] = {}
+        self._by_id: Dict[Tuple[str, int], int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: QuizItem) -> None:
+        position = len(self.items)
+        key = (item.language, item.id)
+        if key in self._by_id:
+            raise ValueError(f"Duplicate quiz question id {item.id} for {item.language}")
+        self.items.append(item)
+        self._by_id[key] = position
+
+        category = item.category.casefold()
+        difficulty = item.difficulty.casefold()
+        for pool_key in ((item.language, None, None), (item.language, category, None),
+                         (item.language, None, difficulty), (item.language, category, difficulty)):
+            pool = self._pools.get(pool_key)
+            if pool is None:
+                pool = self._pools[pool_key] = array('I')
+            pool.append(position)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def languages(self) -> List[str]:
+        return sorted({language for language, category, difficulty in self._pools})
+
+    def resolve_language(self, language: str) -> str:
+        """Languages without a bank of their own get the default (English) questions"""
+        return language if (language, None, None) in self._pools else DEFAULT_LANGUAGE
+
+    def pool_key(self, language: str, category: Optional[str] = None, difficulty: Optional[str] = None) -> PoolKey:
+        return (self.resolve_language(language),
+                category.casefold() if category else None,
+                difficulty.casefold() if difficulty else None)
+
+    def pool(self, language: str, category: Optional[str] = None, difficulty: Optional[str] = None) -> array:
+        """Positions (into self.items) of the matching questions"""
+        return self._pools.get(self.pool_key(language, category, difficulty), array('I'))
+
+    def get(self, language: str, question_id: int) -> Optional[QuizItem]:
+        position = self._by_id.get((self.resolve_language(language), question_id))
+        return self.items[position] if position is not None else None
+
+    def questions(self, language: str, category: Optional[str] = None,
+                  difficulty: Optional[str] = None) -> List[QuizItem]:
+        return [self.items[position] for position in self.pool(language, category, difficulty)]
+
+    def sampler(self, language: str, category: Optional[str] = None, difficulty: Optional[str] = None,
+                seed: Optional[int] = None) -> "QuizSampler":
+        return QuizSampler(self, self.pool_key(language, category, difficulty), seed)
+
+
+class QuizSampler:
+    """
+    Per-session random draw without repeats over one pool
+    A lazy Fisher-Yates shuffle: only the swapped positions are stored, so each draw is
+    O(1) and the state is O(questions drawn) rather than a shuffled copy of the pool.
+    Once every question has been seen the pool is reshuffled for another round
+    """
+
+    __slots__ = ("bank", "pool_key", "_rng", "_swaps", "_drawn", "rounds")
+
+    def __init__(self, bank: QuizBank, pool_key: PoolKey, seed: Optional[int] = None):
+        self.bank = bank
+        self.pool_key = pool_key
+        self._rng = random.Random(seed)
+        self._swaps: Dict[int, int] = {}
+        self._drawn = 0
+        self.rounds = 0
+
+    @property
+    def remaining(self) -> int:
+        return len(self.bank.pool(*self.pool_key)) - self._drawn
+
+    def draw_one(self) -> Optional[QuizItem]:
+        pool = self.bank.pool(*self.pool_key)
+        if not pool:
+            return None
+        if self._drawn >= len(pool):
+            self._swaps.clear()
+            self._drawn = 0
+            self.rounds += 1
+
+        # Swap a random not-yet-drawn slot into the next slot, storing only the displaced values
+        slot = self._drawn
+        choice = self._rng.randrange(slot, len(pool))
+        picked = self._swaps.get(choice, choice)
+        self._swaps[choice] = self._swaps.get(slot, slot)
+        self._swaps.pop(slot, None)
+        self._drawn += 1
+        return self.bank.items[pool[picked]]
+
+    def draw(self, count: int) -> List[QuizItem]:
+        """
+        Up to count questions, none repeated until the whole pool has been seen
+        A draw that runs into the next round skips that round's picks already in this draw
+        """
+        count = min(count, len(self.bank.pool(*self.pool_key)))
+        picked: List[QuizItem] = []
+        picked_ids = set()
+        while len(picked) < count:
+            item = self.draw_one()
+            if item.id not in picked_ids:
+                picked_ids.add(item.id)
+                picked.append(item)
+        return picked
+
+
+def load_quiz_file(path: str, language: str) -> List[QuizItem]:
+    """Questions from one JSONL file (one question object per line; # lines are comments)"""
+    items = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                items.append(QuizItem.from_record(json.loads(line), language))
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{path}:{line_number}: invalid quiz question ({e})")
+    return items
+
+
+def load_quiz_bank(directory: str = QUIZ_DIR) -> QuizBank:
+    """Every language's bank; the language is the file name (kiswahili.jsonl -> Kiswahili)"""
+    bank = QuizBank()
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".jsonl"):
+            language = filename[:-len(".jsonl")].capitalize()
+            for item in load_quiz_file(os.path.join(directory, filename), language):
+                bank.add(item)
+    return bank
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Bulk quiz grading for classroom submissions
+Grades a JSONL stream of {"question_id", "user_answer"} records (optionally with
+"student_id" and "language") against the quiz bank, without Streamlit. Large files
+are split into line-aligned byte ranges and graded across a process pool; each
+worker loads the bank once and grades every distinct answer to a question only once
+
+Usage: python quiz_grading.py grade submissions.jsonl --language Kikuyu [--workers 4]
+           [--output report.json] [--graded graded.jsonl]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from answer_matcher import AnswerMatcher, MatchResult, normalize_answer
+from quiz_bank import QuizBank, known_words, load_quiz_bank
+
+# Below this size a single process is faster than starting a pool
+MIN_PARALLEL_BYTES = 4 * 1024 * 1024
+TOP_WRONG_ANSWERS = 3
+
+
+def grade_answer(bank: QuizBank, language: str, question: Dict[str, Any], answer: str) -> MatchResult:
+    """
+    Grade one answer to a question dict (as kept in the quiz session)
+    Bank questions use their compiled matcher; anything else is matched on the fly
+    """
+    item = bank.get(language, question.get("id"))
+    if item is not None and item.question == question.get("question"):
+        return item.match(answer)
+    acceptable_answers = question.get("acceptable_answers") or [question.get("correct_answer", "")]
+    return AnswerMatcher.for_question(question.get("question", ""), acceptable_answers,
+                                      question.get("max_edits", 0), known_words(language)).match(answer)
+
+
+class GradeAggregates:
+    """Per-question and per-student tallies; partial results from workers are merged"""
+
+    def __init__(self):
+        self.submissions = 0
+        self.correct = 0
+        self.invalid = 0
+        self.unknown_questions = 0
+        # (language, question_id) -> [attempts, correct, Counter(match kind), Counter(wrong answers)]
+        self.questions: Dict[Tuple[str, Any], List[Any]] = {}
+        # student_id -> [answered, correct]
+        self.students: Dict[str, List[int]] = {}
+
+    def add(self, language: str, question_id: Any, student_id: Optional[str], answer: str,
+            correct: bool, kind: str) -> None:
+        self.submissions += 1
+        question = self.questions.get((language, question_id))
+        if question is None:
+            question = self.questions[(language, question_id)] = [0, 0, Counter(), Counter()]
+        question[0] += 1
+        if correct:
+            self.correct += 1
+            question[1] += 1
+            question[2][kind] += 1
+        elif answer:
+            question[3][answer] += 1
+
+        if student_id is not None:
+            student = self.students.get(student_id)
+            if student is None:
+                student = self.students[student_id] = [0, 0]
+            student[0] += 1
+            student[1] += correct
+
+    def merge(self, other: "GradeAggregates") -> None:
+        self.submissions += other.submissions
+        self.correct += other.correct
+        self.invalid += other.invalid
+        self.unknown_questions += other.unknown_questions
+        for key, (attempts, correct, kinds, wrong) in other.questions.items():
+            question = self.questions.get(key)
+            if question is None:
+                self.questions[key] = [attempts, correct, kinds, wrong]
+                continue
+            question[0] += attempts
+            question[1] += correct
+            question[2].update(kinds)
+            question[3].update(wrong)
+        for student_id, (answered, correct) in other.students.items():
+            student = self.students.setdefault(student_id, [0, 0])
+            student[0] += answered
+            student[1] += correct
+
+    def report(self, bank: QuizBank) -> Dict[str, Any]:
+        questions = []
+        for (language, question_id), (attempts, correct, kinds, wrong) in sorted(
+                self.questions.items(), key=lambda entry: (entry[0][0], str(entry[0][1]))):
+            item = bank.get(language, question_id)
+            questions.append({
+                "language": language,
+                "question_id": question_id,
+                "question": item.question if item else None,
+                "attempts": attempts,
+                "correct": correct,
+                "accuracy": correct / attempts if attempts else 0.0,
+                "accepted_by": dict(kinds),
+                "common_wrong_answers": wrong.most_common(TOP_WRONG_ANSWERS)
+            })
+        students = [
+            {"student_id": student_id, "answered": answered, "correct": correct,
+             "score": correct / answered if answered else 0.0}
+            for student_id, (answered, correct) in sorted(self.students.items())
+        ]
+        return {
+            "submissions": self.submissions,
+            "correct": self.correct,
+            "accuracy": self.correct / self.submissions if self.submissions else 0.0,
+            "invalid_records": self.invalid,
+            "unknown_questions": self.unknown_questions,
+            "questions": questions,
+            "students": students
+        }
+
+
+class Grader:
+    """
+    Grades submissions against the bank, memoizing by (question, normalized answer)
+    A class typically repeats a handful of answers per question, so most
+    submissions are a dictionary lookup rather than a match
+    """
+
+    def __init__(self, bank: QuizBank, default_language: str = "English"):
+        self.bank = bank
+        self.default_language = default_language
+        self._memo: Dict[Tuple[str, Any, str], Tuple[bool, str]] = {}
+
+    def grade(self, record: Dict[str, Any], aggregates: GradeAggregates) -> Optional[Dict[str, Any]]:
+        """Grade one record into aggregates; returns the graded record, or None if it was skipped"""
+        question_id = record.get("question_id")
+        answer = record.get("user_answer", record.get("answer"))
+        # Form and CSV exports often write ids as strings
+        if isinstance(question_id, str) and question_id.strip().isdigit():
+            question_id = int(question_id)
+        language = record.get("language") or self.default_language
+        if (not isinstance(question_id, (int, str)) or isinstance(question_id, bool)
+                or not isinstance(answer, str) or not isinstance(language, str)):
+            aggregates.invalid += 1
+            return None
+
+        language = self.bank.resolve_language(language)
+        item = self.bank.get(language, question_id)
+        if item is None:
+            aggregates.unknown_questions += 1
+            return None
+
+        normalized = normalize_answer(answer)
+        key = (language, question_id, normalized)
+        graded = self._memo.get(key)
+        if graded is None:
+            if normalized in item.normalized_answers:
+                graded = (True, "exact")
+            else:
+                match = item.match(normalized)
+                graded = (match.correct, match.kind)
+            self._memo[key] = graded
+
+        correct, kind = graded
+        student_id = record.get("student_id")
+        aggregates.add(language, question_id, None if student_id is None else str(student_id),
+                       normalized, correct, kind)
+        return {**record, "correct": correct, "accepted_by": kind}
+
+    def grade_lines(self, lines: Iterable[str], aggregates: GradeAggregates, graded_file=None) -> None:
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                aggregates.invalid += 1
+                continue
+            if not isinstance(record, dict):
+                aggregates.invalid += 1
+                continue
+            graded = self.grade(record, aggregates)
+            if graded is not None and graded_file is not None:
+                graded_file.write(json.dumps(graded, ensure_ascii=False) + "\n")
+
+
+def grade_submissions(records: Iterable[Dict[str, Any]], bank: Optional[QuizBank] = None,
+                      language: str = "English") -> Dict[str, Any]:
+    """Grade in-memory submission records and return the aggregate report"""
+    bank = bank or load_quiz_bank()
+    grader = Grader(bank, language)
+    aggregates = GradeAggregates()
+    for record in records:
+        grader.grade(record, aggregates)
+    return aggregates.report(bank)
+
+
+# ============================================
+# Parallel file grading
+# ============================================
+
+_worker_bank: Optional[QuizBank] = None
+
+
+def _init_worker(quiz_dir: Optional[str]) -> None:
+    global _worker_bank
+    _worker_bank = load_quiz_bank(quiz_dir) if quiz_dir else load_quiz_bank()
+
+
+def _read_range(path: str, start: int, end: int) -> Iterable[str]:
+    """Lines starting in [start, end); start and end are line-aligned offsets"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                return
+            # A mis-encoded line fails JSON parsing or grading, not the whole run
+            yield line.decode('utf-8', errors='replace')
+
+
+def _grade_range(path: str, start: int, end: int, language: str,
+                 graded_path: Optional[str]) -> GradeAggregates:
+    grader = Grader(_worker_bank, language)
+    aggregates = GradeAggregates()
+    if graded_path:
+        with open(graded_path, 'w', encoding='utf-8') as graded_file:
+            grader.grade_lines(_read_range(path, start, end), aggregates, graded_file)
+    else:
+        grader.grade_lines(_read_range(path, start, end), aggregates)
+    return aggregates
+
+
+def split_file(path: str, parts: int) -> List[Tuple[int, int]]:
+    """Byte ranges of roughly equal size, each ending at a line boundary"""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        for part in range(1, parts):
+            f.seek(max(boundaries[-1], size * part // parts))
+            f.readline()
+            position = min(f.tell(), size)
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def grade_file(path: str, language: str = "English", workers: Optional[int] = None,
+               graded_path: Optional[str] = None, quiz_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Grade a JSONL submissions file and return the aggregate report
+    graded_path, if given, receives every graded record (in input order)
+    """
+    workers = workers or os.cpu_count() or 1
+    if os.path.getsize(path) < MIN_PARALLEL_BYTES:
+        workers = 1
+
+    _init_worker(quiz_dir)
+    aggregates = GradeAggregates()
+    if workers == 1:
+        aggregates.merge(_grade_range(path, 0, os.path.getsize(path), language, graded_path))
+        return aggregates.report(_worker_bank)
+
+    ranges = split_file(path, workers * 4)
+    part_paths = [f"{graded_path}.part{i}" if graded_path else None for i in range(len(ranges))]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(quiz_dir,)) as pool:
+        futures = [pool.submit(_grade_range, path, start, end, language, part_path)
+                   for (start, end), part_path in zip(ranges, part_paths)]
+        for future in futures:
+            aggregates.merge(future.result())
+
+    if graded_path:
+        with open(graded_path, 'wb') as graded_file:
+            for part_path in part_paths:
+                with open(part_path, 'rb') as part:
+                    graded_file.write(part.read())
+                os.remove(part_path)
+    return aggregates.report(_worker_bank)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quiz grading tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    grade_parser = subcommands.add_parser("grade", help="Grade a JSONL file of classroom submissions")
+    grade_parser.add_argument("submissions", help="JSONL with question_id, user_answer and optional student_id")
+    grade_parser.add_argument("--language", default="English", help="Language of records without one")
+    grade_parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    grade_parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    grade_parser.add_argument("--graded", help="Also write every graded record to this JSONL file")
+    args = parser.parse_args()
+
+    if args.command == "grade":
+        start = time.perf_counter()
+        report = grade_file(args.submissions, args.language, args.workers, args.graded)
+        elapsed = time.perf_counter() - start
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+        rate = report["submissions"] / elapsed * 60 if elapsed else 0
+        print(f"✅ Graded {report['submissions']:,} submissions ({report['accuracy']:.0%} correct, "
+              f"{report['invalid_records']} invalid, {report['unknown_questions']} unknown questions) "
+              f"in {elapsed:.1f}s - {rate:,.0f}/min", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Two-level answer cache for chat queries
+Level 1 is an exact match on (language, normalized query, context hash, prompt version)
+Level 2 optionally matches near-duplicate queries by embedding similarity
+"""
+
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+
+def normalize_query(query: str) -> str:
+    """Fold case, Unicode form, whitespace and trailing punctuation"""
+    normalized = unicodedata.normalize("NFKC", query).lower()
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    return normalized.rstrip("?!.。 ")
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU answer cache shared by all sessions in a process"""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 24 * 3600,
+                 similarity_threshold: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # None disables the near-duplicate level
+        self.similarity_threshold = similarity_threshold
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(language: str, query: str, context: str, prompt_version: str) -> str:
+        return _hash("\x1f".join([language, normalize_query(query), _hash(context), prompt_version]))
+
+    def _expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return now - entry["created"] > self.ttl_seconds
+
+    def _evict(self, key: str) -> None:
+        del self._entries[key]
+        self._stats["evictions"] += 1
+
+    def _find_similar(self, language: str, prompt_version: str,
+                      query_embedding: Sequence[float], now: float) -> Optional[str]:
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vector)
+        if query_norm == 0:
+            return None
+
+        best_key, best_score = None, self.similarity_threshold
+        for key, entry in list(self._entries.items()):
+            if self._expired(entry, now):
+                self._evict(key)
+                continue
+            if (entry["embedding"] is None or entry["language"] != language
+                    or entry["prompt_version"] != prompt_version):
+                continue
+            score = float(np.dot(entry["embedding"], query_vector) / (entry["norm"] * query_norm))
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def get(self, language: str, query: str, context: str, prompt_version: str,
+            query_embedding: Optional[Sequence[float]] = None) -> Optional[str]:
+        """Return the cached raw answer, or None on a miss"""
+        key = self.make_key(language, query, context, prompt_version)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                self._evict(key)
+                entry = None
+
+            if entry is not None:
+                self._stats["exact_hits"] += 1
+            elif self.similarity_threshold is not None and query_embedding is not None:
+                similar_key = self._find_similar(language, prompt_version, query_embedding, now)
+                if similar_key is not None:
+                    key, entry = similar_key, self._entries[similar_key]
+                    self._stats["similar_hits"] += 1
+
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            return entry["answer"]
+
+    def put(self, language: str, query: str, context: str, prompt_version: str, answer: str,
+            query_embedding: Optional[Sequence[float]] = None) -> None:
+        key = self.make_key(language, query, context, prompt_version)
+        embedding, norm = None, None
+        if query_embedding is not None:
+            embedding = np.asarray(query_embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(embedding)) or None
+            if norm is None:
+                embedding = None
+
+        with self._lock:
+            self._entries[key] = {
+                "answer": answer,
+                "language": language,
+                "prompt_version": prompt_version,
+                "embedding": embedding,
+                "norm": norm,
+                "created": time.time(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["exact_hits"] + stats["similar_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["exact_hits"] + stats["similar_hits"]) / lookups if lookups else 0.0
+        return stats
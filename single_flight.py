@@ -0,0 +1,171 @@
+"""
+Single-flight coalescing of identical LLM requests
+When several learners send the same fully rendered prompt at once (a whole class
+opening the same category or asking the same review question), only the first
+request goes upstream; the others wait for it and share its result. Streamed
+answers are shared too: every caller replays the one upstream stream from the start
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+
+def prompt_key(llm, prompt) -> str:
+    """
+    Identity of an LLM request: the model settings plus the rendered prompt
+    prompt is a string or a list of chat messages
+    """
+    settings = (getattr(llm, "model_name", None), getattr(llm, "temperature", None), getattr(llm, "max_tokens", None))
+    if isinstance(prompt, str):
+        text = prompt
+    else:
+        text = "\x1e".join(f"{message.type}\x1f{message.content}" for message in prompt)
+    digest = hashlib.sha256(repr(settings).encode('utf-8'))
+    digest.update(b"\x1d")
+    digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class _SharedStream:
+    """Chunks of one upstream stream, replayable by any number of readers on the same event loop"""
+
+    def __init__(self):
+        self.chunks: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+
+    def _notify(self) -> None:
+        # Wake everyone waiting on the current event; later waiters get a fresh one
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def append(self, chunk: Any) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+    async def replay(self) -> AsyncIterator[Any]:
+        position = 0
+        while True:
+            while position < len(self.chunks):
+                yield self.chunks[position]
+                position += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+
+class SingleFlight:
+    """
+    Thread-safe registry of in-flight LLM calls keyed by prompt_key()
+    do() serves Streamlit script threads; do_async() and stream() serve the
+    chat pipeline's event loop. Sync and async callers of the same key share one call
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, concurrent.futures.Future] = {}
+        self._streams: Dict[str, _SharedStream] = {}
+        self._stats = {"upstream_calls": 0, "coalesced": 0}
+
+    def _join_call(self, key: str) -> Tuple[concurrent.futures.Future, bool]:
+        """(future for the key, whether this caller is the one that makes the call)"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+            future = concurrent.futures.Future()
+            self._calls[key] = future
+            self._stats["upstream_calls"] += 1
+            return future, True
+
+    def _leave_call(self, key: str, future: concurrent.futures.Future) -> None:
+        # Requests arriving after this point start a new call (or hit the response cache)
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn() unless an identical call is already in flight, in which case wait for its result"""
+        future, leader = self._join_call(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._leave_call(key, future)
+            future.set_exception(e)
+            raise
+        self._leave_call(key, future)
+        future.set_result(result)
+        return result
+
+    async def do_async(self, key: str, coroutine_fn: Callable[[], Any]) -> Any:
+        """Async do(): the upstream call runs as its own task, so a cancelled caller cannot strand the others"""
+        future, leader = self._join_call(key)
+        if leader:
+            task = asyncio.ensure_future(coroutine_fn())
+
+            def finish(task: asyncio.Task) -> None:
+                self._leave_call(key, future)
+                if task.cancelled():
+                    future.set_exception(asyncio.CancelledError())
+                elif task.exception() is not None:
+                    future.set_exception(task.exception())
+                else:
+                    future.set_result(task.result())
+
+            task.add_done_callback(finish)
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    async def stream(self, key: str, stream_fn: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        """Yield the chunks of stream_fn(), sharing one upstream stream between identical callers"""
+        with self._lock:
+            shared = self._streams.get(key)
+            leader = shared is None
+            if leader:
+                shared = _SharedStream()
+                self._streams[key] = shared
+                self._stats["upstream_calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if leader:
+            asyncio.ensure_future(self._pump(key, shared, stream_fn))
+        async for chunk in shared.replay():
+            yield chunk
+
+    async def _pump(self, key: str, shared: _SharedStream, stream_fn: Callable[[], AsyncIterator[Any]]) -> None:
+        error = None
+        try:
+            async for chunk in stream_fn():
+                shared.append(chunk)
+        except BaseException as e:
+            error = e
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            with self._lock:
+                if self._streams.get(key) is shared:
+                    del self._streams[key]
+            shared.close(error)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls) + len(self._streams)
+        requests = stats["upstream_calls"] + stats["coalesced"]
+        stats["requests"] = requests
+        stats["coalesced_rate"] = stats["coalesced"] / requests if requests else 0.0
+        return stats
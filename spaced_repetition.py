@@ -0,0 +1,219 @@
+"""
+Spaced-repetition scheduling of quiz questions (SM-2)
+Each learner's review state per question is kept in compact records, persisted in
+SQLite, and ordered by due time in a binary heap: recording a review is an O(log n)
+push, and picking the next due questions pops only what is needed, so selection
+stays fast as a learner accumulates thousands of reviewed questions
+"""
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_CACHE_DIR = os.getenv("TUTOR_CACHE_DIR", ".tutor_cache")
+DAY_SECONDS = 24 * 3600
+
+# SM-2 grades (0-5) for quiz outcomes
+QUALITY_EXACT = 5
+QUALITY_CLOSE = 4      # accepted with missing diacritics or a small typo
+QUALITY_WRONG = 1
+QUALITY_SKIPPED = 0
+
+# A failed question comes back within the same practice session
+RELEARN_SECONDS = 10 * 60
+MIN_EASE = 1.3
+
+
+def answer_quality(correct: bool, kind: str = "exact", skipped: bool = False) -> int:
+    """SM-2 grade for a graded answer (kind as in answer_matcher.MatchResult)"""
+    if skipped:
+        return QUALITY_SKIPPED
+    if not correct:
+        return QUALITY_WRONG
+    return QUALITY_EXACT if kind == "exact" else QUALITY_CLOSE
+
+
+class ItemState:
+    """SM-2 state of one question for one learner"""
+
+    __slots__ = ("item_id", "repetitions", "interval_days", "ease", "due", "lapses", "reviews")
+
+    def __init__(self, item_id: int, repetitions: int = 0, interval_days: float = 0.0, ease: float = 2.5,
+                 due: float = 0.0, lapses: int = 0, reviews: int = 0):
+        self.item_id = item_id
+        self.repetitions = repetitions
+        self.interval_days = interval_days
+        self.ease = ease
+        self.due = due
+        self.lapses = lapses
+        self.reviews = reviews
+
+    def review(self, quality: int, now: float) -> None:
+        """Apply one SM-2 review"""
+        self.reviews += 1
+        if quality < 3:
+            self.repetitions = 0
+            self.lapses += 1
+            self.interval_days = 0.0
+            self.due = now + RELEARN_SECONDS
+        else:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval_days = 1.0
+            elif self.repetitions == 2:
+                self.interval_days = 6.0
+            else:
+                self.interval_days = round(self.interval_days * self.ease, 2)
+            self.due = now + self.interval_days * DAY_SECONDS
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+
+    def as_row(self) -> Tuple[int, int, float, float, float, int, int]:
+        return (self.item_id, self.repetitions, self.interval_days, self.ease, self.due, self.lapses, self.reviews)
+
+
+class ReviewScheduler:
+    """
+    One learner's review queue for one language
+    The heap holds (due, item_id, version) entries; a review pushes a new entry and
+    bumps the item's version, so outdated entries are skipped when they surface
+    """
+
+    def __init__(self, states: Iterable[ItemState] = ()):
+        self.states: Dict[int, ItemState] = {}
+        self._versions: Dict[int, int] = {}
+        self._heap: List[Tuple[float, int, int]] = []
+        for state in states:
+            self.states[state.item_id] = state
+            self._versions[state.item_id] = 0
+            self._heap.append((state.due, state.item_id, 0))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self.states
+
+    def review(self, item_id: int, quality: int, now: Optional[float] = None) -> ItemState:
+        now = time.time() if now is None else now
+        state = self.states.get(item_id)
+        if state is None:
+            state = self.states[item_id] = ItemState(item_id)
+        state.review(quality, now)
+        version = self._versions.get(item_id, -1) + 1
+        self._versions[item_id] = version
+        heapq.heappush(self._heap, (state.due, item_id, version))
+        # Stale entries are dropped lazily; rebuild if they come to dominate the heap
+        if len(self._heap) > 2 * len(self.states) + 64:
+            self._heap = [(s.due, s.item_id, self._versions[s.item_id]) for s in self.states.values()]
+            heapq.heapify(self._heap)
+        return state
+
+    def _pop_valid(self) -> Optional[Tuple[float, int, int]]:
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if self._versions.get(entry[1]) == entry[2]:
+                return entry
+        return None
+
+    def next_items(self, count: int, now: Optional[float] = None, due_only: bool = True,
+                   exclude: Iterable[int] = ()) -> List[int]:
+        """
+        Up to count item ids in due order (O(count log n))
+        With due_only, only items already due; otherwise the soonest due as well
+        """
+        now = time.time() if now is None else now
+        exclude = set(exclude)
+        picked: List[Tuple[float, int, int]] = []
+        skipped: List[Tuple[float, int, int]] = []
+        while len(picked) < count:
+            entry = self._pop_valid()
+            if entry is None:
+                break
+            if due_only and entry[0] > now:
+                skipped.append(entry)
+                break
+            (skipped if entry[1] in exclude else picked).append(entry)
+        for entry in picked + skipped:
+            heapq.heappush(self._heap, entry)
+        return [item_id for _, item_id, _ in picked]
+
+    def due_count(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        return sum(1 for state in self.states.values() if state.due <= now)
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, Any]:
+        return {
+            "items": len(self.states),
+            "due": self.due_count(now),
+            "reviews": sum(state.reviews for state in self.states.values()),
+            "lapses": sum(state.lapses for state in self.states.values()),
+            "heap_entries": len(self._heap)
+        }
+
+
+class ReviewStore:
+    """SQLite persistence of learners' review states, so progress survives restarts"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            db_path = os.path.join(DEFAULT_CACHE_DIR, "reviews.sqlite3")
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS review_state ("
+            " learner TEXT NOT NULL, language TEXT NOT NULL, item_id INTEGER NOT NULL,"
+            " repetitions INTEGER NOT NULL, interval_days REAL NOT NULL, ease REAL NOT NULL,"
+            " due REAL NOT NULL, lapses INTEGER NOT NULL, reviews INTEGER NOT NULL,"
+            " PRIMARY KEY (learner, language, item_id))"
+        )
+        self._db.commit()
+
+    def load(self, learner: str, language: str) -> ReviewScheduler:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT item_id, repetitions, interval_days, ease, due, lapses, reviews"
+                " FROM review_state WHERE learner = ? AND language = ?",
+                (learner, language)
+            ).fetchall()
+        return ReviewScheduler(ItemState(*row) for row in rows)
+
+    def save(self, learner: str, language: str, state: ItemState) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO review_state"
+                " (learner, language, item_id, repetitions, interval_days, ease, due, lapses, reviews)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (learner, language) + state.as_row()
+            )
+            self._db.commit()
+
+
+def select_questions(scheduler: ReviewScheduler, new_items: Iterable[Any], count: int,
+                     now: Optional[float] = None, exclude: Iterable[int] = ()) -> Tuple[List[int], List[Any]]:
+    """
+    The next quiz: due reviews first, then unseen questions from new_items (any
+    iterable of objects with an .id, e.g. a bank sampler's draws), then the reviews
+    due soonest. Returns (review item ids, new items)
+    """
+    exclude = set(exclude)
+    reviews = scheduler.next_items(count, now, due_only=True, exclude=exclude)
+    fresh: List[Any] = []
+    # new_items may yield an item more than once (e.g. a sampler starting a new round)
+    seen = set()
+    if len(reviews) < count:
+        for item in new_items:
+            if item.id not in scheduler and item.id not in exclude and item.id not in seen:
+                seen.add(item.id)
+                fresh.append(item)
+                if len(reviews) + len(fresh) >= count:
+                    break
+    if len(reviews) + len(fresh) < count:
+        reviews += scheduler.next_items(count - len(reviews) - len(fresh), now, due_only=False,
+                                        exclude=exclude | set(reviews))
+    return reviews, fresh
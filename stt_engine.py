@@ -0,0 +1,278 @@
+"""
+Speech-to-text audio preparation and recognizer backends
+Recordings are decoded in memory, downmixed and resampled to 16 kHz mono, and
+trimmed to the voiced region with an energy-based voice-activity detector, so
+the recognizer only receives the speech itself. Recognition goes through
+pluggable backends (Google Web Speech, or a local faster-whisper model)
+"""
+
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+TARGET_SAMPLE_RATE = 16000
+# Forces one recognizer for every language, e.g. "whisper" for offline deployments
+STT_BACKEND_OVERRIDE = os.getenv("STT_BACKEND")
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small")
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+
+
+def decode_wav(wav_bytes: bytes) -> Tuple[np.ndarray, int]:
+    """Decode WAV bytes to mono float32 samples in [-1, 1] and the sample rate"""
+    with wave.open(BytesIO(wav_bytes), 'rb') as wav:
+        channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        sample_rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    if sample_width == 1:
+        # 8-bit WAV is unsigned
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768
+    elif sample_width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(raw), 4), dtype=np.uint8)
+        padded[:, 1:] = raw
+        samples = padded.view('<i4').ravel().astype(np.float32) / 2147483648
+    elif sample_width == 4:
+        samples = np.frombuffer(frames, dtype='<i4').astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width} bytes")
+
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+    return samples, sample_rate
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int = TARGET_SAMPLE_RATE) -> np.ndarray:
+    """
+    Resample to the target rate
+    Whole-number downsampling (48k/32k -> 16k) averages each block, which also acts as
+    the anti-aliasing filter; other ratios use linear interpolation
+    """
+    if source_rate == target_rate or len(samples) == 0:
+        return samples
+    if source_rate > target_rate and source_rate % target_rate == 0:
+        factor = source_rate // target_rate
+        usable = len(samples) - len(samples) % factor
+        return samples[:usable].reshape(-1, factor).mean(axis=1)
+
+    duration = len(samples) / source_rate
+    target_length = max(1, int(round(duration * target_rate)))
+    source_times = np.arange(len(samples)) / source_rate
+    target_times = np.arange(target_length) / target_rate
+    return np.interp(target_times, source_times, samples).astype(np.float32)
+
+
+def voiced_region(samples: np.ndarray, sample_rate: int, frame_ms: int = 30,
+                  padding_ms: int = 200, min_level: float = 0.01) -> Tuple[int, int]:
+    """
+    (start, end) sample indices of the speech in the clip, or (0, 0) when nothing is voiced
+    A frame counts as voiced when its RMS is well above the clip's noise floor
+    (estimated from its quietest frames) and above an absolute minimum level
+    """
+    frame_length = max(1, sample_rate * frame_ms // 1000)
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return 0, 0
+
+    frames = samples[:frame_count * frame_length].reshape(frame_count, frame_length)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    noise_floor = np.percentile(rms, 10)
+    voiced = np.flatnonzero(rms > max(noise_floor * 3, min_level))
+    if len(voiced) == 0:
+        return 0, 0
+
+    padding = sample_rate * padding_ms // 1000
+    start = max(0, voiced[0] * frame_length - padding)
+    end = min(len(samples), (voiced[-1] + 1) * frame_length + padding)
+    return start, end
+
+
+def to_pcm16(samples: np.ndarray) -> bytes:
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+
+
+def prepare_audio(wav_bytes: bytes, target_rate: int = TARGET_SAMPLE_RATE) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Decode, downmix, resample and trim a recording for recognition
+    Returns (16-bit mono PCM at target_rate, stats); the PCM is empty when no speech was found
+    """
+    start_time = time.perf_counter()
+    samples, source_rate = decode_wav(wav_bytes)
+    original_seconds = len(samples) / source_rate if source_rate else 0.0
+
+    samples = resample(samples, source_rate, target_rate)
+    start, end = voiced_region(samples, target_rate)
+    pcm = to_pcm16(samples[start:end])
+
+    stats = {
+        "input_bytes": len(wav_bytes),
+        # Raw PCM handed to the recognizer (the Google backend re-encodes it as FLAC to upload)
+        "pcm_bytes": len(pcm),
+        "source_rate": source_rate,
+        "original_seconds": original_seconds,
+        "speech_seconds": float(end - start) / target_rate,
+        "prepare_ms": (time.perf_counter() - start_time) * 1000,
+    }
+    return pcm, stats
+
+
+# ============================================
+# Transcription memo
+# ============================================
+
+class TranscriptionCache:
+    """
+    Thread-safe LRU of finished transcriptions keyed by audio fingerprint
+    Streamlit reruns the speech panel while a recording stays in the widget;
+    this makes every rerun after the first a dictionary lookup
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(audio_bytes: bytes, language: str, backend: str) -> str:
+        digest = hashlib.sha256(audio_bytes)
+        digest.update(f"\x1f{language}\x1f{backend}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        return stats
+
+
+# ============================================
+# Backends
+# ============================================
+
+class NoSpeechError(Exception):
+    """The recognizer heard nothing it could transcribe"""
+
+
+class RecognitionServiceError(Exception):
+    """The recognizer itself failed (network, quota, model loading)"""
+
+
+class STTBackend(ABC):
+    """A speech recognizer over 16-bit mono PCM"""
+
+    name = "base"
+    offline = False
+
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def transcribe(self, pcm: bytes, sample_rate: int, language: str) -> str:
+        """Text for the audio; language is a BCP-47 code such as "sw-KE" """
+
+
+class GoogleBackend(STTBackend):
+    """Google Web Speech API through SpeechRecognition (one upload per utterance)"""
+
+    name = "google"
+
+    def available(self) -> bool:
+        return importlib.util.find_spec("speech_recognition") is not None
+
+    def transcribe(self, pcm: bytes, sample_rate: int, language: str) -> str:
+        import speech_recognition as sr
+
+        try:
+            return sr.Recognizer().recognize_google(sr.AudioData(pcm, sample_rate, 2), language=language)
+        except sr.UnknownValueError:
+            raise NoSpeechError()
+        except sr.RequestError as e:
+            raise RecognitionServiceError(str(e))
+
+
+class WhisperBackend(STTBackend):
+    """
+    Local faster-whisper model on the CPU
+    The model is loaded on first use and shared by every session in the process
+    """
+
+    name = "whisper"
+    offline = True
+
+    def __init__(self, model_size: str = WHISPER_MODEL, compute_type: str = WHISPER_COMPUTE_TYPE):
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self._model = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        return importlib.util.find_spec("faster_whisper") is not None
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def load(self):
+        with self._lock:
+            if self._model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                    self._model = WhisperModel(self.model_size, device="cpu", compute_type=self.compute_type)
+                except Exception as e:
+                    raise RecognitionServiceError(f"Could not load Whisper model '{self.model_size}': {e}")
+        return self._model
+
+    def transcribe(self, pcm: bytes, sample_rate: int, language: str) -> str:
+        samples = np.frombuffer(pcm, dtype='<i2').astype(np.float32) / 32768
+        samples = resample(samples, sample_rate, TARGET_SAMPLE_RATE)
+        # Whisper takes the bare language code ("sw", not "sw-KE")
+        segments, _ = self.load().transcribe(samples, language=language.split("-")[0], beam_size=1)
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            raise NoSpeechError()
+        return text
+
+
+STT_BACKENDS: Dict[str, STTBackend] = {
+    backend.name: backend for backend in (GoogleBackend(), WhisperBackend())
+}
+DEFAULT_STT_BACKEND = "google"
+
+
+def get_stt_backend(name: Optional[str] = None) -> Optional[STTBackend]:
+    """Recognizer by name (STT_BACKEND overrides the per-language choice); None if it is not installed"""
+    backend = STT_BACKENDS.get(STT_BACKEND_OVERRIDE or name or DEFAULT_STT_BACKEND)
+    if backend is None or not backend.available():
+        return None
+    return backend
@@ -0,0 +1,37 @@
+"""
+Token counting for prompts and retrieved context
+Uses tiktoken when its encoding is available, otherwise a ~4 characters/token estimate
+"""
+
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        # Unknown model, or the encoding file could not be downloaded
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Number of tokens the model will see for this text"""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return max(1, (len(text) + 3) // 4)
+
+
+def is_exact(model: str = "gpt-4") -> bool:
+    """True when counts come from the model's tokenizer rather than the estimate"""
+    return _encoding(model) is not None
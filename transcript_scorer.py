@@ -0,0 +1,108 @@
+"""
+Lexicon-based confidence scoring for speech transcripts
+A transcript whose words are all in the language's verified vocabulary (knowledge base,
+Gĩkũyũ dictionary and common-word list) is trusted as is; anything else is escalated
+to the LLM correction step
+"""
+
+import os
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from knowledge_base import LANGUAGE_DATA_DIR, load_language_knowledge_from_json
+
+FREQUENCY_DIR = os.path.join(LANGUAGE_DATA_DIR, "frequency")
+
+_WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+_PARENTHESIZED = re.compile(r"\([^)]*\)")
+
+
+def normalize_word(word: str) -> str:
+    # Case-folded but diacritics kept: "mutĩ" must not pass for "mũtĩ"
+    return unicodedata.normalize("NFC", word).casefold().replace("’", "'")
+
+
+def tokenize(text: str) -> List[str]:
+    return [normalize_word(word) for word in _WORD.findall(unicodedata.normalize("NFC", text))]
+
+
+def _collect_strings(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _collect_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _collect_strings(item)
+
+
+def load_frequency_words(language: str) -> Set[str]:
+    """Words from language_data/frequency/<language>.txt, if present"""
+    path = os.path.join(FREQUENCY_DIR, f"{language.lower()}.txt")
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return {normalize_word(line.strip()) for line in f if line.strip() and not line.startswith("#")}
+
+
+def lexicon_words(language: str, gikuyu_dictionary: Optional[Dict[str, Dict[str, str]]] = None) -> Set[str]:
+    """
+    Every target-language word in the verified data
+    Vocabulary entries, their forms and examples (English glosses in parentheses are
+    dropped), the Gĩkũyũ dictionary for Kikuyu, and the common-word list
+    """
+    words = load_frequency_words(language)
+
+    knowledge = load_language_knowledge_from_json(language) or {}
+    for section in knowledge.get('vocabulary', {}).values():
+        for entry, info in section.items():
+            words.update(tokenize(entry))
+            if not isinstance(info, dict):
+                continue
+            for field, value in info.items():
+                # meaning/usage/pos are English descriptions, not target-language text
+                if field in ('meaning', 'usage', 'pos', 'class'):
+                    continue
+                for text in _collect_strings(value):
+                    words.update(tokenize(_PARENTHESIZED.sub(" ", text)))
+
+    if language == "Kikuyu" and gikuyu_dictionary:
+        for entries in gikuyu_dictionary.values():
+            for entry in entries:
+                words.update(tokenize(entry))
+
+    return words
+
+
+class TranscriptScorer:
+    """Decides whether a transcript can skip AI correction; counts the calls avoided"""
+
+    def __init__(self, words: Iterable[str], min_coverage: float = 1.0):
+        self.words = {normalize_word(word) for word in words}
+        self.min_coverage = min_coverage
+        self._lock = threading.Lock()
+        self._stats = {"fast_path": 0, "escalated": 0}
+
+    def score(self, text: str) -> Dict[str, Any]:
+        tokens = tokenize(text)
+        unknown = [token for token in tokens if token not in self.words]
+        coverage = 1 - len(unknown) / len(tokens) if tokens else 0.0
+        return {"tokens": len(tokens), "unknown": unknown, "coverage": coverage}
+
+    def is_confident(self, text: str) -> bool:
+        """True (and counted as an avoided LLM call) when the transcript is covered by the lexicon"""
+        confident = self.score(text)["coverage"] >= self.min_coverage
+        with self._lock:
+            self._stats["fast_path" if confident else "escalated"] += 1
+        return confident
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats["fast_path"] + stats["escalated"]
+        stats["lexicon_size"] = len(self.words)
+        stats["avoided_rate"] = stats["fast_path"] / total if total else 0.0
+        return stats
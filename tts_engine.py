@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Text-to-speech synthesis with a content-addressed on-disk audio cache
+Synthesis goes through pluggable backends (Google TTS, or a local espeak-ng engine);
+audio is keyed by (backend, text, tts_lang, slow), so repeat playback is a local file read
+
+Usage: python tts_engine.py prewarm [--languages Kikuyu Kiswahili] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from gtts import gTTS
+
+DEFAULT_CACHE_DIR = os.getenv("TUTOR_CACHE_DIR", ".tutor_cache")
+DEFAULT_MAX_BYTES = int(float(os.getenv("TTS_CACHE_MAX_MB", "200")) * 1024 * 1024)
+TTS_WORKERS = int(os.getenv("TTS_WORKERS", "4"))
+# Forces one backend for every language, e.g. "espeak" for offline deployments
+TTS_BACKEND_OVERRIDE = os.getenv("TTS_BACKEND")
+
+AUDIO_EXTENSIONS = (".mp3", ".wav")
+
+
+class AudioCache:
+    """Size-capped audio store; least recently played files are evicted first"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or os.path.join(DEFAULT_CACHE_DIR, "tts")
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def make_key(text: str, tts_lang: str, slow: bool = False, backend: str = "gtts") -> str:
+        # gTTS keys are unprefixed so audio cached before backends existed stays valid
+        prefix = "" if backend == "gtts" else f"{backend}\x1f"
+        return hashlib.sha256(f"{prefix}{tts_lang}\x1f{int(slow)}\x1f{text}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, fmt: str = "mp3") -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{fmt}")
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(AUDIO_EXTENSIONS):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def contains(self, key: str, fmt: str = "mp3") -> bool:
+        return os.path.exists(self._path(key, fmt))
+
+    def get(self, key: str, fmt: str = "mp3") -> Optional[bytes]:
+        path = self._path(key, fmt)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # mtime doubles as the last-played time for LRU eviction
+            os.utime(path, None)
+        except OSError:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        with self._lock:
+            self._stats["hits"] += 1
+        return data
+
+    def put(self, key: str, data: bytes, fmt: str = "mp3") -> None:
+        path = self._path(key, fmt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # Re-caching a key replaces its file: only the size difference is new
+            try:
+                replaced_bytes = os.stat(path).st_size
+            except OSError:
+                replaced_bytes = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._total_bytes += len(data) - replaced_bytes
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Rescan so files written by other processes are accounted for
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                self._stats["evictions"] += 1
+            except OSError:
+                pass
+        self._total_bytes = total
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["bytes"] = self._total_bytes
+        stats["max_bytes"] = self.max_bytes
+        return stats
+
+
+# ============================================
+# Backends
+# ============================================
+
+class TTSBackend(ABC):
+    """A speech synthesizer; subclasses return encoded audio in their own format"""
+
+    name = "base"
+    format = "mp3"
+
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def synthesize(self, text: str, tts_lang: str, slow: bool = False) -> bytes:
+        """Encoded audio (in self.format) for the text"""
+
+
+class GTTSBackend(TTSBackend):
+    """Google TTS: good voices, one network round trip per utterance"""
+
+    name = "gtts"
+    format = "mp3"
+
+    def synthesize(self, text: str, tts_lang: str, slow: bool = False) -> bytes:
+        tts = gTTS(text=text, lang=tts_lang, slow=slow)
+        audio_bytes = BytesIO()
+        tts.write_to_fp(audio_bytes)
+        return audio_bytes.getvalue()
+
+
+class EspeakBackend(TTSBackend):
+    """Local espeak-ng on the CPU: robotic, but offline and a few milliseconds per sentence"""
+
+    name = "espeak"
+    format = "wav"
+
+    # tts_lang codes that need a different espeak-ng voice name
+    VOICES = {"en": "en-us"}
+
+    def __init__(self, speed: int = 160, slow_speed: int = 110):
+        self.speed = speed
+        self.slow_speed = slow_speed
+        self.executable = shutil.which("espeak-ng") or shutil.which("espeak")
+
+    def available(self) -> bool:
+        return self.executable is not None
+
+    def synthesize(self, text: str, tts_lang: str, slow: bool = False) -> bytes:
+        if not self.executable:
+            raise RuntimeError("espeak-ng is not installed")
+        command = [
+            self.executable, "--stdout",
+            "-v", self.VOICES.get(tts_lang, tts_lang),
+            "-s", str(self.slow_speed if slow else self.speed),
+            # Text goes in on stdin: as an argument, a chunk like "- item" is read as an option
+            "--stdin"
+        ]
+        result = subprocess.run(command, input=text.encode('utf-8'), capture_output=True, timeout=30)
+        if result.returncode != 0 or not result.stdout:
+            raise RuntimeError(f"espeak-ng failed: {result.stderr.decode('utf-8', 'replace').strip()}")
+        return result.stdout
+
+
+TTS_BACKENDS: Dict[str, TTSBackend] = {
+    backend.name: backend for backend in (GTTSBackend(), EspeakBackend())
+}
+DEFAULT_BACKEND = "gtts"
+
+
+def get_backend(name: Optional[str] = None) -> TTSBackend:
+    """
+    Backend by name (TTS_BACKEND overrides the per-language choice)
+    Falls back to gTTS when the requested local engine is not installed
+    """
+    backend = TTS_BACKENDS.get(TTS_BACKEND_OVERRIDE or name or DEFAULT_BACKEND)
+    if backend is None or not backend.available():
+        return TTS_BACKENDS[DEFAULT_BACKEND]
+    return backend
+
+
+def audio_mime_type(data: bytes) -> str:
+    """MIME type of synthesized audio, for players that need one"""
+    return "audio/wav" if data[:4] == b"RIFF" else "audio/mpeg"
+
+
+def synthesize_gtts(text: str, tts_lang: str, slow: bool = False) -> bytes:
+    """Synthesize MP3 bytes with Google TTS (one network round trip)"""
+    return TTS_BACKENDS["gtts"].synthesize(text, tts_lang, slow)
+
+
+def synthesize(text: str, tts_lang: str, slow: bool = False, cache: Optional[AudioCache] = None,
+               backend: Optional[str] = None) -> bytes:
+    """Audio bytes for the text, read from the cache when it has been synthesized before"""
+    engine = get_backend(backend)
+    if cache is None:
+        return engine.synthesize(text, tts_lang, slow)
+
+    key = cache.make_key(text, tts_lang, slow, engine.name)
+    data = cache.get(key, engine.format)
+    if data is None:
+        data = engine.synthesize(text, tts_lang, slow)
+        cache.put(key, data, engine.format)
+    return data
+
+
+# ============================================
+# Sentence chunking
+# ============================================
+
+# A short first chunk lets playback start quickly; later ones are merged to save requests
+FIRST_CHUNK_CHARS = 120
+MAX_CHUNK_CHARS = 300
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+|\n+")
+_CLAUSE_END = re.compile(r"(?<=[,;:])\s+")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """One bounded pool for the whole process, so concurrent learners cannot flood gTTS"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=TTS_WORKERS, thread_name_prefix="tts")
+        return _executor
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    if len(sentence) <= max_chars:
+        return [sentence]
+    pieces, current = [], ""
+    for part in _CLAUSE_END.split(sentence):
+        for word in (part.split(" ") if len(part) > max_chars else [part]):
+            candidate = f"{current} {word}".strip()
+            if current and len(candidate) > max_chars:
+                pieces.append(current)
+                candidate = word
+            current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_sentences(text: str, max_chars: int = MAX_CHUNK_CHARS, first_max_chars: int = FIRST_CHUNK_CHARS) -> List[str]:
+    """
+    Split text at sentence boundaries into chunks for synthesis
+    The first chunk is kept short so playback can start quickly; later sentences
+    are merged up to max_chars to keep the number of requests down
+    """
+    sentences = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence = sentence.strip()
+        if sentence:
+            sentences.extend(_split_long(sentence, first_max_chars if not sentences else max_chars))
+
+    chunks: List[str] = []
+    for sentence in sentences:
+        # The first chunk stays a single sentence; later ones are merged
+        if len(chunks) > 1 and len(chunks[-1]) + 1 + len(sentence) <= max_chars:
+            chunks[-1] = f"{chunks[-1]} {sentence}"
+        else:
+            chunks.append(sentence)
+    return chunks
+
+
+async def synthesize_async(text: str, tts_lang: str, slow: bool = False,
+                           cache: Optional[AudioCache] = None, backend: Optional[str] = None) -> bytes:
+    """synthesize() on the shared TTS pool, awaitable from an event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_shared_executor(), synthesize, text, tts_lang, slow, cache, backend)
+
+
+# ============================================
+# Pre-warming
+# ============================================
+
+def prewarm_items(languages: Optional[Iterable[str]] = None) -> List[Tuple[str, str, Optional[str]]]:
+    """(text, tts_lang, backend) for every greeting, dictionary word and quiz prompt"""
+    from knowledge_base import load_language_knowledge_from_json
+    from language_config import GIKUYU_DICTIONARY, SUPPORTED_LANGUAGES
+    from quiz_bank import load_quiz_bank
+
+    quiz_bank = load_quiz_bank()
+    items: Dict[Tuple[str, str, Optional[str]], None] = {}
+    for language in languages or SUPPORTED_LANGUAGES:
+        lang_info = SUPPORTED_LANGUAGES[language]
+        tts_lang = lang_info['tts_lang']
+        backend = lang_info.get('tts_backend')
+
+        items[(lang_info['greeting'], tts_lang, backend)] = None
+
+        knowledge = load_language_knowledge_from_json(language) or {}
+        vocab = knowledge.get('vocabulary', {})
+        for section in ('basic_words', 'greetings'):
+            for word in vocab.get(section, {}):
+                items[(word, tts_lang, backend)] = None
+
+        if language == "Kikuyu":
+            for words in GIKUYU_DICTIONARY.values():
+                for word in words:
+                    items[(word, tts_lang, backend)] = None
+
+        for question in quiz_bank.questions(language):
+            items[(question.question, tts_lang, backend)] = None
+
+    return list(items)
+
+
+def prewarm(cache: AudioCache, languages: Optional[Iterable[str]] = None, workers: int = 4) -> Dict[str, int]:
+    """Synthesize everything learners commonly play so first playback is a cache hit"""
+    items = prewarm_items(languages)
+    result = {"total": len(items), "cached": 0, "synthesized": 0, "failed": 0}
+
+    pending = []
+    for text, tts_lang, backend in items:
+        engine = get_backend(backend)
+        if cache.contains(cache.make_key(text, tts_lang, False, engine.name), engine.format):
+            result["cached"] += 1
+        else:
+            pending.append((text, tts_lang, backend))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(synthesize, text, tts_lang, False, cache, backend): text
+                   for text, tts_lang, backend in pending}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                result["synthesized"] += 1
+            except Exception as e:
+                result["failed"] += 1
+                print(f"❌ Failed: {futures[future][:50]!r}: {e}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text-to-speech cache tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    prewarm_parser = subcommands.add_parser("prewarm", help="Synthesize greetings, dictionary words and quiz prompts")
+    prewarm_parser.add_argument("--languages", nargs="*", help="Languages to pre-warm (default: all)")
+    prewarm_parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.command == "prewarm":
+        cache = AudioCache()
+        print("🔊 Pre-warming TTS cache...")
+        result = prewarm(cache, args.languages, args.workers)
+        print(f"✅ {result['synthesized']} synthesized, {result['cached']} already cached, "
+              f"{result['failed']} failed (of {result['total']})")
+        print(f"📦 Cache size: {cache.stats()['bytes'] / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Per-language tutor system prompts, compiled once per process
+Every variant starts with the same shared prefix so provider-side prompt caching can hit it;
+only the selected language's rules (and, for Gĩkũyũ, the anti-hallucination block and
+verified dictionary) follow
+
+Usage: python tutor_prompts.py   # print the token report for each variant
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, Optional
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from token_counter import count_tokens, is_exact
+
+# Identical for every language - keep it first and keep it stable
+SHARED_PREFIX = """You are an expert AI tutor for African languages. You are powered by GPT-4 and have strong knowledge of African languages.
+
+Your role is to help learners master the language they are studying through clear, accurate instruction.
+
+TEACHING APPROACH:
+1. Provide accurate, helpful answers to all language questions
+2. Give clear explanations with practical examples
+3. Teach proper vocabulary, grammar, and pronunciation
+4. Encourage pure language usage without code-switching
+5. Correct mistakes gently with clear explanations
+6. Provide cultural context and usage notes
+7. Be encouraging and supportive
+
+When responding:
+- For vocabulary: provide meaning, part of speech, pronunciation, and usage examples
+- For grammar: explain structure, rules, and patterns with clear examples
+- For sentences: analyze grammar and suggest improvements
+- For translations: provide accurate translations with context
+- Be conversational, educational, and accurate
+- RESPOND IN THE LANGUAGE YOU ARE TEACHING unless translation is specifically requested
+
+STAY IN THE SELECTED LANGUAGE MODE. Do not mix languages or auto-translate unless the user specifically requests translation."""
+
+LANGUAGE_RULES = {
+    "English": "Respond ENTIRELY in English. Do NOT translate to other languages unless explicitly asked.",
+    "Kiswahili": "Respond ENTIRELY in Kiswahili. Use Swahili for explanations and examples.",
+    "Kikuyu": "Respond ENTIRELY in Kikuyu when possible, with English explanations when needed."
+}
+
+GIKUYU_RULES = """CRITICAL - ANTI-HALLUCINATION RULES FOR GĨKŨYŨ:
+You MUST follow these STRICT rules:
+
+1. NEVER EVER use Swahili words when teaching Gĩkũyũ - this is the #1 error to avoid:
+   - BANNED: "habari" → ONLY USE: "ũhoro" (news/how are you)
+   - BANNED: "mti" → ONLY USE: "mũtĩ" (tree - note the tilde ũ)
+   - BANNED: "kula" → ONLY USE: "kũrĩa" (to eat)
+   - BANNED: "asante" → ONLY USE: "nĩ wega" (thank you)
+   - BANNED: "watoto" → ONLY USE: "ciana" (children)
+   - BANNED: "chakula" → ONLY USE: "irĩo" (food)
+   - BANNED: "maji" → ONLY USE: "maaĩ" (water)
+   - BANNED: "kwenda" → ONLY USE: "gũthiĩ" (to go)
+   - BANNED: "kusoma" → ONLY USE: "gũthoma" (to read)
+   - BANNED: "nyumba" → ONLY USE: "nyũmba" (house - with tilde)
+
+2. ALWAYS use proper Gĩkũyũ diacritics - they are NOT optional:
+   - ũ, ĩ, ĩ are REQUIRED - never omit them
+   - Example: "mũndũ" NOT "mundu"
+   - Example: "mũtĩ" NOT "mti"
+
+3. ONLY use vocabulary from the verified knowledge base provided
+
+4. If you don't know a Gĩkũyũ word, say "I'm not certain of the exact Gĩkũyũ word" - DO NOT guess or use Swahili
+
+5. Before responding, ask yourself: "Does this word sound like Swahili?" If YES, find the Gĩkũyũ equivalent
+
+6. DOUBLE-CHECK every word - Swahili contamination is the most common error"""
+
+DICTIONARY_SECTIONS = {
+    "nouns": "Nouns",
+    "verbs": "Verbs",
+    "greetings_phrases": "Greetings/Phrases",
+    "numbers": "Numbers"
+}
+
+CONTEXT_SUFFIX = "Knowledge base context: {context}"
+
+
+def render_gikuyu_dictionary(dictionary: Dict[str, Dict[str, str]]) -> str:
+    """Verified Gĩkũyũ vocabulary as prompt text"""
+    text = "VERIFIED GĨKŨYŨ VOCABULARY (use ONLY these):\n"
+    for section, words in dictionary.items():
+        text += f"\n{DICTIONARY_SECTIONS.get(section, section.replace('_', ' ').title())}:\n"
+        for word, meaning in words.items():
+            text += f"- {word}: {meaning}\n"
+    return text.rstrip()
+
+
+def build_system_prompt(language: str, gikuyu_dictionary: Optional[Dict[str, Dict[str, str]]] = None) -> str:
+    """System prompt text for one language, without the context placeholder"""
+    rule = LANGUAGE_RULES.get(language, f"Respond ENTIRELY in {language}.")
+    parts = [
+        SHARED_PREFIX,
+        f"You are teaching {language}.\n\nCRITICAL - LANGUAGE RESPONSE RULES:\n- {rule}"
+    ]
+    if language == "Kikuyu":
+        parts.append(GIKUYU_RULES)
+        if gikuyu_dictionary:
+            parts.append(render_gikuyu_dictionary(gikuyu_dictionary))
+    return "\n\n".join(parts)
+
+
+def build_combined_prompt(language: str, gikuyu_dictionary: Optional[Dict[str, Dict[str, str]]] = None) -> str:
+    """The previous one-size-fits-all prompt: every language's rules plus the Gĩkũyũ block"""
+    rules = "\n".join(f"- If teaching {name.upper()}: {rule}" for name, rule in LANGUAGE_RULES.items())
+    parts = [SHARED_PREFIX, f"CRITICAL - LANGUAGE RESPONSE RULES:\n{rules}", GIKUYU_RULES]
+    if language == "Kikuyu" and gikuyu_dictionary:
+        parts.append(render_gikuyu_dictionary(gikuyu_dictionary))
+    return "\n\n".join(parts)
+
+
+def _escape_braces(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def compile_tutor_prompts(languages: Iterable[str],
+                          gikuyu_dictionary: Optional[Dict[str, Dict[str, str]]] = None,
+                          model: str = "gpt-4") -> Dict[str, Dict[str, Any]]:
+    """
+    Build each language's ChatPromptTemplate once, with its token counts
+    The template takes {context} and {input}; "version" changes whenever the prompt text does
+    """
+    prefix_tokens = count_tokens(SHARED_PREFIX, model)
+    prompts = {}
+    for language in languages:
+        system_prompt = build_system_prompt(language, gikuyu_dictionary)
+        template = ChatPromptTemplate.from_messages([
+            ("system", _escape_braces(system_prompt) + "\n\n" + CONTEXT_SUFFIX),
+            ("human", "{input}")
+        ])
+        prompts[language] = {
+            "template": template,
+            "system_prompt": system_prompt,
+            "version": hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()[:12],
+            "prefix_tokens": prefix_tokens,
+            "system_tokens": count_tokens(system_prompt, model),
+            "combined_tokens": count_tokens(build_combined_prompt(language, gikuyu_dictionary), model)
+        }
+    return prompts
+
+
+def print_token_report(prompts: Dict[str, Dict[str, Any]], model: str = "gpt-4") -> None:
+    print("=" * 60)
+    print("🧾 Tutor Prompt Token Report")
+    print("=" * 60)
+    if not is_exact(model):
+        print("⚠️  tiktoken encoding unavailable - counts are ~4 chars/token estimates")
+    print(f"{'Language':<12}{'Shared prefix':>15}{'Variant':>10}{'Before':>10}{'Saved':>10}")
+    for language, prompt in prompts.items():
+        saved = prompt["combined_tokens"] - prompt["system_tokens"]
+        print(f"{language:<12}{prompt['prefix_tokens']:>15}{prompt['system_tokens']:>10}"
+              f"{prompt['combined_tokens']:>10}{saved:>10}")
+    print("\n'Before' is the single prompt with every language's rules (plus the dictionary context for Kikuyu)")
+
+
+if __name__ == "__main__":
+    from language_config import GIKUYU_DICTIONARY, SUPPORTED_LANGUAGES
+
+    print_token_report(compile_tutor_prompts(SUPPORTED_LANGUAGES, GIKUYU_DICTIONARY))
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Quick Category vocabulary lists, generated once and kept in a persistent TTL cache
+Lists are keyed by (language, category, prompt version), so reruns and other learners
+read the stored list instead of paying for a new GPT-4 call
+
+Usage: python vocabulary_categories.py pregenerate [--languages Kikuyu Kiswahili] [--force]
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from single_flight import SingleFlight, prompt_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv("TUTOR_CACHE_DIR", ".tutor_cache")
+DEFAULT_TTL_SECONDS = float(os.getenv("CATEGORY_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
+# Category names are shown in the learner's language
+VOCABULARY_CATEGORIES = {
+    "Kikuyu": {
+        "Bamirii": "family members like mother, father, sister, brother",
+        "Irio": "common foods and meals",
+        "Nyamu": "common animals"
+    },
+    "Kiswahili": {
+        "Familia": "family members like mother, father, sister, brother",
+        "Vyakula": "common foods and meals",
+        "Wanyama": "common animals"
+    },
+    "English": {
+        "Family": "family members like mother, father, sister, brother",
+        "Food": "common foods and meals",
+        "Animals": "common animals"
+    }
+}
+
+
+def get_categories(language: str) -> Dict[str, str]:
+    return VOCABULARY_CATEGORIES.get(language, VOCABULARY_CATEGORIES["English"])
+
+
+def build_category_prompt(language: str, description: str) -> str:
+    return f"""List 10-15 common {description} in {language} with English translations.
+
+Format each entry as:
+- {language} word (English meaning)
+
+Example:
+- mtu (person)
+- nyumba (house)
+
+Provide clear, accurate translations."""
+
+
+def prompt_version(prompt: str) -> str:
+    """Changes whenever the prompt text does, so edited prompts are regenerated"""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]
+
+
+class CategoryCache:
+    """SQLite store of generated category lists with a time-to-live"""
+
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0}
+
+        if db_path is None:
+            db_path = os.path.join(DEFAULT_CACHE_DIR, "categories.sqlite3")
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._db = self._open(db_path)
+        except (OSError, sqlite3.Error) as e:
+            # Keep lists for this process only rather than failing the vocabulary page
+            logger.warning("Category cache %s unavailable (%s); using an in-memory cache", db_path, e)
+            self._db = self._open(":memory:")
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        db = sqlite3.connect(db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS category_lists ("
+            " language TEXT NOT NULL, category TEXT NOT NULL, prompt_version TEXT NOT NULL,"
+            " answer TEXT NOT NULL, created REAL NOT NULL,"
+            " PRIMARY KEY (language, category, prompt_version))"
+        )
+        db.commit()
+        return db
+
+    def get(self, language: str, category: str, version: str) -> Optional[str]:
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT answer, created FROM category_lists"
+                    " WHERE language = ? AND category = ? AND prompt_version = ?",
+                    (language, category, version)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Could not read the %s %s list: %s", language, category, e)
+                row = None
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            if time.time() - row[1] > self.ttl_seconds:
+                self._stats["expired"] += 1
+                return None
+            self._stats["hits"] += 1
+            return row[0]
+
+    def put(self, language: str, category: str, version: str, answer: str) -> None:
+        with self._lock:
+            try:
+                # Older prompt versions of the same list are dead weight
+                self._db.execute(
+                    "DELETE FROM category_lists WHERE language = ? AND category = ? AND prompt_version != ?",
+                    (language, category, version)
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO category_lists (language, category, prompt_version, answer, created)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (language, category, version, answer, time.time())
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                # e.g. "database is locked" with several app processes: the list is already
+                # paid for, so the caller still gets it; it is just not stored this time
+                logger.warning("Could not store the %s %s list: %s", language, category, e)
+                self._db.rollback()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = self._db.execute("SELECT COUNT(*) FROM category_lists").fetchone()[0]
+        return stats
+
+
+def get_category_list(cache: CategoryCache, llm_factory: Callable[[], Any], language: str,
+                      category: str, description: str, force: bool = False,
+                      single_flight: Optional[SingleFlight] = None) -> str:
+    """
+    The raw list for a category, generated only on a cache miss
+    llm_factory is only called when generation is needed; with single_flight, learners
+    opening the same uncached category at once share one generation
+    """
+    prompt = build_category_prompt(language, description)
+    version = prompt_version(prompt)
+    if not force:
+        answer = cache.get(language, category, version)
+        if answer is not None:
+            return answer
+
+    llm = llm_factory()
+    if single_flight is not None:
+        answer = single_flight.do(prompt_key(llm, prompt), lambda: llm.invoke(prompt)).content
+    else:
+        answer = llm.invoke(prompt).content
+    cache.put(language, category, version, answer)
+    return answer
+
+
+def pregenerate(cache: CategoryCache, llm_factory: Callable[[], Any],
+                languages: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, int]:
+    """Fill the cache for every category of every language"""
+    result = {"total": 0, "cached": 0, "generated": 0, "failed": 0}
+    for language in languages or VOCABULARY_CATEGORIES:
+        for category, description in get_categories(language).items():
+            result["total"] += 1
+            version = prompt_version(build_category_prompt(language, description))
+            if not force and cache.get(language, category, version) is not None:
+                result["cached"] += 1
+                continue
+            try:
+                get_category_list(cache, llm_factory, language, category, description, force=True)
+                result["generated"] += 1
+                print(f"✅ {language}: {category}")
+            except Exception as e:
+                result["failed"] += 1
+                print(f"❌ {language}: {category}: {e}")
+    return result
+
+
+def main():
+    from dotenv import load_dotenv
+
+    from llm_pool import LLMClientPool
+
+    parser = argparse.ArgumentParser(description="Vocabulary category cache tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    pregenerate_parser = subcommands.add_parser("pregenerate", help="Generate every category list for every language")
+    pregenerate_parser.add_argument("--languages", nargs="*", help="Languages to generate (default: all)")
+    pregenerate_parser.add_argument("--force", action="store_true", help="Regenerate lists that are still cached")
+    args = parser.parse_args()
+
+    load_dotenv(override=True)
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("❌ OPENAI_API_KEY is not set")
+        return
+
+    pool = LLMClientPool(api_key)
+    # Same model settings as the app's initialize_llm()
+    llm_factory = lambda: pool.get(model="gpt-4", temperature=0.0, max_tokens=500)
+
+    if args.command == "pregenerate":
+        cache = CategoryCache()
+        print("📚 Pre-generating vocabulary categories...")
+        result = pregenerate(cache, llm_factory, args.languages, args.force)
+        print(f"✅ {result['generated']} generated, {result['cached']} already cached, "
+              f"{result['failed']} failed (of {result['total']})")
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()